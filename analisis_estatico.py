@@ -0,0 +1,108 @@
+"""
+Simulador de Máquina de Turing
+Archivo: analisis_estatico.py
+Descripción: Análisis de la función de transición antes de ejecutar la máquina
+"""
+
+from typing import Dict, Optional, Set
+
+class AnalisisEstatico:
+    """
+    Propiedades de una máquina que se deducen solo de su función de
+    transición, sin ejecutarla.
+    
+    Atributos:
+        alcanzables: Estados alcanzables desde el estado inicial
+        condenados: Estados desde los que no se puede llegar a ningún estado
+            de aceptación; una ejecución que entra en ellos nunca acepta
+        solo_derecha: True si toda transición mueve a la derecha o entra en
+            un estado de aceptación, es decir, si el cabezal nunca retrocede
+        pasos_tras_entrada: Si solo_derecha, número máximo de pasos que se
+            ejecutan una vez leída la entrada (None si puede no terminar)
+    """
+    
+    def __init__(self, transiciones: Dict, estado_inicial: str,
+                 simbolo_blanco: str, estados_aceptacion: Set[str]):
+        """
+        Analiza la función de transición.
+        
+        Args:
+            transiciones: Función de transición
+            estado_inicial: Estado inicial
+            simbolo_blanco: Símbolo blanco
+            estados_aceptacion: Estados de aceptación
+        """
+        sucesores = {}
+        predecesores = {}
+        for (estado, _), (nuevo_estado, _, _) in transiciones.items():
+            sucesores.setdefault(estado, set()).add(nuevo_estado)
+            predecesores.setdefault(nuevo_estado, set()).add(estado)
+            
+        self.alcanzables = _cierre({estado_inicial}, sucesores)
+        todos = self.alcanzables | set(sucesores) | set(predecesores)
+        self.condenados = todos - _cierre(set(estados_aceptacion), predecesores)
+        
+        self.solo_derecha = all(
+            direccion == 'R' or nuevo_estado in estados_aceptacion
+            for nuevo_estado, _, direccion in transiciones.values()
+        )
+        self.pasos_tras_entrada = None
+        if self.solo_derecha:
+            self.pasos_tras_entrada = _pasos_sobre_blancos(
+                self.alcanzables - set(estados_aceptacion), transiciones,
+                simbolo_blanco, estados_aceptacion)
+                
+    def cota_pasos(self, longitud: int) -> Optional[int]:
+        """
+        Calcula una cota demostrada del número de pasos de una ejecución.
+        
+        Si el cabezal nunca retrocede, cada celda de la entrada se lee como
+        mucho una vez y después solo quedan blancos.
+        
+        Args:
+            longitud: Longitud de la cadena de entrada
+            
+        Returns:
+            Número máximo de pasos, o None si no hay cota demostrada
+        """
+        if self.pasos_tras_entrada is None:
+            return None
+        return longitud + self.pasos_tras_entrada
+
+def _cierre(iniciales: Set[str], aristas: Dict[str, Set[str]]) -> Set[str]:
+    """Estados alcanzables desde los iniciales siguiendo las aristas."""
+    visitados = set(iniciales)
+    pendientes = list(iniciales)
+    while pendientes:
+        for otro in aristas.get(pendientes.pop(), ()):
+            if otro not in visitados:
+                visitados.add(otro)
+                pendientes.append(otro)
+    return visitados
+
+def _pasos_sobre_blancos(estados: Set[str], transiciones: Dict, simbolo_blanco: str,
+                         estados_aceptacion: Set[str]) -> Optional[int]:
+    """
+    Calcula el máximo número de pasos que ejecuta una máquina que no
+    retrocede cuando, desde cualquiera de los estados dados, solo lee
+    blancos.
+    
+    Returns:
+        Número máximo de pasos, o None si desde algún estado la cadena de
+        transiciones sobre blanco entra en un ciclo
+    """
+    maximo = 0
+    for estado in estados:
+        pasos = 0
+        vistos = set()
+        while estado not in estados_aceptacion:
+            transicion = transiciones.get((estado, simbolo_blanco))
+            if transicion is None:
+                break
+            if estado in vistos:
+                return None
+            vistos.add(estado)
+            estado = transicion[0]
+            pasos += 1
+        maximo = max(maximo, pasos)
+    return maximo
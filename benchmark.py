@@ -0,0 +1,421 @@
+"""
+Simulador de Máquina de Turing
+Archivo: benchmark.py
+Descripción: Banco de pruebas de rendimiento de los motores y de las cintas
+
+Uso:
+    python benchmark.py --salida resultados.json
+    python benchmark.py --base base.json            (compara con la base)
+    python benchmark.py --guardar-base base.json    (guarda una nueva base)
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import random
+import statistics
+import sys
+import timeit
+import tracemalloc
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from cinta import Cinta, CintaCompacta
+from expresiones_regulares import ExpresionesRegulares
+from maquina_turing import MaquinaTuring
+
+# Longitudes de entrada medidas por defecto (--max-longitud las recorta)
+LONGITUDES = (10, 1000, 100000, 10000000)
+
+# Longitud máxima a la que se mide el bucle de paso(), que es mucho más lento
+LIMITE_PASO = 100000
+
+# Longitud máxima a la que se mide la cinta de diccionario (unos 100 bytes
+# por celda); las longitudes mayores solo se miden con CintaCompacta
+LIMITE_CINTA_DICCIONARIO = 1000000
+
+# Caída relativa de rendimiento que se considera una regresión
+TOLERANCIA = 0.2
+
+# Repeticiones de cada medida por defecto
+REPETICIONES = 5
+
+SEMILLA = 12345
+
+# Duración mínima de cada repetición de una medida (segundos)
+DURACION_MINIMA = 0.05
+
+# Duración total mínima de una medida para que una caída cuente como
+# regresión (segundos); por debajo, el ruido domina la comparación
+DURACION_COMPARABLE = 0.2
+
+def maquinas_sinteticas() -> List[Dict]:
+    """
+    Máquinas de estrés que escriben y mueven el cabezal en ambos sentidos.
+    
+    Returns:
+        Lista de configuraciones con el mismo formato que las del catálogo
+    """
+    barrido = {
+        'nombre': 'barrido',
+        'descripcion': 'Recorre la entrada hasta el final y vuelve al principio',
+        'estados': {'ida', 'vuelta', 'q_aceptar'},
+        'alfabeto_entrada': {'a', 'b'},
+        'alfabeto_cinta': {'a', 'b', '_'},
+        'transiciones': {
+            ('ida', 'a'): ('ida', 'a', 'R'),
+            ('ida', 'b'): ('ida', 'b', 'R'),
+            ('ida', '_'): ('vuelta', '_', 'L'),
+            ('vuelta', 'a'): ('vuelta', 'a', 'L'),
+            ('vuelta', 'b'): ('vuelta', 'b', 'L'),
+            ('vuelta', '_'): ('q_aceptar', '_', 'R'),
+        },
+        'estado_inicial': 'ida',
+        'simbolo_blanco': '_',
+        'estados_aceptacion': {'q_aceptar'}
+    }
+    escritor = {
+        'nombre': 'escritor',
+        'descripcion': 'Marca cada símbolo al ir y lo restaura al volver',
+        'estados': {'ida', 'vuelta', 'q_aceptar'},
+        'alfabeto_entrada': {'a', 'b'},
+        'alfabeto_cinta': {'a', 'b', 'A', 'B', '_'},
+        'transiciones': {
+            ('ida', 'a'): ('ida', 'A', 'R'),
+            ('ida', 'b'): ('ida', 'B', 'R'),
+            ('ida', '_'): ('vuelta', '_', 'L'),
+            ('vuelta', 'A'): ('vuelta', 'a', 'L'),
+            ('vuelta', 'B'): ('vuelta', 'b', 'L'),
+            ('vuelta', '_'): ('q_aceptar', '_', 'R'),
+        },
+        'estado_inicial': 'ida',
+        'simbolo_blanco': '_',
+        'estados_aceptacion': {'q_aceptar'}
+    }
+    # Castor afanoso de 4 estados y 2 símbolos: 107 pasos sobre la cinta vacía
+    tabla = {
+        ('A', '0'): ('B', '1', 'R'), ('A', '1'): ('B', '1', 'L'),
+        ('B', '0'): ('A', '1', 'L'), ('B', '1'): ('C', '0', 'L'),
+        ('C', '0'): ('H', '1', 'R'), ('C', '1'): ('D', '1', 'L'),
+        ('D', '0'): ('D', '1', 'R'), ('D', '1'): ('A', '0', 'R'),
+    }
+    castor = {
+        'nombre': 'castor_4',
+        'descripcion': 'Castor afanoso de 4 estados (solo usa la cinta vacía)',
+        'estados': {'A', 'B', 'C', 'D', 'H'},
+        'alfabeto_entrada': set(),
+        'alfabeto_cinta': {'0', '1'},
+        'transiciones': tabla,
+        'estado_inicial': 'A',
+        'simbolo_blanco': '0',
+        'estados_aceptacion': {'H'}
+    }
+    return [barrido, escritor, castor]
+
+def generar_entrada(config: Dict, longitud: int, rng: random.Random) -> str:
+    """
+    Genera una entrada que la máquina recorra entera si es posible.
+    
+    En las máquinas con forma de autómata se sigue un camino aleatorio por
+    transiciones que no terminan la ejecución; en las demás se eligen
+    símbolos al azar del alfabeto de entrada.
+    
+    Args:
+        config: Diccionario con la definición de la máquina
+        longitud: Longitud de la entrada
+        rng: Generador de números aleatorios
+        
+    Returns:
+        Cadena de entrada
+    """
+    alfabeto = sorted(config['alfabeto_entrada'])
+    if not alfabeto:
+        return ''
+    programa = MaquinaTuring.desde_configuracion(config).compilar()
+    if not programa.es_afd:
+        return ''.join(rng.choice(alfabeto) for _ in range(longitud))
+        
+    filas = programa.filas_afd
+    codigos = [programa.codigo_simbolo[s] for s in alfabeto]
+    
+    # Estados desde los que se puede seguir leyendo indefinidamente
+    vivos = set(range(len(programa.estados)))
+    cambios = True
+    while cambios:
+        vivos_antes = len(vivos)
+        vivos = {q for q in vivos if any(filas[q][c] in vivos for c in codigos)}
+        cambios = len(vivos) != vivos_antes
+        
+    q = 0
+    simbolos = []
+    for _ in range(longitud):
+        opciones = [s for s, c in zip(alfabeto, codigos) if filas[q][c] in vivos]
+        simbolo = rng.choice(opciones or alfabeto)
+        simbolos.append(simbolo)
+        if not opciones:
+            break
+        q = filas[q][programa.codigo_simbolo[simbolo]]
+    # Si el camino termina antes, el resto se rellena al azar
+    simbolos += [rng.choice(alfabeto) for _ in range(longitud - len(simbolos))]
+    return ''.join(simbolos)
+
+def _medir(funcion, repeticiones: int) -> Tuple[float, float, float]:
+    """
+    Mide el tiempo de una llamada a la función.
+    
+    Cada repetición encadena tantas llamadas como hagan falta para que dure
+    al menos DURACION_MINIMA segundos, de modo que las medidas cortas no
+    dependan de la resolución del reloj.
+    
+    Returns:
+        Tupla (tiempo por llamada de la repetición más rápida, tiempo por
+        llamada de la repetición mediana, segundos medidos en total)
+    """
+    temporizador = timeit.Timer(funcion)
+    llamadas = 1
+    while temporizador.timeit(llamadas) < DURACION_MINIMA:
+        llamadas *= 4
+    tiempos = temporizador.repeat(repeticiones, llamadas)
+    return min(tiempos) / llamadas, statistics.median(tiempos) / llamadas, sum(tiempos)
+
+def _ritmos(metrica: str, cantidad: int, tiempos: Tuple[float, float, float]) -> Dict:
+    """
+    Convierte una medida de _medir en ritmos por segundo.
+    
+    Returns:
+        Diccionario con el ritmo de la repetición más rápida (metrica), el
+        de la mediana (metrica_mediana) y los segundos medidos
+        (metrica_segundos)
+    """
+    mejor, mediana, total = tiempos
+    return {
+        metrica: cantidad / mejor if mejor else 0.0,
+        f'{metrica}_mediana': cantidad / mediana if mediana else 0.0,
+        f'{metrica}_segundos': total,
+    }
+
+def medir_motores(configs: List[Dict], longitudes: List[int],
+                  repeticiones: int) -> Iterator[Dict]:
+    """
+    Mide el bucle de paso() y ejecutar_completo con cada cinta sobre cada
+    máquina y longitud.
+    
+    Yields:
+        Un diccionario de resultados por máquina, motor y longitud
+    """
+    for config in configs:
+        maquinas = {clase: MaquinaTuring.desde_configuracion(config, clase_cinta=clase)
+                    for clase in (Cinta, CintaCompacta)}
+        for maquina in maquinas.values():
+            maquina.compilar()  # la compilación no forma parte de la medida
+        for longitud in longitudes:
+            entrada = generar_entrada(config, longitud, random.Random(SEMILLA))
+            limite = max(10 * longitud, 1000)
+            
+            def con_paso(maquina):
+                maquina.cargar_cadena(entrada)
+                while maquina.pasos_ejecutados < limite and maquina.paso():
+                    pass
+                    
+            def completo(maquina):
+                maquina.cargar_cadena(entrada)
+                maquina.ejecutar_completo(limite)
+                
+            motores = [('ejecutar_completo', completo, CintaCompacta)]
+            if longitud <= LIMITE_CINTA_DICCIONARIO:
+                motores.insert(0, ('ejecutar_completo', completo, Cinta))
+            if longitud <= LIMITE_PASO:
+                motores.insert(0, ('paso', con_paso, Cinta))
+            for motor, funcion, clase in motores:
+                maquina = maquinas[clase]
+                tiempos = _medir(lambda: funcion(maquina), repeticiones)
+                pasos = maquina.pasos_ejecutados
+                yield {
+                    'maquina': config['nombre'],
+                    'motor': motor,
+                    'cinta': clase.__name__,
+                    'longitud': longitud,
+                    'pasos': pasos,
+                    'segundos_por_entrada': tiempos[0],
+                    **_ritmos('pasos_por_segundo', pasos, tiempos),
+                }
+
+def medir_cintas(longitudes: List[int], repeticiones: int) -> Iterator[Dict]:
+    """
+    Mide lecturas, escrituras y memoria por celda de cada implementación
+    de la cinta.
+    
+    Yields:
+        Un diccionario de resultados por clase de cinta y longitud
+    """
+    for clase in (Cinta, CintaCompacta):
+        for longitud in longitudes:
+            if clase is Cinta and longitud > LIMITE_CINTA_DICCIONARIO:
+                continue
+            entrada = 'ab' * (longitud // 2) + 'a' * (longitud % 2)
+            
+            tracemalloc.start()
+            cinta = clase(entrada, '_')
+            _, pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            
+            posiciones = range(longitud)
+            
+            def leer():
+                lectura = cinta.leer
+                for i in posiciones:
+                    lectura(i)
+                    
+            def escribir():
+                escritura = cinta.escribir
+                for i in posiciones:
+                    escritura(i, 'b')
+                    
+            yield {
+                'cinta': clase.__name__,
+                'longitud': longitud,
+                'bytes_por_celda': pico / longitud,
+                **_ritmos('lecturas_por_segundo', longitud, _medir(leer, repeticiones)),
+                **_ritmos('escrituras_por_segundo', longitud, _medir(escribir, repeticiones)),
+            }
+
+def ejecutar_banco(max_longitud: int, repeticiones: int, informar=None) -> Dict:
+    """
+    Ejecuta todo el banco de pruebas.
+    
+    Args:
+        max_longitud: Longitud de entrada máxima a medir
+        repeticiones: Repeticiones de cada medida
+        informar: Función a la que se pasa cada resultado según se obtiene
+        
+    Returns:
+        Diccionario con los metadatos y todos los resultados
+    """
+    longitudes = [n for n in LONGITUDES if n <= max_longitud]
+    configs = ExpresionesRegulares.obtener_todas() + maquinas_sinteticas()
+    resultados = {
+        'meta': {
+            'fecha': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'semilla': SEMILLA,
+            'repeticiones': repeticiones,
+        },
+        'motores': [],
+        'cintas': [],
+    }
+    for clave, medidas in (('motores', medir_motores(configs, longitudes, repeticiones)),
+                           ('cintas', medir_cintas(longitudes, repeticiones))):
+        for medida in medidas:
+            resultados[clave].append(medida)
+            if informar:
+                informar(medida)
+    return resultados
+
+def _empeora(medida: Dict, anterior: Dict, metrica: str, tolerancia: float) -> bool:
+    """
+    Decide si una métrica ha caído de forma significativa respecto a la base.
+    
+    Tienen que caer más de la tolerancia tanto la repetición más rápida
+    como la mediana, y la medida actual tiene que haber durado al menos
+    DURACION_COMPARABLE segundos. Las bases sin mediana (de versiones
+    anteriores del banco) se comparan solo por la repetición más rápida.
+    """
+    if medida.get(f'{metrica}_segundos', 0.0) < DURACION_COMPARABLE:
+        return False
+    for clave in (metrica, f'{metrica}_mediana'):
+        if clave in anterior and (not anterior[clave]
+                                  or medida[clave] >= anterior[clave] * (1 - tolerancia)):
+            return False
+    return True
+
+def comparar(resultados: Dict, base: Dict, tolerancia: float = TOLERANCIA) -> List[str]:
+    """
+    Compara unos resultados con una base guardada.
+    
+    Una caída solo cuenta como regresión si la confirman la mejor
+    repetición y la mediana de una medida suficientemente larga (ver
+    _empeora), para que el ruido de una ejecución aislada no la dispare.
+    
+    Args:
+        resultados: Resultados actuales
+        base: Resultados de referencia
+        tolerancia: Caída relativa de rendimiento permitida
+        
+    Returns:
+        Lista con la descripción de cada regresión encontrada
+    """
+    regresiones = []
+    medidas = (('motores', ('maquina', 'motor', 'cinta', 'longitud'), ('pasos_por_segundo',)),
+               ('cintas', ('cinta', 'longitud'), ('lecturas_por_segundo', 'escrituras_por_segundo')))
+    for seccion, claves, metricas in medidas:
+        referencia = {tuple(m[c] for c in claves): m for m in base.get(seccion, [])}
+        for medida in resultados[seccion]:
+            anterior = referencia.get(tuple(medida[c] for c in claves))
+            if anterior is None:
+                continue
+            for metrica in metricas:
+                if _empeora(medida, anterior, metrica, tolerancia):
+                    nombre = ' '.join(str(medida[c]) for c in claves)
+                    regresiones.append(
+                        f"{nombre}: {metrica} {medida[metrica]:,.0f}, "
+                        f"mediana {medida[f'{metrica}_mediana']:,.0f} "
+                        f"(base {anterior[metrica]:,.0f})")
+    return regresiones
+
+def _informar(medida: Dict):
+    """Muestra un resultado en la salida de errores mientras avanza el banco."""
+    if 'motor' in medida:
+        texto = (f"{medida['maquina']:<16} {medida['motor']:<18} {medida['cinta']:<14} "
+                 f"n={medida['longitud']:<9} "
+                 f"{medida['pasos_por_segundo']:>14,.0f} pasos/s")
+    else:
+        texto = (f"{'(cinta)':<16} {'leer/escribir':<18} {medida['cinta']:<14} "
+                 f"n={medida['longitud']:<9} "
+                 f"{medida['bytes_por_celda']:>8.1f} B/celda")
+    print(texto, file=sys.stderr)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ejecuta el banco desde la línea de comandos.
+    
+    Returns:
+        0 si no hay regresiones, 1 en caso contrario
+    """
+    parser = argparse.ArgumentParser(description="Banco de pruebas de rendimiento")
+    parser.add_argument('--salida', help="Archivo JSON de resultados (por defecto, la salida estándar)")
+    parser.add_argument('--base', help="Archivo JSON de referencia con el que comparar")
+    parser.add_argument('--guardar-base', dest='guardar_base',
+                        help="Guarda los resultados como nueva referencia")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA,
+                        help="Caída relativa de rendimiento permitida (por defecto 0.2)")
+    parser.add_argument('--max-longitud', type=int, default=LONGITUDES[-1], dest='max_longitud',
+                        help="Longitud de entrada máxima a medir")
+    parser.add_argument('--repeticiones', type=int, default=REPETICIONES,
+                        help="Repeticiones de cada medida (se compara la mejor y la mediana)")
+    argumentos = parser.parse_args(argv)
+    
+    resultados = ejecutar_banco(argumentos.max_longitud, argumentos.repeticiones, _informar)
+    
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False)
+    if argumentos.salida:
+        with open(argumentos.salida, 'w', encoding='utf-8') as archivo:
+            archivo.write(texto)
+    else:
+        print(texto)
+    if argumentos.guardar_base:
+        with open(argumentos.guardar_base, 'w', encoding='utf-8') as archivo:
+            archivo.write(texto)
+            
+    if argumentos.base:
+        with open(argumentos.base, encoding='utf-8') as archivo:
+            regresiones = comparar(resultados, json.load(archivo), argumentos.tolerancia)
+        for regresion in regresiones:
+            print(f"✗ Regresión: {regresion}", file=sys.stderr)
+        if regresiones:
+            return 1
+        print("✓ Sin regresiones respecto a la base", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
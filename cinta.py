@@ -1,9 +1,17 @@
 """
 Simulador de Máquina de Turing
 Archivo: cinta.py
-Descripción: Clase que representa la cinta de la Máquina de Turing
+Descripción: Clases que representan la cinta de la Máquina de Turing
 """
 
+import mmap
+import os
+from typing import List
+
+# Celdas por página de CintaPaginada (potencia de dos)
+BITS_PAGINA = 12
+TAM_PAGINA = 1 << BITS_PAGINA
+
 class Cinta:
     """
     Representa la cinta infinita de la Máquina de Turing.
@@ -39,6 +47,21 @@ class Cinta:
             Símbolo en la posición especificada
         """
         return self.cinta.get(posicion, self.simbolo_blanco)
+        
+    def leer_rango(self, inicio: int, fin: int) -> List[str]:
+        """
+        Lee los símbolos de las posiciones [inicio, fin).
+        
+        Args:
+            inicio: Primera posición a leer
+            fin: Posición siguiente a la última a leer
+            
+        Returns:
+            Lista con los símbolos del rango
+        """
+        obtener = self.cinta.get
+        blanco = self.simbolo_blanco
+        return [obtener(i, blanco) for i in range(inicio, fin)]
     
     def escribir(self, posicion: int, simbolo: str):
         """
@@ -75,6 +98,26 @@ class Cinta:
             
         return contenido
     
+    def obtener_ventana(self, centro: int, radio: int, margen: int = 10) -> dict:
+        """
+        Obtiene solo las celdas visibles alrededor de una posición.
+        
+        La ventana se recorta a `margen` celdas más allá del contenido
+        escrito, igual que obtener_contenido, por lo que su coste depende
+        del radio y no del tamaño de la cinta.
+        
+        Args:
+            centro: Posición central de la ventana (normalmente el cabezal)
+            radio: Número de celdas a cada lado del centro
+            margen: Número de celdas a mostrar alrededor del contenido
+            
+        Returns:
+            Diccionario con posiciones y símbolos
+        """
+        inicio = max(centro - radio, self.posicion_inicio - margen)
+        fin = min(centro + radio, self.posicion_fin + margen) + 1
+        return dict(zip(range(inicio, fin), self.leer_rango(inicio, fin)))
+    
     def __str__(self) -> str:
         """
         Representación en cadena de la cinta.
@@ -89,4 +132,621 @@ class Cinta:
         for i in range(inicio, fin + 1):
             resultado.append(self.leer(i))
             
-        return ''.join(resultado)
\ No newline at end of file
+        return ''.join(resultado)
+
+
+class _CintaCodigos:
+    """
+    Parte común de las cintas que guardan cada celda como un código de un
+    byte (CintaCompacta, CintaMapeada y CintaPaginada).
+    
+    Cada subclase aporta su almacenamiento: leer, escribir, leer_codigos y
+    la secuencia `simbolos` con el símbolo de cada código. Las vistas de la
+    cinta se construyen aquí a partir de leer_codigos. Las subclases con
+    una tabla de códigos propia (la lista `simbolos` y el diccionario
+    `codigos`) la preparan con _iniciar_codigos y la amplían con _internar.
+    """
+    
+    def _iniciar_codigos(self, cadena_entrada: str, simbolo_blanco: str) -> bytearray:
+        """
+        Prepara la tabla de códigos y los límites de la cinta.
+        
+        Args:
+            cadena_entrada: Cadena inicial en la cinta
+            simbolo_blanco: Símbolo que representa una celda vacía (código 0)
+            
+        Returns:
+            Códigos de la cadena de entrada
+        """
+        self.simbolo_blanco = simbolo_blanco
+        self.simbolos = [simbolo_blanco]
+        self.codigos = {simbolo_blanco: 0}
+        
+        self.posicion_inicio = 0
+        self.posicion_fin = len(cadena_entrada) - 1 if cadena_entrada else 0
+        self._vacia = not cadena_entrada
+        
+        # Traducir la cadena a códigos de un byte de una sola vez
+        tabla = {ord(simbolo): self._internar(simbolo) for simbolo in set(cadena_entrada)}
+        return bytearray(cadena_entrada.translate(tabla), 'latin-1')
+        
+    def _internar(self, simbolo: str) -> int:
+        """
+        Obtiene el código de un símbolo, asignándole uno nuevo si no lo tiene.
+        
+        Args:
+            simbolo: Símbolo a internar
+            
+        Returns:
+            Código del símbolo
+        """
+        codigo = self.codigos.get(simbolo)
+        if codigo is None:
+            if len(self.simbolos) >= 256:
+                raise ValueError(
+                    f"{type(self).__name__} admite como máximo 256 símbolos distintos"
+                )
+            codigo = len(self.simbolos)
+            self.codigos[simbolo] = codigo
+            self.simbolos.append(simbolo)
+        return codigo
+        
+    def _traducir(self, codigos: bytes, simbolos) -> bytes:
+        """
+        Traduce códigos de otra tabla de símbolos a los de esta cinta.
+        
+        Args:
+            codigos: Códigos en la otra tabla
+            simbolos: Símbolo de cada código de la otra tabla
+            
+        Returns:
+            Los mismos símbolos como códigos de esta cinta
+        """
+        tabla = bytearray(256)
+        for codigo in set(codigos):
+            tabla[codigo] = self._internar(simbolos[codigo])
+        return codigos.translate(tabla)
+        
+    def leer_rango(self, inicio: int, fin: int) -> List[str]:
+        """
+        Lee los símbolos de las posiciones [inicio, fin).
+        
+        Args:
+            inicio: Primera posición a leer
+            fin: Posición siguiente a la última a leer
+            
+        Returns:
+            Lista con los símbolos del rango
+        """
+        return list(map(self.simbolos.__getitem__, self.leer_codigos(inicio, fin)))
+        
+    def obtener_contenido(self, rango: int = 10) -> dict:
+        """
+        Obtiene el contenido visible de la cinta.
+        
+        Args:
+            rango: Número de celdas a mostrar alrededor del contenido
+            
+        Returns:
+            Diccionario con posiciones y símbolos
+        """
+        inicio = self.posicion_inicio - rango
+        fin = self.posicion_fin + rango + 1
+        return dict(zip(range(inicio, fin), self.leer_rango(inicio, fin)))
+        
+    def obtener_ventana(self, centro: int, radio: int, margen: int = 10) -> dict:
+        """
+        Obtiene solo las celdas visibles alrededor de una posición.
+        
+        La ventana se recorta a `margen` celdas más allá del contenido
+        escrito, igual que obtener_contenido, por lo que su coste depende
+        del radio y no del tamaño de la cinta.
+        
+        Args:
+            centro: Posición central de la ventana (normalmente el cabezal)
+            radio: Número de celdas a cada lado del centro
+            margen: Número de celdas a mostrar alrededor del contenido
+            
+        Returns:
+            Diccionario con posiciones y símbolos
+        """
+        inicio = max(centro - radio, self.posicion_inicio - margen)
+        fin = min(centro + radio, self.posicion_fin + margen) + 1
+        return dict(zip(range(inicio, fin), self.leer_rango(inicio, fin)))
+        
+    def __str__(self) -> str:
+        """
+        Representación en cadena de la cinta.
+        """
+        if self._vacia:
+            return f"[{self.simbolo_blanco}]"
+            
+        return ''.join(self.leer_rango(self.posicion_inicio, self.posicion_fin + 1))
+
+class CintaCompacta(_CintaCodigos):
+    """
+    Cinta respaldada por un bytearray contiguo.
+    
+    Cada símbolo se interna como un código de un byte, por lo que admite
+    como máximo 256 símbolos distintos. La posición 0 de la cinta se
+    corresponde con el índice `origen` del arreglo, que crece en ambas
+    direcciones según sea necesario.
+    """
+    
+    def __init__(self, cadena_entrada: str, simbolo_blanco: str = '_'):
+        """
+        Inicializa la cinta con una cadena de entrada.
+        
+        Args:
+            cadena_entrada: Cadena inicial en la cinta
+            simbolo_blanco: Símbolo que representa una celda vacía
+        """
+        self.celdas = self._iniciar_codigos(cadena_entrada, simbolo_blanco)
+        self.origen = 0
+        
+    def leer(self, posicion: int) -> str:
+        """
+        Lee el símbolo en la posición especificada.
+        
+        Args:
+            posicion: Posición en la cinta
+            
+        Returns:
+            Símbolo en la posición especificada
+        """
+        i = posicion + self.origen
+        if 0 <= i < len(self.celdas):
+            return self.simbolos[self.celdas[i]]
+        return self.simbolo_blanco
+        
+    def escribir(self, posicion: int, simbolo: str):
+        """
+        Escribe un símbolo en la posición especificada.
+        
+        Args:
+            posicion: Posición en la cinta
+            simbolo: Símbolo a escribir
+        """
+        codigo = self._internar(simbolo)
+        i = posicion + self.origen
+        
+        # Ampliar el arreglo duplicando su tamaño hacia el lado necesario
+        if i < 0:
+            extra = max(len(self.celdas), 16, -i)
+            self.celdas[0:0] = bytes(extra)
+            self.origen += extra
+            i += extra
+        elif i >= len(self.celdas):
+            extra = max(len(self.celdas), 16, i - len(self.celdas) + 1)
+            self.celdas.extend(bytes(extra))
+            
+        self.celdas[i] = codigo
+        self._vacia = False
+        
+        # Actualizar los límites de la cinta
+        if posicion < self.posicion_inicio:
+            self.posicion_inicio = posicion
+        if posicion > self.posicion_fin:
+            self.posicion_fin = posicion
+            
+    def escribir_codigos(self, inicio: int, codigos: bytes, simbolos):
+        """
+        Escribe de una vez un rango de celdas dadas como códigos de otra
+        tabla de símbolos (por ejemplo, la de un programa compilado).
+        
+        Args:
+            inicio: Posición de la primera celda
+            codigos: Código de cada celda; codigos[j] va a la posición inicio + j
+            simbolos: Símbolo de cada código
+        """
+        if not codigos:
+            return
+        datos = self._traducir(codigos, simbolos)
+        
+        # Ampliar el arreglo como en escribir, lo necesario por cada lado
+        a = inicio + self.origen
+        if a < 0:
+            extra = max(len(self.celdas), 16, -a)
+            self.celdas[0:0] = bytes(extra)
+            self.origen += extra
+            a += extra
+        b = a + len(codigos)
+        if b > len(self.celdas):
+            extra = max(len(self.celdas), 16, b - len(self.celdas))
+            self.celdas.extend(bytes(extra))
+            
+        self.celdas[a:b] = datos
+        self._vacia = False
+        
+        # Actualizar los límites de la cinta
+        if inicio < self.posicion_inicio:
+            self.posicion_inicio = inicio
+        if inicio + len(codigos) - 1 > self.posicion_fin:
+            self.posicion_fin = inicio + len(codigos) - 1
+            
+    def leer_codigos(self, inicio: int, fin: int) -> bytes:
+        """
+        Lee los códigos de las posiciones [inicio, fin).
+        
+        Las posiciones fuera del arreglo se devuelven como blancos (código 0).
+        
+        Args:
+            inicio: Primera posición a leer
+            fin: Posición siguiente a la última a leer
+            
+        Returns:
+            Códigos de los símbolos del rango
+        """
+        a = inicio + self.origen
+        b = fin + self.origen
+        desde = min(max(a, 0), len(self.celdas))
+        hasta = max(min(b, len(self.celdas)), 0)
+        if desde >= hasta:
+            return bytes(max(b - a, 0))
+        return bytes(desde - a) + self.celdas[desde:hasta] + bytes(b - hasta)
+
+class CintaMapeada(_CintaCodigos):
+    """
+    Cinta cuyo contenido inicial es un archivo proyectado en memoria.
+    
+    El archivo se abre en solo lectura y cada byte es una celda (los bytes
+    se interpretan como latin-1, por lo que un archivo ASCII se lee tal
+    cual). El sistema operativo carga las páginas del archivo a medida que
+    el cabezal las recorre; las escrituras se guardan aparte, en un
+    diccionario con solo las celdas modificadas. La memoria usada crece con
+    las celdas tocadas y no con el tamaño del archivo.
+    
+    Como cada celda del archivo es un byte, la cinta solo admite símbolos
+    de un carácter latin-1, y el código de cada símbolo (ver leer_codigos)
+    es su byte.
+    """
+    
+    # simbolos[codigo] es el símbolo de cada código, como en CintaCompacta
+    simbolos = tuple(chr(codigo) for codigo in range(256))
+    
+    def __init__(self, ruta: str, simbolo_blanco: str = '_'):
+        """
+        Proyecta el archivo de entrada en memoria.
+        
+        Args:
+            ruta: Ruta del archivo con la cadena de entrada
+            simbolo_blanco: Símbolo que representa una celda vacía
+            
+        Raises:
+            ValueError: Si el símbolo blanco no es un carácter latin-1
+        """
+        self._codigo_blanco = self._codigo(simbolo_blanco)
+        self.simbolo_blanco = simbolo_blanco
+        self.ruta = ruta
+        self._archivo = open(ruta, 'rb')
+        self.longitud = os.fstat(self._archivo.fileno()).st_size
+        
+        # mmap no admite archivos vacíos
+        self._mapa = None
+        if self.longitud:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            
+        # Celdas escritas: tienen prioridad sobre el contenido del archivo
+        self.escritas = {}
+        
+        self.posicion_inicio = 0
+        self.posicion_fin = self.longitud - 1 if self.longitud else 0
+        
+        # Un archivo vacío se muestra como una celda en blanco, igual que
+        # cargar_cadena('')
+        self._vacia = False
+        
+    @staticmethod
+    def _codigo(simbolo: str) -> int:
+        """
+        Obtiene el byte que representa un símbolo en la cinta.
+        
+        Raises:
+            ValueError: Si el símbolo no es un carácter latin-1
+        """
+        if len(simbolo) != 1 or ord(simbolo) > 255:
+            raise ValueError(
+                f"La cinta proyectada solo admite símbolos de un carácter latin-1: {simbolo!r}"
+            )
+        return ord(simbolo)
+        
+    def leer(self, posicion: int) -> str:
+        """
+        Lee el símbolo en la posición especificada.
+        
+        Args:
+            posicion: Posición en la cinta
+            
+        Returns:
+            Símbolo en la posición especificada
+        """
+        simbolo = self.escritas.get(posicion)
+        if simbolo is not None:
+            return simbolo
+        if 0 <= posicion < self.longitud:
+            return chr(self._mapa[posicion])
+        return self.simbolo_blanco
+        
+    def leer_codigos(self, inicio: int, fin: int) -> bytes:
+        """
+        Lee los códigos de las posiciones [inicio, fin).
+        
+        Los bytes del rango se copian directamente de la proyección y solo
+        se superponen las celdas escritas.
+        
+        Args:
+            inicio: Primera posición a leer
+            fin: Posición siguiente a la última a leer
+            
+        Returns:
+            Códigos de los símbolos del rango
+        """
+        if fin <= inicio:
+            return b''
+        desde = min(max(inicio, 0), self.longitud)
+        hasta = max(min(fin, self.longitud), desde)
+        blanco = bytes((self._codigo_blanco,))
+        codigos = bytearray(blanco * (desde - inicio))
+        if desde < hasta:
+            codigos += self._mapa[desde:hasta]
+        codigos += blanco * (fin - inicio - len(codigos))
+        
+        # Superponer las celdas escritas del rango
+        escritas = self.escritas
+        if len(escritas) < fin - inicio:
+            for posicion, simbolo in escritas.items():
+                if inicio <= posicion < fin:
+                    codigos[posicion - inicio] = ord(simbolo)
+        else:
+            for posicion in range(inicio, fin):
+                simbolo = escritas.get(posicion)
+                if simbolo is not None:
+                    codigos[posicion - inicio] = ord(simbolo)
+        return bytes(codigos)
+        
+    def escribir(self, posicion: int, simbolo: str):
+        """
+        Escribe un símbolo en la posición especificada.
+        
+        El archivo no se modifica.
+        
+        Args:
+            posicion: Posición en la cinta
+            simbolo: Símbolo a escribir
+            
+        Raises:
+            ValueError: Si el símbolo no es un carácter latin-1
+        """
+        self._codigo(simbolo)
+        self.escritas[posicion] = simbolo
+        
+        # Actualizar los límites de la cinta
+        if posicion < self.posicion_inicio:
+            self.posicion_inicio = posicion
+        if posicion > self.posicion_fin:
+            self.posicion_fin = posicion
+            
+    def instantanea(self) -> 'CintaMapeada':
+        """
+        Obtiene una copia independiente de la cinta.
+        
+        La copia comparte la proyección del archivo y solo duplica las
+        celdas escritas; cerrar cualquiera de las dos cierra la proyección.
+        
+        Returns:
+            Cinta con el mismo contenido
+        """
+        copia = object.__new__(CintaMapeada)
+        copia.__dict__.update(self.__dict__)
+        copia.escritas = dict(self.escritas)
+        return copia
+        
+    def cerrar(self):
+        """Libera la proyección y cierra el archivo."""
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        self._archivo.close()
+        
+    def __enter__(self) -> 'CintaMapeada':
+        return self
+        
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+class _Pagina:
+    """Bloque de TAM_PAGINA códigos compartido entre cintas."""
+    
+    __slots__ = ('celdas', 'referencias')
+    
+    def __init__(self, celdas: bytearray):
+        self.celdas = celdas
+        self.referencias = 1
+        
+class _TablaPaginas:
+    """Tabla de páginas compartida entre una cinta y sus instantáneas."""
+    
+    __slots__ = ('paginas', 'referencias')
+    
+    def __init__(self, paginas: dict):
+        self.paginas = paginas
+        self.referencias = 1
+        
+class CintaPaginada(_CintaCodigos):
+    """
+    Cinta dividida en páginas de TAM_PAGINA celdas con copia en escritura.
+    
+    Las páginas y la tabla que las indexa llevan un contador de
+    referencias. Una instantánea comparte la tabla con la cinta original,
+    por lo que cuesta O(1); la primera escritura posterior copia la tabla
+    (una entrada por página) y solo la página que modifica. Las páginas no
+    escritas nunca se crean: son blancas. Como en CintaCompacta, cada
+    símbolo se guarda como un código de un byte (256 símbolos como máximo);
+    la tabla de códigos solo crece y es común a todas las instantáneas.
+    """
+    
+    def __init__(self, cadena_entrada: str, simbolo_blanco: str = '_'):
+        """
+        Inicializa la cinta con una cadena de entrada.
+        
+        Args:
+            cadena_entrada: Cadena inicial en la cinta
+            simbolo_blanco: Símbolo que representa una celda vacía
+        """
+        celdas = self._iniciar_codigos(cadena_entrada, simbolo_blanco)
+        paginas = {}
+        for inicio in range(0, len(celdas), TAM_PAGINA):
+            pagina = celdas[inicio:inicio + TAM_PAGINA]
+            pagina.extend(bytes(TAM_PAGINA - len(pagina)))
+            paginas[inicio >> BITS_PAGINA] = _Pagina(pagina)
+        self._tabla = _TablaPaginas(paginas)
+        
+    def __del__(self):
+        """Devuelve las referencias de la tabla y, si era la última, de sus páginas."""
+        tabla = getattr(self, '_tabla', None)
+        if tabla is None:
+            return
+        tabla.referencias -= 1
+        if tabla.referencias == 0:
+            for pagina in tabla.paginas.values():
+                pagina.referencias -= 1
+                
+    def instantanea(self) -> 'CintaPaginada':
+        """
+        Obtiene una copia independiente de la cinta en O(1).
+        
+        Las escrituras posteriores en cualquiera de las dos cintas no se ven
+        en la otra.
+        
+        Returns:
+            Cinta con el mismo contenido
+        """
+        copia = object.__new__(CintaPaginada)
+        copia.simbolo_blanco = self.simbolo_blanco
+        copia.simbolos = self.simbolos
+        copia.codigos = self.codigos
+        copia._tabla = self._tabla
+        self._tabla.referencias += 1
+        copia.posicion_inicio = self.posicion_inicio
+        copia.posicion_fin = self.posicion_fin
+        copia._vacia = self._vacia
+        return copia
+        
+    def leer(self, posicion: int) -> str:
+        """
+        Lee el símbolo en la posición especificada.
+        
+        Args:
+            posicion: Posición en la cinta
+            
+        Returns:
+            Símbolo en la posición especificada
+        """
+        pagina = self._tabla.paginas.get(posicion >> BITS_PAGINA)
+        if pagina is None:
+            return self.simbolo_blanco
+        return self.simbolos[pagina.celdas[posicion & (TAM_PAGINA - 1)]]
+        
+    def _pagina_propia(self, indice: int) -> _Pagina:
+        """
+        Obtiene una página que esta cinta puede modificar, copiando antes la
+        tabla y la página si están compartidas o creándola si no existe.
+        
+        Args:
+            indice: Número de la página
+            
+        Returns:
+            Página de la cinta
+        """
+        tabla = self._tabla
+        if tabla.referencias > 1:
+            # La tabla es de varias cintas: esta pasa a tener la suya
+            tabla.referencias -= 1
+            for pagina in tabla.paginas.values():
+                pagina.referencias += 1
+            tabla = self._tabla = _TablaPaginas(dict(tabla.paginas))
+            
+        pagina = tabla.paginas.get(indice)
+        if pagina is None:
+            pagina = tabla.paginas[indice] = _Pagina(bytearray(TAM_PAGINA))
+        elif pagina.referencias > 1:
+            pagina.referencias -= 1
+            pagina = tabla.paginas[indice] = _Pagina(bytearray(pagina.celdas))
+        return pagina
+        
+    def escribir(self, posicion: int, simbolo: str):
+        """
+        Escribe un símbolo en la posición especificada, copiando antes la
+        tabla y la página si están compartidas.
+        
+        Args:
+            posicion: Posición en la cinta
+            simbolo: Símbolo a escribir
+        """
+        codigo = self._internar(simbolo)
+        pagina = self._pagina_propia(posicion >> BITS_PAGINA)
+        pagina.celdas[posicion & (TAM_PAGINA - 1)] = codigo
+        self._vacia = False
+        
+        # Actualizar los límites de la cinta
+        if posicion < self.posicion_inicio:
+            self.posicion_inicio = posicion
+        if posicion > self.posicion_fin:
+            self.posicion_fin = posicion
+            
+    def escribir_codigos(self, inicio: int, codigos: bytes, simbolos):
+        """
+        Escribe de una vez un rango de celdas dadas como códigos de otra
+        tabla de símbolos (ver CintaCompacta.escribir_codigos).
+        
+        Args:
+            inicio: Posición de la primera celda
+            codigos: Código de cada celda; codigos[j] va a la posición inicio + j
+            simbolos: Símbolo de cada código
+        """
+        if not codigos:
+            return
+        datos = self._traducir(codigos, simbolos)
+        
+        # Copiar página a página
+        posicion = inicio
+        fin = inicio + len(datos)
+        while posicion < fin:
+            desplazamiento = posicion & (TAM_PAGINA - 1)
+            cantidad = min(TAM_PAGINA - desplazamiento, fin - posicion)
+            pagina = self._pagina_propia(posicion >> BITS_PAGINA)
+            j = posicion - inicio
+            pagina.celdas[desplazamiento:desplazamiento + cantidad] = datos[j:j + cantidad]
+            posicion += cantidad
+        self._vacia = False
+        
+        # Actualizar los límites de la cinta
+        if inicio < self.posicion_inicio:
+            self.posicion_inicio = inicio
+        if fin - 1 > self.posicion_fin:
+            self.posicion_fin = fin - 1
+            
+    def leer_codigos(self, inicio: int, fin: int) -> bytes:
+        """
+        Lee los códigos de las posiciones [inicio, fin).
+        
+        Args:
+            inicio: Primera posición a leer
+            fin: Posición siguiente a la última a leer
+            
+        Returns:
+            Códigos de los símbolos del rango
+        """
+        paginas = self._tabla.paginas
+        partes = []
+        posicion = inicio
+        while posicion < fin:
+            desplazamiento = posicion & (TAM_PAGINA - 1)
+            cantidad = min(TAM_PAGINA - desplazamiento, fin - posicion)
+            pagina = paginas.get(posicion >> BITS_PAGINA)
+            if pagina is None:
+                partes.append(bytes(cantidad))
+            else:
+                partes.append(pagina.celdas[desplazamiento:desplazamiento + cantidad])
+            posicion += cantidad
+        return b''.join(partes)
@@ -0,0 +1,330 @@
+"""
+Simulador de Máquina de Turing
+Archivo: compilador_regex.py
+Descripción: Compilación de expresiones regulares a Máquinas de Turing mínimas
+"""
+
+import copy
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+# Caracteres con significado especial en las expresiones
+OPERADORES = set('|*+?()')
+
+# Número de máquinas compiladas que se conservan en la caché
+TAM_CACHE = 128
+
+ESTADO_ACEPTACION = 'q_aceptar'
+SIMBOLO_BLANCO = '_'
+
+class _Analizador:
+    """
+    Analizador descendente recursivo de expresiones regulares.
+    
+    Gramática (de menor a mayor precedencia):
+        union         := concatenacion ('|' concatenacion)*
+        concatenacion := repeticion*
+        repeticion    := atomo ('*' | '+' | '?')*
+        atomo         := simbolo | '(' union ')'
+        
+    El resultado es un árbol de tuplas: ('simbolo', c), ('vacia',),
+    ('concatenacion', a, b), ('union', a, b), ('estrella', a), ('mas', a)
+    y ('opcional', a).
+    """
+    
+    def __init__(self, expresion: str):
+        """
+        Inicializa el analizador.
+        
+        Args:
+            expresion: Expresión regular normalizada
+        """
+        self.expresion = expresion
+        self.posicion = 0
+        
+    def analizar(self) -> tuple:
+        """Analiza la expresión completa."""
+        arbol = self._union()
+        if self.posicion < len(self.expresion):
+            raise ValueError(f"Paréntesis sin abrir en la posición {self.posicion}")
+        return arbol
+        
+    def _actual(self) -> str:
+        """Devuelve el carácter actual, o '' al final de la expresión."""
+        return self.expresion[self.posicion:self.posicion + 1]
+        
+    def _union(self) -> tuple:
+        """Analiza una unión de concatenaciones."""
+        arbol = self._concatenacion()
+        while self._actual() == '|':
+            self.posicion += 1
+            arbol = ('union', arbol, self._concatenacion())
+        return arbol
+        
+    def _concatenacion(self) -> tuple:
+        """Analiza una concatenación, que puede ser vacía."""
+        arbol = ('vacia',)
+        while self._actual() not in ('', '|', ')'):
+            factor = self._repeticion()
+            arbol = factor if arbol == ('vacia',) else ('concatenacion', arbol, factor)
+        return arbol
+        
+    def _repeticion(self) -> tuple:
+        """Analiza un átomo seguido de operadores de repetición."""
+        arbol = self._atomo()
+        operaciones = {'*': 'estrella', '+': 'mas', '?': 'opcional'}
+        while self._actual() in operaciones:
+            arbol = (operaciones[self._actual()], arbol)
+            self.posicion += 1
+        return arbol
+        
+    def _atomo(self) -> tuple:
+        """Analiza un símbolo o una expresión entre paréntesis."""
+        caracter = self._actual()
+        if caracter == '(':
+            self.posicion += 1
+            arbol = self._union()
+            if self._actual() != ')':
+                raise ValueError(f"Falta ')' en la posición {self.posicion}")
+            self.posicion += 1
+            return arbol
+        if caracter in OPERADORES:
+            raise ValueError(f"Operador '{caracter}' inesperado en la posición {self.posicion}")
+        self.posicion += 1
+        return ('simbolo', caracter)
+
+class _AFN:
+    """
+    Autómata finito no determinista construido con el método de Thompson.
+    
+    Cada estado tiene como mucho una transición con símbolo o dos
+    transiciones vacías.
+    """
+    
+    def __init__(self):
+        """Crea un autómata sin estados."""
+        self.vacias: List[List[int]] = []
+        self.simbolo: List[Tuple[str, int]] = []
+        
+    def _nuevo_estado(self) -> int:
+        """Añade un estado sin transiciones y devuelve su número."""
+        self.vacias.append([])
+        self.simbolo.append(None)
+        return len(self.vacias) - 1
+        
+    def construir(self, arbol: tuple) -> Tuple[int, int]:
+        """
+        Construye el fragmento de un árbol de la expresión.
+        
+        Returns:
+            Tupla (estado inicial, estado final) del fragmento
+        """
+        tipo = arbol[0]
+        if tipo in ('simbolo', 'vacia'):
+            inicio, fin = self._nuevo_estado(), self._nuevo_estado()
+            if tipo == 'simbolo':
+                self.simbolo[inicio] = (arbol[1], fin)
+            else:
+                self.vacias[inicio].append(fin)
+            return inicio, fin
+            
+        if tipo == 'concatenacion':
+            inicio, medio = self.construir(arbol[1])
+            otro, fin = self.construir(arbol[2])
+            self.vacias[medio].append(otro)
+            return inicio, fin
+            
+        inicio, fin = self._nuevo_estado(), self._nuevo_estado()
+        for rama in arbol[1:]:
+            a, b = self.construir(rama)
+            self.vacias[inicio].append(a)
+            self.vacias[b].append(fin)
+            if tipo in ('estrella', 'mas'):
+                self.vacias[b].append(a)
+        if tipo in ('estrella', 'opcional'):
+            self.vacias[inicio].append(fin)
+        return inicio, fin
+        
+    def clausura(self, estados: Set[int]) -> FrozenSet[int]:
+        """Calcula la clausura vacía de un conjunto de estados."""
+        pendientes = list(estados)
+        clausura = set(estados)
+        while pendientes:
+            for otro in self.vacias[pendientes.pop()]:
+                if otro not in clausura:
+                    clausura.add(otro)
+                    pendientes.append(otro)
+        return frozenset(clausura)
+
+def _determinizar(afn: _AFN, inicio: int, final: int,
+                  alfabeto: List[str]) -> Tuple[List[List[int]], List[bool]]:
+    """
+    Construcción de subconjuntos.
+    
+    Returns:
+        Tupla (tabla de transiciones completa, estados de aceptación) del
+        autómata determinista; el estado 0 es el inicial y el conjunto
+        vacío es un estado más (el estado muerto)
+    """
+    inicial = afn.clausura({inicio})
+    codigos = {inicial: 0}
+    conjuntos = [inicial]
+    tabla = []
+    i = 0
+    while i < len(conjuntos):
+        fila = []
+        for simbolo in alfabeto:
+            destino = afn.clausura({afn.simbolo[q][1] for q in conjuntos[i]
+                                    if afn.simbolo[q] and afn.simbolo[q][0] == simbolo})
+            if destino not in codigos:
+                codigos[destino] = len(conjuntos)
+                conjuntos.append(destino)
+            fila.append(codigos[destino])
+        tabla.append(fila)
+        i += 1
+    return tabla, [final in conjunto for conjunto in conjuntos]
+
+def _minimizar(tabla: List[List[int]], aceptacion: List[bool]) -> List[int]:
+    """
+    Algoritmo de Hopcroft.
+    
+    Returns:
+        Lista que asigna a cada estado el índice de su clase de equivalencia
+    """
+    num_estados = len(tabla)
+    num_simbolos = len(tabla[0]) if tabla else 0
+    inversa = [[[] for _ in range(num_estados)] for _ in range(num_simbolos)]
+    for q, fila in enumerate(tabla):
+        for s, destino in enumerate(fila):
+            inversa[s][destino].append(q)
+            
+    particion = [bloque for bloque in (
+        {q for q in range(num_estados) if aceptacion[q]},
+        {q for q in range(num_estados) if not aceptacion[q]}) if bloque]
+    pendientes = [min(particion, key=len)] if len(particion) == 2 else []
+    
+    while pendientes:
+        divisor = pendientes.pop()
+        for s in range(num_simbolos):
+            previos = {p for q in divisor for p in inversa[s][q]}
+            if not previos:
+                continue
+            nueva = []
+            for bloque in particion:
+                dentro = bloque & previos
+                fuera = bloque - previos
+                if dentro and fuera:
+                    nueva += [dentro, fuera]
+                    if bloque in pendientes:
+                        pendientes.remove(bloque)
+                        pendientes += [dentro, fuera]
+                    else:
+                        pendientes.append(min(dentro, fuera, key=len))
+                else:
+                    nueva.append(bloque)
+            particion = nueva
+            
+    clase = [0] * num_estados
+    for i, bloque in enumerate(particion):
+        for q in bloque:
+            clase[q] = i
+    return clase
+
+def normalizar(expresion: str) -> str:
+    """
+    Normaliza una expresión regular eliminando los espacios en blanco.
+    
+    Args:
+        expresion: Expresión regular
+        
+    Returns:
+        Expresión normalizada, que se usa como clave de la caché
+    """
+    return ''.join(expresion.split())
+
+@lru_cache(maxsize=TAM_CACHE)
+def _compilar(expresion: str) -> Dict:
+    """Compila una expresión ya normalizada (el resultado no debe modificarse)."""
+    if SIMBOLO_BLANCO in expresion:
+        raise ValueError(f"El símbolo blanco '{SIMBOLO_BLANCO}' no puede aparecer en la expresión")
+    arbol = _Analizador(expresion).analizar()
+    afn = _AFN()
+    inicio, final = afn.construir(arbol)
+    alfabeto = sorted(set(expresion) - OPERADORES)
+    tabla, aceptacion = _determinizar(afn, inicio, final, alfabeto)
+    clase = _minimizar(tabla, aceptacion)
+    
+    # Las clases desde las que no se puede aceptar forman el estado muerto
+    vivas = {clase[q] for q in range(len(tabla)) if aceptacion[q]}
+    cambios = True
+    while cambios:
+        cambios = False
+        for q, fila in enumerate(tabla):
+            if clase[q] not in vivas and any(clase[d] in vivas for d in fila):
+                vivas.add(clase[q])
+                cambios = True
+                
+    # Numerar los estados en el orden en que se alcanzan desde el inicial
+    nombres = {}
+    pendientes = [0]
+    representantes = []
+    while pendientes:
+        q = pendientes.pop(0)
+        if clase[q] in nombres or clase[q] not in vivas:
+            continue
+        nombres[clase[q]] = f'q{len(nombres)}'
+        representantes.append(q)
+        pendientes += tabla[q]
+        
+    transiciones = {}
+    estados_finales = set()
+    for q in representantes:
+        nombre = nombres[clase[q]]
+        for simbolo, destino in zip(alfabeto, tabla[q]):
+            if clase[destino] in nombres:
+                transiciones[(nombre, simbolo)] = (nombres[clase[destino]], simbolo, 'R')
+        if aceptacion[q]:
+            transiciones[(nombre, SIMBOLO_BLANCO)] = (ESTADO_ACEPTACION, SIMBOLO_BLANCO, 'S')
+            estados_finales.add(nombre)
+            
+    # Sin estados vivos la expresión no acepta nada: queda solo el inicial
+    estados = set(nombres.values()) or {'q0'}
+    return {
+        'nombre': expresion,
+        'descripcion': f'Generada a partir de la expresión regular "{expresion}"',
+        'estados': estados | {ESTADO_ACEPTACION},
+        'alfabeto_entrada': set(alfabeto),
+        'alfabeto_cinta': set(alfabeto) | {SIMBOLO_BLANCO},
+        'transiciones': transiciones,
+        'estado_inicial': 'q0',
+        'simbolo_blanco': SIMBOLO_BLANCO,
+        'estados_aceptacion': {ESTADO_ACEPTACION}
+    }
+
+def compilar_regex(expresion: str) -> Dict:
+    """
+    Compila una expresión regular a una Máquina de Turing mínima.
+    
+    La expresión se convierte en un autómata no determinista (Thompson),
+    se determiniza (construcción de subconjuntos) y se minimiza (Hopcroft).
+    La máquina resultante lee la cadena de izquierda a derecha y acepta al
+    llegar al blanco final desde un estado de aceptación del autómata.
+    
+    Operadores: '|' (unión), '*' (cero o más), '+' (una o más), '?' (cero o
+    una) y paréntesis; cualquier otro carácter es un símbolo. Los espacios
+    se ignoran.
+    
+    Las máquinas compiladas se guardan en una caché LRU indexada por la
+    expresión normalizada; cada llamada devuelve una copia independiente.
+    
+    Args:
+        expresion: Expresión regular, por ejemplo '(a|b)*abb'
+        
+    Returns:
+        Diccionario con la definición de la máquina, con el mismo formato
+        que las de ExpresionesRegulares
+        
+    Raises:
+        ValueError: Si la expresión no es válida
+    """
+    return copy.deepcopy(_compilar(normalizar(expresion)))
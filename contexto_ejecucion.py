@@ -0,0 +1,79 @@
+"""
+Simulador de Máquina de Turing
+Archivo: contexto_ejecucion.py
+Descripción: Estado ligero de una ejecución sobre un programa compartido
+"""
+
+from typing import Optional
+
+from cinta import CintaCompacta
+from programa_compilado import ProgramaCompilado
+
+class ContextoEjecucion:
+    """
+    Estado de una ejecución: cabezal, estado actual, pasos y cinta.
+    
+    La definición de la máquina vive en un ProgramaCompilado inmutable que
+    comparten todas las ejecuciones; cada contexto solo guarda lo que
+    cambia durante la suya. Los programas con forma de autómata no
+    necesitan cinta: se recorren directamente sobre la cadena de entrada.
+    """
+    
+    __slots__ = ('programa', 'cadena', 'cinta', 'estado', 'posicion', 'pasos', 'aceptada')
+    
+    def __init__(self, programa: ProgramaCompilado, cadena: str):
+        """
+        Prepara una ejecución desde el estado inicial.
+        
+        Args:
+            programa: Programa compilado (debe ser compacto)
+            cadena: Cadena de entrada
+            
+        Raises:
+            ValueError: Si el programa no es compacto
+        """
+        if not programa.compacto:
+            raise ValueError("El programa tiene demasiados símbolos para un contexto ligero")
+        self.programa = programa
+        self.cadena = cadena
+        self.cinta = None
+        self.estado = programa.estados[0]
+        self.posicion = 0
+        self.pasos = 0
+        self.aceptada = None
+        
+    def ejecutar(self, max_pasos: Optional[int] = None) -> Optional[bool]:
+        """
+        Continúa la ejecución hasta que termine o se alcancen max_pasos
+        pasos en total.
+        
+        Args:
+            max_pasos: Máximo número de pasos acumulados; por defecto, la
+                cota demostrada por el análisis estático si la hay, o 1000
+            
+        Returns:
+            True si la cadena fue aceptada, False si fue rechazada, o None si
+            la ejecución no ha terminado
+        """
+        if self.aceptada is not None:
+            return self.aceptada
+            
+        programa = self.programa
+        max_pasos = programa.limite_pasos(len(self.cadena), max_pasos)
+        if programa.es_afd:
+            (self.estado, self.posicion, self.pasos,
+             self.aceptada, _) = programa.recorrer_afd(
+                self.cadena, self.estado, self.posicion, self.pasos, max_pasos)
+        else:
+            if self.cinta is None:
+                blanco = programa.simbolos[0]
+                self.cinta = CintaCompacta(self.cadena or blanco, blanco)
+            (self.estado, self.posicion, self.pasos,
+             self.aceptada) = programa.ejecutar(
+                self.cinta, self.estado, self.posicion, self.pasos, max_pasos)
+        return self.aceptada
+        
+    @property
+    def terminada(self) -> bool:
+        """True si la ejecución ha terminado."""
+        return self.aceptada is not None
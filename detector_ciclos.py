@@ -0,0 +1,176 @@
+"""
+Simulador de Máquina de Turing
+Archivo: detector_ciclos.py
+Descripción: Detección de ejecuciones que no terminan
+"""
+
+from typing import Dict, Set, Tuple
+
+# Número de pasos que se ejecutan entre dos comprobaciones del detector.
+# Es primo para que las comprobaciones no caigan siempre en la misma fase
+# de una ejecución periódica
+PASOS_POR_COMPROBACION = 127
+
+# Pasos simulados por estado al buscar derivas sobre la cinta en blanco
+LIMITE_DERIVA = 1000
+
+def estados_deriva(transiciones: Dict, simbolo_blanco: str,
+                   estados_aceptacion: Set[str], direccion: str) -> Set[str]:
+    """
+    Calcula los estados desde los que la máquina avanza para siempre sobre
+    la cinta en blanco en una dirección.
+    
+    Para cada estado se simula la máquina sobre una cinta vacía empezando
+    en la posición 0. Si vuelve al mismo estado en una celda nueva más
+    avanzada que todas las visitadas, sin haber retrocedido nunca más allá
+    de la posición inicial, la misma secuencia se repetirá indefinidamente:
+    el contenido que queda detrás no se vuelve a leer.
+    
+    Args:
+        transiciones: Función de transición
+        simbolo_blanco: Símbolo blanco
+        estados_aceptacion: Estados de aceptación
+        direccion: 'L' o 'R'
+        
+    Returns:
+        Conjunto de estados que derivan indefinidamente
+    """
+    sentido = 1 if direccion == 'R' else -1
+    estados = {estado for estado, _ in transiciones}
+    deriva = set()
+    
+    for inicial in estados:
+        estado = inicial
+        cinta = {}
+        posicion = 0
+        mas_lejana = -1  # celda más avanzada visitada (en el sentido de la deriva)
+        
+        for _ in range(LIMITE_DERIVA):
+            transicion = transiciones.get((estado, cinta.get(posicion, simbolo_blanco)))
+            if transicion is None:
+                break
+            estado, simbolo, movimiento = transicion
+            if estado in estados_aceptacion:
+                break
+            cinta[posicion] = simbolo
+            mas_lejana = max(mas_lejana, posicion * sentido)
+            if movimiento == 'R':
+                posicion += 1
+            elif movimiento == 'L':
+                posicion -= 1
+                
+            # Retroceder más allá del inicio podría leer contenido real
+            if posicion * sentido < 0:
+                break
+            if estado == inicial and posicion * sentido > mas_lejana:
+                deriva.add(inicial)
+                break
+                
+    return deriva
+    
+class DetectorCiclos:
+    """
+    Detecta configuraciones repetidas con el algoritmo de Brent.
+    
+    Una configuración es la terna (estado, posición del cabezal, contenido
+    de la cinta). Solo se guarda una configuración de referencia, por lo que
+    la memoria usada no depende de la longitud de la ejecución. Las
+    configuraciones se comparan cada PASOS_POR_COMPROBACION pasos: si la
+    ejecución es periódica, la secuencia muestreada también lo es y la
+    repetición se detecta igualmente.
+    """
+    
+    def __init__(self, maquina):
+        """
+        Inicializa el detector con la configuración actual de la máquina.
+        
+        Args:
+            maquina: Máquina de Turing a vigilar
+        """
+        self.maquina = maquina
+        self.deriva_derecha = estados_deriva(maquina.transiciones, maquina.simbolo_blanco,
+                                             maquina.estados_aceptacion, 'R')
+        self.deriva_izquierda = estados_deriva(maquina.transiciones, maquina.simbolo_blanco,
+                                               maquina.estados_aceptacion, 'L')
+        self.potencia = 1
+        self.longitud = 0
+        self._guardar()
+        
+    def _guardar(self):
+        """Toma la configuración actual como referencia."""
+        self.estado_guardado = self.maquina.estado_actual
+        self.cabezal_guardado = self.maquina.posicion_cabezal
+        self.cinta_guardada = self._contenido_cinta()
+        
+    def _contenido_cinta(self) -> Tuple[int, tuple]:
+        """
+        Obtiene el contenido de la cinta sin los blancos de los extremos.
+        
+        Returns:
+            Tupla (posición del primer símbolo, símbolos)
+        """
+        cinta = self.maquina.cinta
+        simbolos = cinta.leer_rango(cinta.posicion_inicio, cinta.posicion_fin + 1)
+        blanco = self.maquina.simbolo_blanco
+        inicio = 0
+        fin = len(simbolos)
+        while inicio < fin and simbolos[inicio] == blanco:
+            inicio += 1
+        while fin > inicio and simbolos[fin - 1] == blanco:
+            fin -= 1
+        return cinta.posicion_inicio + inicio, tuple(simbolos[inicio:fin])
+        
+    def _deriva(self) -> bool:
+        """Comprueba si el cabezal avanza para siempre sobre blancos."""
+        maquina = self.maquina
+        if maquina.posicion_cabezal > maquina.cinta.posicion_fin:
+            return maquina.estado_actual in self.deriva_derecha
+        if maquina.posicion_cabezal < maquina.cinta.posicion_inicio:
+            return maquina.estado_actual in self.deriva_izquierda
+        return False
+        
+    def comprobar(self) -> bool:
+        """
+        Registra la configuración actual y comprueba si se ha demostrado un ciclo.
+        
+        Returns:
+            True si la ejecución no puede terminar
+        """
+        maquina = self.maquina
+        if self._deriva():
+            return True
+            
+        # Comparar primero estado y cabezal; la cinta solo si coinciden
+        if (maquina.estado_actual == self.estado_guardado
+                and maquina.posicion_cabezal == self.cabezal_guardado
+                and self._contenido_cinta() == self.cinta_guardada):
+            return True
+            
+        self.longitud += 1
+        if self.longitud == self.potencia:
+            self._guardar()
+            self.potencia *= 2
+            self.longitud = 0
+        return False
+        
+    def ejecutar(self, max_pasos: int) -> bool:
+        """
+        Ejecuta la máquina hasta que termine, alcance el máximo de pasos o
+        se demuestre que no termina.
+        
+        Args:
+            max_pasos: Máximo número de pasos permitidos
+            
+        Returns:
+            True si se detectó un ciclo
+        """
+        maquina = self.maquina
+        while maquina.pasos_ejecutados < max_pasos:
+            if self._deriva():
+                return True
+            lote = min(PASOS_POR_COMPROBACION, max_pasos - maquina.pasos_ejecutados)
+            if not maquina.ejecutar_lote(lote):
+                return False
+            if self.comprobar():
+                return True
+        return False
@@ -0,0 +1,142 @@
+"""
+Simulador de Máquina de Turing
+Archivo: ejecucion_asincrona.py
+Descripción: Ejecución de máquinas desde asyncio por tramos, sin bloquear el bucle de eventos
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterator, Dict, Optional
+
+# Pasos que se ejecutan entre dos cesiones de control al bucle de eventos
+PASOS_POR_TRAMO = 10000
+
+def _tramo_en_proceso(maquina, num_pasos: int) -> dict:
+    """
+    Ejecuta un tramo sobre una copia de la máquina en otro proceso.
+    
+    Returns:
+        Captura de la máquina al terminar el tramo; la copia se descarta
+        después, así que la captura se queda con sus cintas sin copiarlas
+    """
+    maquina.ejecutar_lote(num_pasos)
+    return maquina.capturar(copiar=False)
+
+async def _ejecutar_tramo(maquina, num_pasos: int, ejecutor: Optional[Executor]):
+    """
+    Ejecuta un tramo de pasos, en el propio bucle o en el ejecutor.
+    
+    Con un ejecutor de hilos la máquina se modifica directamente desde el
+    hilo; con uno de procesos se envía una copia y se restaura la captura
+    que devuelve, que ya es una copia propia y no se vuelve a copiar. Si la tarea se cancela mientras el tramo está en el
+    ejecutor, se espera a que termine (no se puede interrumpir) para que la
+    máquina quede en un estado coherente.
+    """
+    if ejecutor is None:
+        maquina.ejecutar_lote(num_pasos)
+        await asyncio.sleep(0)
+        return
+        
+    bucle = asyncio.get_running_loop()
+    en_proceso = isinstance(ejecutor, ProcessPoolExecutor)
+    if en_proceso:
+        futuro = bucle.run_in_executor(ejecutor, _tramo_en_proceso, maquina, num_pasos)
+    else:
+        futuro = bucle.run_in_executor(ejecutor, maquina.ejecutar_lote, num_pasos)
+        
+    try:
+        await asyncio.shield(futuro)
+    except asyncio.CancelledError:
+        await asyncio.wait({futuro})
+        raise
+        
+    if en_proceso:
+        maquina.restaurar(futuro.result(), copiar=False)
+
+def _evento(maquina, terminada: bool) -> Dict:
+    """Evento de progreso con la situación actual de la máquina."""
+    return {
+        'pasos': maquina.pasos_ejecutados,
+        'estado': maquina.estado_actual,
+        'aceptada': maquina.cadena_aceptada,
+        'veredicto': maquina.veredicto,
+        'terminada': terminada
+    }
+
+async def progreso(maquina, max_pasos: Optional[int] = None,
+                   pasos_por_tramo: int = PASOS_POR_TRAMO,
+                   ejecutor: Optional[Executor] = None) -> AsyncIterator[Dict]:
+    """
+    Ejecuta la máquina por tramos y emite un evento tras cada uno.
+    
+    Entre dos tramos se cede el control al bucle de eventos, de modo que
+    muchas simulaciones pueden compartir un mismo bucle y cancelarse (o
+    agotar su tiempo con asyncio.wait_for) entre tramos. La máquina queda
+    siempre en un estado válido y se puede seguir ejecutando después.
+    
+    Args:
+        maquina: Máquina con la cadena ya cargada (MaquinaTuring o
+            MaquinaMulticinta)
+        max_pasos: Máximo número de pasos; por defecto, la cota demostrada
+            por el análisis estático si la hay, o 1000
+        pasos_por_tramo: Pasos entre dos cesiones de control
+        ejecutor: Ejecutor de hilos o de procesos al que enviar cada tramo;
+            por defecto, los tramos se ejecutan en el propio bucle
+            
+    Yields:
+        Diccionarios con 'pasos', 'estado', 'aceptada', 'veredicto' y
+        'terminada'; el último tiene 'terminada' a True
+        
+    Raises:
+        ValueError: Si se usa un ejecutor de procesos con el perfilado o el
+            historial activos (sus datos se quedarían en el otro proceso)
+    """
+    if isinstance(ejecutor, ProcessPoolExecutor) and (
+            getattr(maquina, 'perfilador', None) is not None
+            or getattr(maquina, 'historial', None) is not None):
+        raise ValueError("El perfilado y el historial no admiten un ejecutor de procesos")
+        
+    if max_pasos is None:
+        cota_pasos = getattr(maquina, 'cota_pasos', None)
+        max_pasos = (cota_pasos() if cota_pasos else None) or 1000
+        
+    while maquina.cadena_aceptada is None and maquina.pasos_ejecutados < max_pasos:
+        tramo = min(pasos_por_tramo, max_pasos - maquina.pasos_ejecutados)
+        await _ejecutar_tramo(maquina, tramo, ejecutor)
+        if maquina.cadena_aceptada is None and maquina.pasos_ejecutados < max_pasos:
+            yield _evento(maquina, False)
+            
+    # Agotar los pasos equivale a rechazar, como en ejecutar_completo
+    if maquina.cadena_aceptada is None:
+        maquina.cadena_aceptada = False
+    yield _evento(maquina, True)
+
+async def ejecutar_async(maquina, max_pasos: Optional[int] = None,
+                         pasos_por_tramo: int = PASOS_POR_TRAMO,
+                         ejecutor: Optional[Executor] = None,
+                         tiempo_limite: Optional[float] = None) -> bool:
+    """
+    Equivalente asíncrono de ejecutar_completo.
+    
+    Args:
+        maquina: Máquina con la cadena ya cargada
+        max_pasos: Máximo número de pasos (ver progreso)
+        pasos_por_tramo: Pasos entre dos cesiones de control
+        ejecutor: Ejecutor de hilos o de procesos al que enviar cada tramo
+        tiempo_limite: Segundos antes de abandonar la ejecución
+        
+    Returns:
+        True si la cadena fue aceptada, False en caso contrario
+        
+    Raises:
+        asyncio.TimeoutError: Si se agota tiempo_limite; la máquina queda
+            en el último tramo completado y se puede seguir ejecutando
+    """
+    async def ejecutar() -> bool:
+        async for _ in progreso(maquina, max_pasos, pasos_por_tramo, ejecutor):
+            pass
+        return maquina.cadena_aceptada
+        
+    if tiempo_limite is None:
+        return await ejecutar()
+    return await asyncio.wait_for(ejecutar(), tiempo_limite)
@@ -0,0 +1,478 @@
+"""
+Simulador de Máquina de Turing
+Archivo: evaluacion_lotes.py
+Descripción: Evaluación en varios procesos de muchas cadenas o de una cadena muy larga
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from itertools import islice
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cinta import CintaCompacta
+from maquina_turing import MaquinaTuring
+from programa_compilado import ProgramaCompilado
+
+# Caracteres que se recorren a la vez desde todos los estados al calcular
+# la función de un trozo, a la espera de que los recorridos confluyan
+PREFIJO_SINCRONIZACION = 256
+
+# Tamaño mínimo de los trozos en que se divide una cadena larga
+TAM_TROZO_MINIMO = 1 << 16
+
+# Máximo de bytes que ocupa un carácter en UTF-8
+BYTES_POR_CARACTER = 4
+
+# Veredicto en memoria compartida de una cadena que agotó los pasos
+SIN_VEREDICTO = -1
+
+# Máquina y programa compilado del proceso trabajador (uno por proceso)
+_maquina = None
+_programa = None
+_max_pasos = None
+
+def _inicializar_trabajador(config: Dict, max_pasos: Optional[int]):
+    """
+    Compila la máquina una sola vez por proceso trabajador.
+    
+    Args:
+        config: Diccionario con la definición de la máquina
+        max_pasos: Máximo número de pasos por cadena (None para resolverlo
+            en cada cadena, ver ProgramaCompilado.limite_pasos)
+    """
+    global _maquina, _programa, _max_pasos
+    _maquina = MaquinaTuring.desde_configuracion(config, clase_cinta=CintaCompacta)
+    _programa = _maquina.compilar()
+    _max_pasos = max_pasos
+
+def _inicializar_trozos(programa: ProgramaCompilado):
+    """
+    Recibe el programa compilado una sola vez por proceso trabajador.
+    
+    Args:
+        programa: Programa compilado con forma de autómata
+    """
+    global _programa
+    _programa = programa
+
+def _evaluar_rango(nombre_entrada: str, nombre_salida: str, total: int,
+                   desde: int, hasta: int):
+    """
+    Evalúa las cadenas [desde, hasta) de una tanda y escribe los resultados
+    en la memoria compartida.
+    
+    Args:
+        nombre_entrada: Bloque con los desplazamientos y las cadenas en UTF-8
+        nombre_salida: Bloque donde se escriben los resultados
+        total: Número de cadenas de la tanda
+        desde: Primera cadena a evaluar
+        hasta: Cadena siguiente a la última a evaluar
+    """
+    entrada = shared_memory.SharedMemory(name=nombre_entrada)
+    salida = shared_memory.SharedMemory(name=nombre_salida)
+    vistas = ()
+    try:
+        vistas = _vistas_entrada(entrada.buf, total) + _vistas_salida(salida.buf, total)
+        desplazamientos, datos, pasos, estados, aceptadas = vistas
+        codigo_estado = _programa.codigo_estado
+        for i in range(desde, hasta):
+            cadena = str(datos[desplazamientos[i]:desplazamientos[i + 1]], 'utf-8')
+            limite = _programa.limite_pasos(len(cadena), _max_pasos)
+            if _programa.compacto:
+                aceptada, pasos[i], estado = _programa.decidir(cadena, limite)
+            else:
+                _maquina.cargar_cadena(cadena)
+                _maquina.ejecutar_lote(limite)
+                aceptada = _maquina.cadena_aceptada
+                pasos[i], estado = _maquina.pasos_ejecutados, _maquina.estado_actual
+            aceptadas[i] = SIN_VEREDICTO if aceptada is None else aceptada
+            estados[i] = codigo_estado[estado]
+    finally:
+        _liberar_vistas(vistas)
+        entrada.close()
+        salida.close()
+
+def _vistas_entrada(buf: memoryview, total: int):
+    """Divide el bloque de entrada en desplazamientos (int64) y datos."""
+    limite = (total + 1) * 8
+    return buf[:limite].cast('q'), buf[limite:]
+
+def _vistas_salida(buf: memoryview, total: int):
+    """Divide el bloque de salida en pasos (int64), estados (int32) y veredictos."""
+    return (buf[:total * 8].cast('q'),
+            buf[total * 8:total * 12].cast('i'),
+            buf[total * 12:total * 13].cast('b'))
+
+def _liberar_vistas(vistas: Iterable[memoryview]):
+    """
+    Libera en orden las vistas sobre un bloque de memoria compartida.
+    
+    Debe llamarse antes de cerrar el bloque: close() falla mientras quede
+    alguna vista viva, así que una vista olvidada se detecta ahí mismo.
+    """
+    for vista in vistas:
+        vista.release()
+
+def _crear_tanda(cadenas: List[str]):
+    """
+    Copia una tanda de cadenas a memoria compartida.
+    
+    Returns:
+        Tupla (bloque de entrada, bloque de salida)
+    """
+    codificadas = [cadena.encode('utf-8') for cadena in cadenas]
+    total = len(codificadas)
+    datos = b''.join(codificadas)
+    
+    entrada = shared_memory.SharedMemory(create=True, size=max((total + 1) * 8 + len(datos), 1))
+    try:
+        salida = shared_memory.SharedMemory(create=True, size=max(total * 13, 1))
+    except BaseException:
+        _cerrar_bloques(entrada)
+        raise
+        
+    vistas = ()
+    try:
+        vistas = desplazamientos, vista_datos = _vistas_entrada(entrada.buf, total)
+        posicion = 0
+        for i, codificada in enumerate(codificadas):
+            desplazamientos[i] = posicion
+            posicion += len(codificada)
+        desplazamientos[total] = posicion
+        vista_datos[:len(datos)] = datos
+    except BaseException:
+        _liberar_vistas(vistas)
+        _cerrar_bloques(entrada, salida)
+        raise
+    _liberar_vistas(vistas)
+    return entrada, salida
+
+def _cerrar_bloques(*bloques: shared_memory.SharedMemory):
+    """Cierra y elimina bloques de memoria compartida creados por este proceso."""
+    for bloque in bloques:
+        bloque.close()
+        bloque.unlink()
+
+def _enviar_tanda(ejecutor: ProcessPoolExecutor, cadenas: List[str], procesos: int,
+                  tam_bloque: Optional[int]):
+    """
+    Copia una tanda a memoria compartida y reparte sus bloques entre los
+    trabajadores sin esperar a que terminen.
+    
+    Returns:
+        Tupla (bloque de entrada, bloque de salida, número de cadenas, tareas)
+    """
+    total = len(cadenas)
+    entrada, salida = _crear_tanda(cadenas)
+    bloque = tam_bloque or max(1, -(-total // (procesos * 4)))
+    tareas = []
+    try:
+        for desde in range(0, total, bloque):
+            tareas.append(ejecutor.submit(_evaluar_rango, entrada.name, salida.name,
+                                          total, desde, min(desde + bloque, total)))
+    except BaseException:
+        _descartar_tanda((entrada, salida, total, tareas))
+        raise
+    return entrada, salida, total, tareas
+
+def _recoger_tanda(tanda, estados: List[str]) -> List[Tuple[Optional[bool], int, str]]:
+    """
+    Espera a las tareas de una tanda, lee sus resultados y libera su memoria
+    compartida.
+    
+    Args:
+        tanda: Tupla devuelta por _enviar_tanda
+        estados: Nombre de cada estado según su código
+        
+    Returns:
+        Lista de tuplas (aceptada, pasos, estado final) de la tanda
+    """
+    entrada, salida, total, tareas = tanda
+    vistas = ()
+    try:
+        for tarea in tareas:
+            tarea.result()
+        vistas = pasos, codigos, aceptadas = _vistas_salida(salida.buf, total)
+        return [(None if aceptada == SIN_VEREDICTO else bool(aceptada), paso, estados[codigo])
+                for aceptada, paso, codigo in zip(aceptadas, pasos, codigos)]
+    finally:
+        _liberar_vistas(vistas)
+        _descartar_tanda(tanda)
+
+def _descartar_tanda(tanda):
+    """
+    Cancela las tareas pendientes de una tanda, espera a las que ya están en
+    marcha y libera su memoria compartida.
+    """
+    entrada, salida, _, tareas = tanda
+    for tarea in tareas:
+        tarea.cancel()
+    wait(tareas)
+    _cerrar_bloques(entrada, salida)
+
+def evaluar_lote(config: Dict, cadenas: Iterable[str], max_pasos: Optional[int] = None,
+                 procesos: Optional[int] = None, tam_tanda: int = 100000,
+                 tam_bloque: Optional[int] = None) -> Iterator[Tuple[Optional[bool], int, str]]:
+    """
+    Evalúa muchas cadenas con la misma máquina repartiéndolas entre procesos.
+    
+    Las cadenas se consumen por tandas de tam_tanda elementos. Cada tanda se
+    copia una sola vez a memoria compartida y cada trabajador evalúa bloques
+    contiguos de ella; a los procesos solo se envían los índices del bloque.
+    La tanda siguiente se prepara y se envía antes de recoger la actual, de
+    modo que los trabajadores no esperan mientras se codifica la entrada (a
+    cambio, hasta dos tandas ocupan memoria compartida a la vez). La
+    máquina se compila una única vez por trabajador y las máquinas con
+    forma de autómata se evalúan directamente sobre la cadena, sin cinta.
+    
+    Args:
+        config: Diccionario con la definición de la máquina
+        cadenas: Cadenas de entrada (puede ser un iterador de cualquier longitud)
+        max_pasos: Máximo número de pasos por cadena; por defecto, la cota
+            demostrada por el análisis estático si la hay, o 1000
+        procesos: Número de procesos trabajadores (por defecto, uno por núcleo)
+        tam_tanda: Número de cadenas que se cargan en memoria compartida a la vez
+        tam_bloque: Número de cadenas por tarea (por defecto, un reparto
+            equilibrado de la tanda)
+            
+    Returns:
+        Iterador de tuplas (aceptada, pasos, estado final) en el mismo orden
+        que las cadenas de entrada; aceptada es None si se agotaron los
+        pasos sin que la ejecución terminara
+    """
+    procesos = procesos or os.cpu_count() or 1
+    estados = MaquinaTuring.desde_configuracion(config).compilar().estados
+    iterador = iter(cadenas)
+    
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_trabajador,
+                             initargs=(config, max_pasos)) as ejecutor:
+        enviadas = deque()
+        try:
+            while True:
+                tanda = list(islice(iterador, tam_tanda))
+                agotadas = not tanda
+                if tanda:
+                    enviadas.append(_enviar_tanda(ejecutor, tanda, procesos, tam_bloque))
+                del tanda
+                if not enviadas:
+                    break
+                    
+                # Con la tanda siguiente ya en marcha, recoger la más antigua
+                if agotadas or len(enviadas) > 1:
+                    resultados = _recoger_tanda(enviadas.popleft(), estados)
+                    yield from resultados
+        finally:
+            for tanda in enviadas:
+                _descartar_tanda(tanda)
+
+def _funcion_trozo(programa: ProgramaCompilado, texto: str) -> List[int]:
+    """
+    Calcula la función de transición de un trozo de la entrada.
+    
+    Todos los estados se recorren a la vez durante los primeros caracteres:
+    los recorridos que llegan al mismo estado se fusionan, de modo que lo
+    normal es terminar recorriendo el trozo una sola vez.
+    
+    Args:
+        programa: Programa compilado con forma de autómata
+        texto: Trozo de la entrada
+        
+    Returns:
+        Lista indexada por el código del estado de partida con el código del
+        estado al final del trozo, o -1 si la ejecución termina dentro de él
+    """
+    filas = programa.filas_afd
+    fin = len(programa.estados)
+    funcion = [-1] * fin
+    
+    # Estado actual -> estados de partida que han llegado a él
+    grupos = {q: [q] for q in range(fin) if not programa.aceptacion[q]}
+    prefijo = texto[:PREFIJO_SINCRONIZACION]
+    desconocidos = set(prefijo) - programa.simbolos_afd
+    if desconocidos:
+        prefijo = prefijo[:min(prefijo.find(simbolo) for simbolo in desconocidos)]
+        
+    posicion = 0
+    for c in prefijo.translate(programa.traduccion_afd).encode('latin-1'):
+        if len(grupos) <= 1:
+            break
+        siguientes = {}
+        for q, partida in grupos.items():
+            nuevo = filas[q][c]
+            if nuevo != fin:
+                siguientes.setdefault(nuevo, []).extend(partida)
+        grupos = siguientes
+        posicion += 1
+        
+    for q, partida in grupos.items():
+        estado, _, _, aceptada, _ = programa.recorrer_afd(
+            texto, programa.estados[q], posicion, posicion, len(texto))
+        if aceptada is None:
+            for inicial in partida:
+                funcion[inicial] = programa.codigo_estado[estado]
+    return funcion
+    
+def _funcion_trozo_cadena(texto: str) -> Tuple[int, List[int]]:
+    """Calcula la función de un trozo recibido como cadena."""
+    return len(texto), _funcion_trozo(_programa, texto)
+    
+def _funcion_trozo_archivo(ruta: str, inicio: int, fin: int) -> Tuple[int, List[int]]:
+    """Calcula la función de un trozo que el trabajador lee del archivo."""
+    return _funcion_trozo_cadena(_leer_trozo(ruta, inicio, fin))
+    
+def _leer_trozo(ruta: str, inicio: int, fin: int) -> str:
+    """
+    Lee del archivo el texto de los bytes [inicio, fin).
+    
+    Los extremos se desplazan hasta el siguiente inicio de carácter UTF-8,
+    de modo que trozos contiguos no parten ningún carácter.
+    """
+    with open(ruta, 'rb') as archivo:
+        archivo.seek(inicio)
+        datos = archivo.read(fin - inicio + 3)
+        
+    desde = 0
+    if inicio:
+        while desde < len(datos) and 0x80 <= datos[desde] < 0xC0:
+            desde += 1
+    hasta = fin - inicio
+    while hasta < len(datos) and 0x80 <= datos[hasta] < 0xC0:
+        hasta += 1
+    return datos[desde:hasta].decode('utf-8')
+    
+def _componer_trozos(programa: ProgramaCompilado, funciones: Iterable[Tuple[int, List[int]]],
+                     leer_trozo, max_pasos: int) -> Tuple[Optional[bool], int, str]:
+    """
+    Compone en orden las funciones de los trozos partiendo del estado inicial.
+    
+    Solo el trozo en el que la ejecución termina o agota los pasos se vuelve
+    a recorrer, para obtener el resultado exacto.
+    
+    Args:
+        programa: Programa compilado con forma de autómata
+        funciones: Pares (longitud del trozo, función del trozo) en orden
+        leer_trozo: Función que devuelve el texto del trozo i-ésimo
+        max_pasos: Máximo número de pasos permitidos
+        
+    Returns:
+        Tupla (aceptada, pasos, estado final); aceptada es None si se
+        agotaron los pasos sin que la ejecución terminara
+    """
+    q = 0
+    pasos = 0
+    for i, (longitud, funcion) in enumerate(funciones):
+        if funcion[q] < 0 or pasos + longitud >= max_pasos:
+            estado, _, pasos, aceptada, _ = programa.recorrer_afd(
+                leer_trozo(i), programa.estados[q], 0, pasos, max_pasos)
+            return aceptada, pasos, estado
+        q = funcion[q]
+        pasos += longitud
+        
+    # Fin de la entrada: el resto de la cinta es blanca
+    estado, _, pasos, aceptada, _ = programa.recorrer_afd(
+        '', programa.estados[q], 0, pasos, max_pasos)
+    return aceptada, pasos, estado
+    
+def decidir_cadena_larga(config: Dict, cadena: str, max_pasos: Optional[int] = None,
+                         procesos: Optional[int] = None,
+                         tam_trozo: Optional[int] = None) -> Tuple[Optional[bool], int, str]:
+    """
+    Decide una sola cadena muy larga repartiéndola entre procesos.
+    
+    Si la máquina tiene forma de autómata, la cadena se divide en trozos y
+    cada trabajador calcula la función estado -> estado de los suyos. Estas
+    funciones se componen después en orden, lo que da el mismo veredicto y
+    el mismo número de pasos que la ejecución secuencial. Las demás máquinas
+    se ejecutan de forma secuencial. El programa compilado se envía una
+    sola vez a cada trabajador.
+    
+    Args:
+        config: Diccionario con la definición de la máquina
+        cadena: Cadena de entrada
+        max_pasos: Máximo número de pasos permitidos; por defecto, la cota
+            demostrada por el análisis estático si la hay, o 1000
+        procesos: Número de procesos trabajadores (por defecto, uno por núcleo)
+        tam_trozo: Caracteres por trozo (por defecto, un reparto equilibrado)
+        
+    Returns:
+        Tupla (aceptada, pasos, estado final); aceptada es None si se
+        agotaron los pasos sin que la ejecución terminara, como en
+        ejecutar_lote
+    """
+    programa = MaquinaTuring.desde_configuracion(config).compilar()
+    max_pasos = programa.limite_pasos(len(cadena), max_pasos)
+    if not programa.es_afd:
+        return _decidir_secuencial(config, cadena, max_pasos)
+        
+    # Más allá del límite de pasos la entrada no llega a leerse
+    longitud = min(len(cadena), max_pasos)
+    procesos = procesos or os.cpu_count() or 1
+    tam_trozo = tam_trozo or max(TAM_TROZO_MINIMO, -(-longitud // (procesos * 4)))
+    inicios = range(0, longitud, tam_trozo)
+    
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_trozos,
+                             initargs=(programa,)) as ejecutor:
+        tareas = [ejecutor.submit(_funcion_trozo_cadena,
+                                  cadena[inicio:min(inicio + tam_trozo, longitud)])
+                  for inicio in inicios]
+        return _componer_trozos(
+            programa, (tarea.result() for tarea in tareas),
+            lambda i: cadena[inicios[i]:min(inicios[i] + tam_trozo, longitud)], max_pasos)
+            
+def decidir_archivo(config: Dict, ruta: str, max_pasos: Optional[int] = None,
+                    procesos: Optional[int] = None,
+                    tam_trozo: Optional[int] = None) -> Tuple[Optional[bool], int, str]:
+    """
+    Decide la cadena contenida en un archivo de texto UTF-8.
+    
+    Funciona igual que decidir_cadena_larga, pero cada trabajador lee su
+    trozo directamente del archivo, por lo que la entrada nunca se carga
+    entera en memoria. Todo el contenido del archivo forma parte de la
+    cadena, incluido un posible salto de línea final. Como en max_pasos
+    pasos el cabezal no pasa de la celda max_pasos, solo se leen los
+    primeros max_pasos caracteres del archivo.
+    
+    Args:
+        config: Diccionario con la definición de la máquina
+        ruta: Ruta del archivo con la cadena de entrada
+        max_pasos: Máximo número de pasos permitidos; por defecto, la cota
+            demostrada para una cadena con tantos caracteres como bytes
+            tiene el archivo, o 1000
+        procesos: Número de procesos trabajadores (por defecto, uno por núcleo)
+        tam_trozo: Bytes por trozo (por defecto, un reparto equilibrado)
+        
+    Returns:
+        Tupla (aceptada, pasos, estado final); aceptada es None si se
+        agotaron los pasos sin que la ejecución terminara
+    """
+    programa = MaquinaTuring.desde_configuracion(config).compilar()
+    max_pasos = programa.limite_pasos(os.path.getsize(ruta), max_pasos)
+    if not programa.es_afd:
+        with open(ruta, encoding='utf-8', newline='') as archivo:
+            return _decidir_secuencial(config, archivo.read(max_pasos), max_pasos)
+            
+    # Los max_pasos primeros caracteres caben en este número de bytes
+    tamano = min(os.path.getsize(ruta), max_pasos * BYTES_POR_CARACTER)
+    procesos = procesos or os.cpu_count() or 1
+    tam_trozo = tam_trozo or max(TAM_TROZO_MINIMO, -(-tamano // (procesos * 4)))
+    inicios = range(0, tamano, tam_trozo)
+    
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_trozos,
+                             initargs=(programa,)) as ejecutor:
+        tareas = [ejecutor.submit(_funcion_trozo_archivo, ruta,
+                                  inicio, min(inicio + tam_trozo, tamano))
+                  for inicio in inicios]
+        return _componer_trozos(
+            programa, (tarea.result() for tarea in tareas),
+            lambda i: _leer_trozo(ruta, inicios[i], min(inicios[i] + tam_trozo, tamano)),
+            max_pasos)
+            
+def _decidir_secuencial(config: Dict, cadena: str,
+                        max_pasos: int) -> Tuple[Optional[bool], int, str]:
+    """Decide una cadena con la máquina completa en el proceso actual."""
+    maquina = MaquinaTuring.desde_configuracion(config)
+    maquina.cargar_cadena(cadena)
+    maquina.ejecutar_lote(max_pasos)
+    return maquina.cadena_aceptada, maquina.pasos_ejecutados, maquina.estado_actual
@@ -254,6 +254,25 @@ class ExpresionesRegulares:
             'estados_aceptacion': {'q_aceptar'}
         }
     
+    @staticmethod
+    def obtener_expresion(numero: int) -> Dict:
+        """
+        Obtiene una sola expresión del catálogo sin construir las demás.
+        
+        Args:
+            numero: Número de la expresión, empezando en 1
+            
+        Returns:
+            Diccionario con la definición de la máquina
+            
+        Raises:
+            ValueError: Si no existe una expresión con ese número
+        """
+        obtener = getattr(ExpresionesRegulares, f'obtener_expresion_{numero}', None)
+        if obtener is None:
+            raise ValueError(f"No existe la expresión número {numero}")
+        return obtener()
+        
     @staticmethod
     def obtener_todas() -> list:
         """
@@ -273,4 +292,145 @@ class ExpresionesRegulares:
             ExpresionesRegulares.obtener_expresion_8(),
             ExpresionesRegulares.obtener_expresion_9(),
             ExpresionesRegulares.obtener_expresion_10(),
-        ]
\ No newline at end of file
+        ]
+    
+    @staticmethod
+    def obtener_multicinta_1() -> Dict:
+        """
+        Lenguaje: a^n b^n (dos cintas)
+        Cuenta las 'a' en la segunda cinta y las descuenta con cada 'b',
+        en un solo recorrido de la entrada
+        """
+        return {
+            'nombre': 'a^n b^n',
+            'descripcion': 'Acepta n "a" seguidas de n "b" (2 cintas, O(n) pasos)',
+            'num_cintas': 2,
+            'estados': {'q0', 'q1', 'q_aceptar'},
+            'alfabeto_entrada': {'a', 'b'},
+            'alfabeto_cinta': {'a', 'b', 'X', '_'},
+            'transiciones': {
+                ('q0', ('a', '_')): ('q0', ('a', 'X'), ('R', 'R')),
+                ('q0', ('b', '_')): ('q1', ('b', '_'), ('S', 'L')),
+                ('q0', ('_', '_')): ('q1', ('_', '_'), ('S', 'L')),
+                ('q1', ('b', 'X')): ('q1', ('b', 'X'), ('R', 'L')),
+                ('q1', ('_', '_')): ('q_aceptar', ('_', '_'), ('S', 'S')),
+            },
+            'estado_inicial': 'q0',
+            'simbolo_blanco': '_',
+            'estados_aceptacion': {'q_aceptar'}
+        }
+        
+    @staticmethod
+    def obtener_multicinta_2() -> Dict:
+        """
+        Lenguaje: w#w con w en {a, b}* (dos cintas)
+        Copia w en la segunda cinta, la rebobina y la compara con lo que
+        sigue al '#'
+        """
+        transiciones = {
+            ('q0', ('#', '_')): ('q1', ('#', '_'), ('S', 'L')),
+            ('q1', ('#', '_')): ('q2', ('#', '_'), ('R', 'R')),
+            ('q2', ('_', '_')): ('q_aceptar', ('_', '_'), ('S', 'S')),
+        }
+        for simbolo in 'ab':
+            transiciones[('q0', (simbolo, '_'))] = ('q0', (simbolo, simbolo), ('R', 'R'))
+            transiciones[('q1', ('#', simbolo))] = ('q1', ('#', simbolo), ('S', 'L'))
+            transiciones[('q2', (simbolo, simbolo))] = ('q2', (simbolo, simbolo), ('R', 'R'))
+        return {
+            'nombre': 'w#w',
+            'descripcion': 'Acepta dos copias de la misma cadena separadas por "#" (2 cintas, O(n) pasos)',
+            'num_cintas': 2,
+            'estados': {'q0', 'q1', 'q2', 'q_aceptar'},
+            'alfabeto_entrada': {'a', 'b', '#'},
+            'alfabeto_cinta': {'a', 'b', '#', '_'},
+            'transiciones': transiciones,
+            'estado_inicial': 'q0',
+            'simbolo_blanco': '_',
+            'estados_aceptacion': {'q_aceptar'}
+        }
+        
+    @staticmethod
+    def obtener_multicinta_3() -> Dict:
+        """
+        Lenguaje: palíndromos sobre {a, b} (dos cintas)
+        Copia la entrada en la segunda cinta y compara la primera de
+        izquierda a derecha con la copia de derecha a izquierda
+        """
+        transiciones = {
+            ('q0', ('_', '_')): ('q1', ('_', '_'), ('L', 'S')),
+            ('q1', ('_', '_')): ('q2', ('_', '_'), ('R', 'L')),
+            ('q2', ('_', '_')): ('q_aceptar', ('_', '_'), ('S', 'S')),
+        }
+        for simbolo in 'ab':
+            transiciones[('q0', (simbolo, '_'))] = ('q0', (simbolo, simbolo), ('R', 'R'))
+            transiciones[('q1', (simbolo, '_'))] = ('q1', (simbolo, '_'), ('L', 'S'))
+            transiciones[('q2', (simbolo, simbolo))] = ('q2', (simbolo, simbolo), ('R', 'L'))
+        return {
+            'nombre': 'palíndromos',
+            'descripcion': 'Acepta las cadenas que se leen igual al revés (2 cintas, O(n) pasos)',
+            'num_cintas': 2,
+            'estados': {'q0', 'q1', 'q2', 'q_aceptar'},
+            'alfabeto_entrada': {'a', 'b'},
+            'alfabeto_cinta': {'a', 'b', '_'},
+            'transiciones': transiciones,
+            'estado_inicial': 'q0',
+            'simbolo_blanco': '_',
+            'estados_aceptacion': {'q_aceptar'}
+        }
+        
+    @staticmethod
+    def obtener_todas_multicinta() -> list:
+        """
+        Obtiene los ejemplos de máquinas de varias cintas.
+        
+        Se mantienen aparte de obtener_todas porque su formato de
+        transiciones (tuplas de símbolos por cinta) solo lo entiende
+        MaquinaMulticinta.
+        
+        Returns:
+            Lista con las definiciones de las máquinas multicinta
+        """
+        return [
+            ExpresionesRegulares.obtener_multicinta_1(),
+            ExpresionesRegulares.obtener_multicinta_2(),
+            ExpresionesRegulares.obtener_multicinta_3(),
+        ]
+        
+    @staticmethod
+    def obtener_no_determinista_1() -> Dict:
+        """
+        Expresión regular: (a|b)*abb (no determinista)
+        Adivina en qué 'a' empieza el sufijo 'abb'
+        """
+        return {
+            'nombre': '(a|b)*abb (MTND)',
+            'descripcion': 'Acepta cadenas que terminan en "abb" adivinando dónde empieza el sufijo',
+            'estados': {'q0', 'q1', 'q2', 'q3', 'q_aceptar'},
+            'alfabeto_entrada': {'a', 'b'},
+            'alfabeto_cinta': {'a', 'b', '_'},
+            'transiciones': {
+                ('q0', 'a'): {('q0', 'a', 'R'), ('q1', 'a', 'R')},
+                ('q0', 'b'): {('q0', 'b', 'R')},
+                ('q1', 'b'): {('q2', 'b', 'R')},
+                ('q2', 'b'): {('q3', 'b', 'R')},
+                ('q3', '_'): {('q_aceptar', '_', 'S')},
+            },
+            'estado_inicial': 'q0',
+            'simbolo_blanco': '_',
+            'estados_aceptacion': {'q_aceptar'}
+        }
+        
+    @staticmethod
+    def obtener_desde_regex(expresion: str) -> Dict:
+        """
+        Genera la Máquina de Turing mínima de una expresión regular cualquiera.
+        
+        Args:
+            expresion: Expresión regular, con '|' para la unión
+            
+        Returns:
+            Diccionario con la definición de la máquina
+        """
+        # El compilador solo se carga si se usa
+        from compilador_regex import compilar_regex
+        return compilar_regex(expresion)
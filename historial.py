@@ -0,0 +1,170 @@
+"""
+Simulador de Máquina de Turing
+Archivo: historial.py
+Descripción: Registro de deshacer y puntos de control para moverse por una ejecución
+"""
+
+from array import array
+
+# Pasos entre dos puntos de control consecutivos
+INTERVALO_PUNTOS = 1024
+
+class HistorialEjecucion:
+    """
+    Historial de una ejecución que permite volver a cualquier paso ya
+    ejecutado.
+    
+    Por cada paso se guarda en arreglos compactos la celda escrita, el
+    símbolo que tenía, el estado anterior, el desplazamiento del cabezal y
+    si la escritura amplió los límites de la cinta. Cada `intervalo` pasos
+    se guarda además una captura completa de la máquina (ver
+    MaquinaTuring.capturar). Para ir a un paso se deshacen pasos desde el
+    actual o se restaura el punto de control anterior y se vuelve a
+    ejecutar desde él, lo que sea más corto: en ambos casos, como mucho
+    `intervalo` pasos.
+    
+    Atributos:
+        inicio: Primer paso al que se puede volver
+        fin: Último paso registrado
+    """
+    
+    def __init__(self, maquina, intervalo: int = INTERVALO_PUNTOS):
+        """
+        Empieza a registrar la ejecución desde el paso actual de la máquina.
+        
+        Args:
+            maquina: Máquina de Turing a registrar
+            intervalo: Pasos entre puntos de control
+        """
+        if intervalo < 1:
+            raise ValueError("El intervalo entre puntos de control debe ser positivo")
+        self.maquina = maquina
+        self.intervalo = intervalo
+        self.reiniciar()
+        
+    def reiniciar(self):
+        """Descarta el historial y empieza de nuevo desde el paso actual."""
+        maquina = self.maquina
+        self.inicio = maquina.pasos_ejecutados
+        self.fin = self.inicio
+        
+        # Registro de deshacer: una entrada por paso
+        self.posiciones = array('q')
+        self.simbolos_anteriores = array('I')
+        self.estados_anteriores = array('I')
+        self.desplazamientos = array('b')
+        self.ampliaciones = array('b')  # -1 por la izquierda, 1 por la derecha
+        
+        # Códigos de los símbolos y estados del registro
+        self.simbolos = []
+        self.codigo_simbolo = {}
+        self.estados = []
+        self.codigo_estado = {}
+        
+        # Puntos de control: el i-ésimo es el paso inicio + i * intervalo
+        self.puntos = [maquina.capturar()]
+        
+        # Veredicto al llegar a fin, para recuperarlo al volver allí
+        self._final = (maquina.cadena_aceptada, maquina.ciclo_detectado)
+        
+    def _codificar(self, valor: str, valores: list, codigos: dict) -> int:
+        """Obtiene el código de un símbolo o estado, asignándole uno nuevo si no lo tiene."""
+        codigo = codigos.get(valor)
+        if codigo is None:
+            codigo = codigos[valor] = len(valores)
+            valores.append(valor)
+        return codigo
+        
+    def registrar(self, estado: str, simbolo: str, posicion: int, direccion: str):
+        """
+        Registra un paso justo antes de que la máquina lo aplique.
+        
+        Solo se registran los pasos nuevos: al volver a ejecutar pasos ya
+        registrados (tras retroceder) el registro no cambia.
+        
+        Args:
+            estado: Estado antes del paso
+            simbolo: Símbolo leído, que el paso va a sobrescribir
+            posicion: Posición del cabezal antes del paso
+            direccion: Movimiento del cabezal
+        """
+        maquina = self.maquina
+        if maquina.pasos_ejecutados != self.fin:
+            return
+            
+        if (self.fin - self.inicio) % self.intervalo == 0 and self.fin > self.inicio:
+            self.puntos.append(maquina.capturar())
+            
+        cinta = maquina.cinta
+        self.posiciones.append(posicion)
+        self.simbolos_anteriores.append(
+            self._codificar(simbolo, self.simbolos, self.codigo_simbolo))
+        self.estados_anteriores.append(
+            self._codificar(estado, self.estados, self.codigo_estado))
+        self.desplazamientos.append(1 if direccion == 'R' else -1 if direccion == 'L' else 0)
+        if posicion < cinta.posicion_inicio:
+            self.ampliaciones.append(-1)
+        elif posicion > cinta.posicion_fin:
+            self.ampliaciones.append(1)
+        else:
+            self.ampliaciones.append(0)
+        self.fin += 1
+        
+    def _deshacer(self):
+        """Deshace el último paso ejecutado por la máquina."""
+        maquina = self.maquina
+        i = maquina.pasos_ejecutados - 1 - self.inicio
+        posicion = self.posiciones[i]
+        cinta = maquina.cinta
+        cinta.escribir(posicion, self.simbolos[self.simbolos_anteriores[i]])
+        
+        # El cabezal avanza de celda en celda, así que una escritura que
+        # amplió la cinta estaba justo al lado del límite anterior
+        ampliacion = self.ampliaciones[i]
+        if ampliacion < 0:
+            cinta.posicion_inicio = posicion + 1
+        elif ampliacion > 0:
+            cinta.posicion_fin = posicion - 1
+            
+        maquina.posicion_cabezal -= self.desplazamientos[i]
+        maquina.estado_actual = self.estados[self.estados_anteriores[i]]
+        maquina.pasos_ejecutados -= 1
+        
+    def ir_a(self, paso: int):
+        """
+        Lleva la máquina a un paso ya ejecutado.
+        
+        Args:
+            paso: Paso de destino, entre inicio y fin
+            
+        Raises:
+            ValueError: Si el paso no está en el historial
+        """
+        if not self.inicio <= paso <= self.fin:
+            raise ValueError(
+                f"El paso {paso} no está en el historial ({self.inicio}-{self.fin})"
+            )
+        maquina = self.maquina
+        actual = maquina.pasos_ejecutados
+        if actual == paso:
+            return
+        if actual == self.fin:
+            self._final = (maquina.cadena_aceptada, maquina.ciclo_detectado)
+            
+        indice = min((paso - self.inicio) // self.intervalo, len(self.puntos) - 1)
+        punto = self.inicio + indice * self.intervalo
+        maquina.cadena_aceptada = None
+        maquina.ciclo_detectado = False
+        
+        if paso < actual and actual - paso <= paso - punto:
+            while maquina.pasos_ejecutados > paso:
+                self._deshacer()
+        else:
+            if paso < actual or punto > actual:
+                maquina.restaurar(self.puntos[indice])
+            while maquina.pasos_ejecutados < paso:
+                if not maquina.paso():
+                    break
+                    
+        if paso == self.fin:
+            maquina.cadena_aceptada, maquina.ciclo_detectado = self._final
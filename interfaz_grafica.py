@@ -7,6 +7,9 @@ Descripción: Interfaz gráfica del simulador usando tkinter
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import time
+import datetime
+from collections import deque
+from cinta import CintaPaginada
 from maquina_turing import MaquinaTuring
 from expresiones_regulares import ExpresionesRegulares
 
@@ -15,6 +18,14 @@ class InterfazSimulador:
     Interfaz gráfica para el simulador de Máquina de Turing.
     """
     
+    # Iconos de los mensajes según su tipo
+    ICONOS_MENSAJE = {
+        "info": "ℹ️",
+        "success": "✓",
+        "error": "✗",
+        "warning": "⚠️"
+    }
+    
     def __init__(self, root):
         """
         Inicializa la interfaz gráfica.
@@ -40,9 +51,25 @@ class InterfazSimulador:
         # Variables
         self.maquina = None
         self.expresiones = ExpresionesRegulares.obtener_todas()
+        self._maquinas = {}  # máquina ya compilada de cada expresión
         self.ejecutando = False
         self.velocidad = 500  # milisegundos entre pasos
         
+        # Modo turbo: pasos por frame limitados por tiempo
+        self.presupuesto_frame = 0.012  # segundos de cómputo por frame
+        self.umbral_sin_dibujo = 20000  # pasos por frame a partir de los que no se dibuja la cinta
+        self._lote_turbo = 256
+        
+        # Registro de mensajes: líneas pendientes de mostrar y tope de líneas
+        self.max_lineas_mensajes = 500
+        self._mensajes_pendientes = deque(maxlen=self.max_lineas_mensajes)
+        self._volcado_mensajes = None
+        
+        # Ventana del perfil: celdas de la tabla de transiciones por (estado, símbolo)
+        self._ventana_perfil = None
+        self._maquina_perfil = None
+        self._celdas_perfil = {}
+        
         # Configurar estilos
         self._configurar_estilos()
         
@@ -209,6 +236,31 @@ class InterfazSimulador:
         vel_frame = tk.Frame(controles_inner, bg=self.COLOR_BLANCO)
         vel_frame.grid(row=1, column=0, columnspan=4, pady=(10, 0))
         
+        # Historial: volver atrás o a cualquier paso ya ejecutado
+        historial_frame = tk.Frame(controles_inner, bg=self.COLOR_BLANCO)
+        historial_frame.grid(row=2, column=0, columnspan=4, pady=(10, 0), sticky=tk.EW)
+        
+        self.var_historial = tk.BooleanVar(value=False)
+        tk.Checkbutton(historial_frame, text="⏪ Historial", variable=self.var_historial,
+                       command=self._cambiar_historial,
+                       font=('Arial', 9, 'bold'), bg=self.COLOR_BLANCO,
+                       fg=self.COLOR_PRIMARIO, activebackground=self.COLOR_BLANCO,
+                       cursor='hand2').pack(side=tk.LEFT, padx=5)
+                       
+        self.btn_atras = tk.Button(historial_frame, text="⏮️ Atrás",
+                                   command=self._retroceder_paso,
+                                   font=('Arial', 9, 'bold'), bg='#95A5A6',
+                                   fg=self.COLOR_BLANCO, relief='flat',
+                                   padx=10, pady=2, cursor='hand2')
+        self.btn_atras.pack(side=tk.LEFT, padx=5)
+        
+        self.scale_historial = tk.Scale(historial_frame, from_=0, to=0,
+                                        orient=tk.HORIZONTAL, length=300,
+                                        command=self._buscar_paso,
+                                        font=('Arial', 8), bg=self.COLOR_BLANCO,
+                                        highlightthickness=0)
+        self.scale_historial.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        
         tk.Label(vel_frame, text="⚡ Velocidad:", font=('Arial', 9, 'bold'),
                 bg=self.COLOR_BLANCO, fg=self.COLOR_PRIMARIO).pack(side=tk.LEFT, padx=5)
         
@@ -224,6 +276,30 @@ class InterfazSimulador:
                                        width=8)
         self.label_velocidad.pack(side=tk.LEFT, padx=5)
         
+        self.var_turbo = tk.BooleanVar(value=False)
+        tk.Checkbutton(vel_frame, text="🚀 Turbo", variable=self.var_turbo,
+                       font=('Arial', 9, 'bold'), bg=self.COLOR_BLANCO,
+                       fg=self.COLOR_PRIMARIO, activebackground=self.COLOR_BLANCO,
+                       cursor='hand2').pack(side=tk.LEFT, padx=5)
+                       
+        self.var_perfilar = tk.BooleanVar(value=False)
+        tk.Checkbutton(vel_frame, text="📊 Perfilar", variable=self.var_perfilar,
+                       command=self._cambiar_perfilado,
+                       font=('Arial', 9, 'bold'), bg=self.COLOR_BLANCO,
+                       fg=self.COLOR_PRIMARIO, activebackground=self.COLOR_BLANCO,
+                       cursor='hand2').pack(side=tk.LEFT, padx=5)
+                       
+        tk.Button(vel_frame, text="🔥 Perfil", command=self._mostrar_perfil,
+                  font=('Arial', 9, 'bold'), bg='#95A5A6',
+                  fg=self.COLOR_BLANCO, relief='flat',
+                  padx=10, pady=2, cursor='hand2').pack(side=tk.LEFT, padx=5)
+                  
+        self.label_rendimiento = tk.Label(vel_frame, text="",
+                                          font=('Arial', 9, 'bold'),
+                                          bg=self.COLOR_BLANCO, fg=self.COLOR_SECUNDARIO,
+                                          width=16)
+        self.label_rendimiento.pack(side=tk.LEFT, padx=5)
+        
     def _crear_seccion_cinta(self, parent):
         """Crea la sección de visualización de la cinta."""
         frame_cinta = ttk.LabelFrame(parent, text="📼  CINTA DE LA MÁQUINA DE TURING", 
@@ -235,6 +311,12 @@ class InterfazSimulador:
                                      highlightthickness=0)
         self.canvas_cinta.pack(fill=tk.BOTH, expand=True)
         
+        # Elementos del canvas reutilizados entre pasos
+        self._tamano_vista_cinta = None
+        self._ranuras_cinta = []
+        self._elementos_cabezal = ()
+        self._cabezal_visible = False
+        
     def _crear_seccion_estado(self, parent):
         """Crea la sección de estado de la máquina."""
         frame_estado = ttk.LabelFrame(parent, text="📊  ESTADO DE LA MÁQUINA", 
@@ -306,6 +388,13 @@ class InterfazSimulador:
         self.text_mensajes.pack(fill=tk.X)
         self.text_mensajes.config(state=tk.DISABLED)
         
+        # Nivel de detalle: registrar o no cada paso individual
+        self.var_registrar_pasos = tk.BooleanVar(value=True)
+        tk.Checkbutton(frame_mensajes, text="Registrar cada paso",
+                       variable=self.var_registrar_pasos, font=('Arial', 9),
+                       bg=self.COLOR_BLANCO, activebackground=self.COLOR_BLANCO,
+                       cursor='hand2').pack(anchor=tk.W, pady=(5, 0))
+        
         # Mensaje de bienvenida
         self._agregar_mensaje("✓ Simulador iniciado correctamente", "info")
         self._agregar_mensaje("► Seleccione una expresión regular e ingrese una cadena para comenzar", "info")
@@ -318,32 +407,31 @@ class InterfazSimulador:
             mensaje: Texto del mensaje
             tipo: Tipo de mensaje (info, success, error, warning)
         """
-        self.text_mensajes.config(state=tk.NORMAL)
-        
-        # Configurar colores según tipo
-        colores = {
-            "info": "#3498DB",
-            "success": "#27AE60",
-            "error": "#E74C3C",
-            "warning": "#F39C12"
-        }
-        
-        iconos = {
-            "info": "ℹ️",
-            "success": "✓",
-            "error": "✗",
-            "warning": "⚠️"
-        }
-        
-        color = colores.get(tipo, "#ECF0F1")
-        icono = iconos.get(tipo, "•")
-        
-        # Insertar mensaje con timestamp
-        import datetime
+        icono = self.ICONOS_MENSAJE.get(tipo, "•")
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         
-        self.text_mensajes.insert(tk.END, f"[{timestamp}] {icono} {mensaje}\n")
+        # Acumular el mensaje y volcarlo junto con los demás en el siguiente frame
+        self._mensajes_pendientes.append(f"[{timestamp}] {icono} {mensaje}\n")
+        if self._volcado_mensajes is None:
+            self._volcado_mensajes = self.root.after(16, self._volcar_mensajes)
+            
+    def _volcar_mensajes(self):
+        """Inserta de una vez los mensajes pendientes y recorta el historial."""
+        self._volcado_mensajes = None
+        if not self._mensajes_pendientes:
+            return
+            
+        texto = ''.join(self._mensajes_pendientes)
+        self._mensajes_pendientes.clear()
+        
+        self.text_mensajes.config(state=tk.NORMAL)
+        self.text_mensajes.insert(tk.END, texto)
         
+        # Conservar solo las últimas max_lineas_mensajes líneas
+        lineas = int(self.text_mensajes.index('end-1c').split('.')[0]) - 1
+        if lineas > self.max_lineas_mensajes:
+            self.text_mensajes.delete('1.0', f'{lineas - self.max_lineas_mensajes + 1}.0')
+            
         # Auto-scroll al final
         self.text_mensajes.see(tk.END)
         self.text_mensajes.config(state=tk.DISABLED)
@@ -372,16 +460,14 @@ class InterfazSimulador:
             
         exp_config = self.expresiones[indice]
         
-        # Crear la máquina de Turing
-        self.maquina = MaquinaTuring(
-            estados=exp_config['estados'],
-            alfabeto_entrada=exp_config['alfabeto_entrada'],
-            alfabeto_cinta=exp_config['alfabeto_cinta'],
-            transiciones=exp_config['transiciones'],
-            estado_inicial=exp_config['estado_inicial'],
-            simbolo_blanco=exp_config['simbolo_blanco'],
-            estados_aceptacion=exp_config['estados_aceptacion']
-        )
+        # Reutilizar la máquina de la expresión (se compila una sola vez)
+        if indice not in self._maquinas:
+            maquina = MaquinaTuring.desde_configuracion(exp_config)
+            maquina.compilar()
+            self._maquinas[indice] = maquina
+        self.maquina = self._maquinas[indice]
+        self._aplicar_perfilado()
+        self._aplicar_historial()
         
         # Cargar la cadena
         self.maquina.cargar_cadena(cadena)
@@ -412,9 +498,10 @@ class InterfazSimulador:
         # Actualizar visualización
         self._actualizar_visualizacion()
         
-        self._agregar_mensaje(
-            f"Paso {self.maquina.pasos_ejecutados}: Estado {self.maquina.estado_actual}", "info"
-        )
+        if self.var_registrar_pasos.get():
+            self._agregar_mensaje(
+                f"Paso {self.maquina.pasos_ejecutados}: Estado {self.maquina.estado_actual}", "info"
+            )
         
         if not puede_continuar:
             self._mostrar_resultado()
@@ -436,7 +523,11 @@ class InterfazSimulador:
         
         self._agregar_mensaje("Iniciando ejecución automática...", "info")
         
-        self._paso_automatico()
+        if self.var_turbo.get():
+            self._inicio_frame = time.perf_counter()
+            self._paso_turbo()
+        else:
+            self._paso_automatico()
         
     def _paso_automatico(self):
         """Ejecuta un paso automático con delay."""
@@ -458,6 +549,59 @@ class InterfazSimulador:
             if self.maquina.cadena_aceptada is not None:
                 self._mostrar_resultado()
                 
+    def _paso_turbo(self):
+        """
+        Ejecuta tantos pasos como quepan en el presupuesto de un frame y
+        redibuja una sola vez al final del frame.
+        """
+        if self.maquina is None:
+            return
+            
+        if not self.ejecutando:
+            # Detenido por el usuario: mostrar el estado alcanzado
+            self._actualizar_visualizacion()
+            return
+            
+        inicio = time.perf_counter()
+        pasos_antes = self.maquina.pasos_ejecutados
+        
+        # Ejecutar lotes hasta agotar el presupuesto, ajustando su tamaño
+        # para que cada lote ocupe una fracción pequeña del frame
+        while True:
+            inicio_lote = time.perf_counter()
+            puede_continuar = self.maquina.ejecutar_lote(self._lote_turbo)
+            fin_lote = time.perf_counter()
+            
+            if fin_lote - inicio_lote < self.presupuesto_frame / 8:
+                self._lote_turbo *= 2
+            elif fin_lote - inicio_lote > self.presupuesto_frame / 2 and self._lote_turbo > 1:
+                self._lote_turbo //= 2
+                
+            if not puede_continuar or fin_lote - inicio >= self.presupuesto_frame:
+                break
+                
+        # Pasos por segundo contando también el dibujo del frame anterior
+        pasos_frame = self.maquina.pasos_ejecutados - pasos_antes
+        ahora = time.perf_counter()
+        pasos_por_segundo = pasos_frame / max(ahora - self._inicio_frame, 1e-9)
+        self._inicio_frame = ahora
+        self.label_rendimiento.config(text=f"{pasos_por_segundo:,.0f} pasos/s")
+        
+        if not puede_continuar or not self.ejecutando:
+            self._actualizar_visualizacion()
+            self._detener()
+            if self.maquina.cadena_aceptada is not None:
+                self._mostrar_resultado()
+            return
+            
+        if pasos_frame > self.umbral_sin_dibujo:
+            # Demasiado rápido para seguirlo: solo actualizar el contador
+            self.label_pasos.config(text=str(self.maquina.pasos_ejecutados))
+        else:
+            self._actualizar_visualizacion()
+            
+        self.root.after(1, self._paso_turbo)
+        
     def _detener(self):
         """Detiene la ejecución automática."""
         self.ejecutando = False
@@ -473,7 +617,12 @@ class InterfazSimulador:
         self._detener()
         if self.maquina is not None:
             cadena_original = self.entry_cadena.get()
-            self.maquina.cargar_cadena(cadena_original)
+            historial = self.maquina.historial
+            if historial is not None and self.maquina.cadena_cargada == cadena_original:
+                # Volver al principio conservando el historial
+                self.maquina.ir_a_paso(historial.inicio)
+            else:
+                self.maquina.cargar_cadena(cadena_original)
             self._actualizar_visualizacion()
             self.label_resultado.config(text="En proceso", bg='#95A5A6')
             self._agregar_mensaje("Simulación reiniciada", "info")
@@ -491,7 +640,7 @@ class InterfazSimulador:
         if self.maquina is None:
             return
             
-        estado = self.maquina.obtener_estado()
+        estado = self.maquina.obtener_instantanea(self._radio_visible())
         
         # Actualizar labels de estado
         self.label_estado_actual.config(text=estado['estado'])
@@ -501,90 +650,145 @@ class InterfazSimulador:
         # Dibujar la cinta
         self._dibujar_cinta(estado['cinta'], estado['posicion_cabezal'])
         
-    def _dibujar_cinta(self, cinta_contenido, posicion_cabezal):
-        """Dibuja la cinta en el canvas."""
-        self.canvas_cinta.delete("all")
-        
+        historial = self.maquina.historial
+        if historial is not None:
+            self.scale_historial.config(from_=historial.inicio, to=historial.fin)
+            self.scale_historial.set(estado['pasos'])
+            
+        if self._ventana_perfil is not None:
+            self._actualizar_perfil()
+            
+    def _radio_visible(self):
+        """Calcula cuántas celdas caben a cada lado del cabezal en el canvas."""
         ancho = self.canvas_cinta.winfo_width()
         if ancho <= 1:
             ancho = 1000
-            
-        alto = self.canvas_cinta.winfo_height()
-        if alto <= 1:
-            alto = 150
-            
+        return ancho // 60 // 2 + 2
+        
+    def _crear_elementos_cinta(self, ancho, alto):
+        """
+        Crea los elementos del canvas de la cinta para un tamaño de vista.
+        
+        Cada ranura ocupa una posición fija relativa al cabezal; al avanzar
+        solo se actualizan los textos de las ranuras que cambian.
+        """
+        self.canvas_cinta.delete("all")
+        self._ranuras_cinta = []
+        self._tamano_vista_cinta = (ancho, alto)
+        
         celda_ancho = 60
         celda_alto = 70
         
-        # Obtener posiciones para mostrar
-        posiciones = sorted(cinta_contenido.keys())
-        if not posiciones:
-            return
-            
         # Centrar en el cabezal
         inicio_x = (ancho - celda_ancho) // 2
+        y = (alto - celda_alto) // 2 + 20
+        radio = ancho // celda_ancho // 2 + 2
         
-        for i, pos in enumerate(posiciones):
-            offset = pos - posicion_cabezal
+        for offset in range(-radio, radio + 1):
             x = inicio_x + offset * celda_ancho
             
-            # Solo dibujar si está visible
-            if -celda_ancho < x < ancho:
-                y = (alto - celda_alto) // 2 + 20
-                
-                # Color de la celda
-                if pos == posicion_cabezal:
-                    color_fondo = '#FFD700'
-                    color_borde = '#F39C12'
-                    grosor = 4
-                else:
-                    color_fondo = '#F8F9FA'
-                    color_borde = '#BDC3C7'
-                    grosor = 2
-                
-                # Dibujar celda con sombra
-                self.canvas_cinta.create_rectangle(x+2, y+2, x + celda_ancho+2, 
-                                                  y + celda_alto+2,
-                                                  fill='#BDC3C7', outline='')
-                
-                self.canvas_cinta.create_rectangle(x, y, x + celda_ancho, y + celda_alto,
-                                                   fill=color_fondo, outline=color_borde, 
-                                                   width=grosor)
-                
-                # Dibujar símbolo
-                simbolo = cinta_contenido[pos]
-                self.canvas_cinta.create_text(x + celda_ancho//2, y + celda_alto//2,
-                                             text=simbolo, font=('Courier', 20, 'bold'),
-                                             fill=self.COLOR_PRIMARIO)
+            # Solo crear las ranuras visibles
+            if not -celda_ancho < x < ancho:
+                continue
                 
-                # Dibujar posición
-                self.canvas_cinta.create_text(x + celda_ancho//2, y + celda_alto + 10,
-                                             text=str(pos), font=('Arial', 9),
-                                             fill='#7F8C8D')
+            # Color de la celda (la ranura central es siempre la del cabezal)
+            if offset == 0:
+                color_fondo = '#FFD700'
+                color_borde = '#F39C12'
+                grosor = 4
+            else:
+                color_fondo = '#F8F9FA'
+                color_borde = '#BDC3C7'
+                grosor = 2
                 
-        # Dibujar cabezal (flecha mejorada)
-        if posicion_cabezal in cinta_contenido:
-            x_cabezal = inicio_x + celda_ancho // 2
-            y_cabezal = (alto - celda_alto) // 2 - 15
-            
-            # Flecha con sombra
+            # Celda con sombra, símbolo y posición
+            sombra = self.canvas_cinta.create_rectangle(x+2, y+2, x + celda_ancho+2,
+                                                        y + celda_alto+2,
+                                                        fill='#BDC3C7', outline='',
+                                                        state=tk.HIDDEN)
+            celda = self.canvas_cinta.create_rectangle(x, y, x + celda_ancho, y + celda_alto,
+                                                       fill=color_fondo, outline=color_borde,
+                                                       width=grosor, state=tk.HIDDEN)
+            texto_simbolo = self.canvas_cinta.create_text(x + celda_ancho//2, y + celda_alto//2,
+                                                          text='', font=('Courier', 20, 'bold'),
+                                                          fill=self.COLOR_PRIMARIO,
+                                                          state=tk.HIDDEN)
+            texto_posicion = self.canvas_cinta.create_text(x + celda_ancho//2, y + celda_alto + 10,
+                                                           text='', font=('Arial', 9),
+                                                           fill='#7F8C8D', state=tk.HIDDEN)
+                                                           
+            # [offset, elementos, símbolo mostrado, posición mostrada]
+            self._ranuras_cinta.append([offset,
+                                        (sombra, celda, texto_simbolo, texto_posicion),
+                                        None, None])
+                                        
+        # Cabezal (flecha con sombra)
+        x_cabezal = inicio_x + celda_ancho // 2
+        y_cabezal = (alto - celda_alto) // 2 - 15
+        
+        self._elementos_cabezal = (
             self.canvas_cinta.create_polygon(
                 x_cabezal+2, y_cabezal+2,
                 x_cabezal - 12+2, y_cabezal - 20+2,
                 x_cabezal + 12+2, y_cabezal - 20+2,
-                fill='#95A5A6', outline=''
-            )
-            
+                fill='#95A5A6', outline='', state=tk.HIDDEN
+            ),
             self.canvas_cinta.create_polygon(
                 x_cabezal, y_cabezal,
                 x_cabezal - 12, y_cabezal - 20,
                 x_cabezal + 12, y_cabezal - 20,
-                fill='#E74C3C', outline='#C0392B', width=2
-            )
-            
+                fill='#E74C3C', outline='#C0392B', width=2, state=tk.HIDDEN
+            ),
             self.canvas_cinta.create_text(x_cabezal, y_cabezal - 35,
-                                         text="▼ CABEZAL", font=('Arial', 10, 'bold'),
-                                         fill='#E74C3C')
+                                          text="▼ CABEZAL", font=('Arial', 10, 'bold'),
+                                          fill='#E74C3C', state=tk.HIDDEN)
+        )
+        self._cabezal_visible = False
+        
+    def _dibujar_cinta(self, cinta_contenido, posicion_cabezal):
+        """Dibuja la cinta en el canvas."""
+        ancho = self.canvas_cinta.winfo_width()
+        if ancho <= 1:
+            ancho = 1000
+            
+        alto = self.canvas_cinta.winfo_height()
+        if alto <= 1:
+            alto = 150
+            
+        # Los elementos solo se recrean si cambia el tamaño de la vista
+        if self._tamano_vista_cinta != (ancho, alto):
+            self._crear_elementos_cinta(ancho, alto)
+            
+        for ranura in self._ranuras_cinta:
+            offset, elementos, simbolo_previo, posicion_previa = ranura
+            pos = posicion_cabezal + offset
+            simbolo = cinta_contenido.get(pos)
+            
+            if simbolo is None:
+                # Fuera del contenido: ocultar la ranura
+                if simbolo_previo is not None:
+                    for elemento in elementos:
+                        self.canvas_cinta.itemconfigure(elemento, state=tk.HIDDEN)
+                    ranura[2] = ranura[3] = None
+                continue
+                
+            if simbolo_previo is None:
+                for elemento in elementos:
+                    self.canvas_cinta.itemconfigure(elemento, state=tk.NORMAL)
+            if simbolo != simbolo_previo:
+                self.canvas_cinta.itemconfigure(elementos[2], text=simbolo)
+                ranura[2] = simbolo
+            if pos != posicion_previa:
+                self.canvas_cinta.itemconfigure(elementos[3], text=str(pos))
+                ranura[3] = pos
+                
+        # Mostrar el cabezal solo si su celda es visible
+        cabezal_visible = posicion_cabezal in cinta_contenido
+        if cabezal_visible != self._cabezal_visible:
+            estado = tk.NORMAL if cabezal_visible else tk.HIDDEN
+            for elemento in self._elementos_cabezal:
+                self.canvas_cinta.itemconfigure(elemento, state=estado)
+            self._cabezal_visible = cabezal_visible
             
     def _mostrar_resultado(self):
         """Muestra el resultado de la simulación."""
@@ -604,6 +808,191 @@ class InterfazSimulador:
                 "error"
             )
             
+    def _cambiar_historial(self):
+        """Activa o desactiva el historial según la casilla."""
+        self._aplicar_historial()
+        if self.var_historial.get():
+            self._agregar_mensaje(
+                "Historial activado: se puede volver a cualquier paso ejecutado", "info"
+            )
+        else:
+            self._agregar_mensaje("Historial desactivado", "info")
+            
+    def _aplicar_historial(self):
+        """
+        Activa o desactiva el historial de la máquina actual.
+        
+        Con el historial activo, las cadenas se cargan en una CintaPaginada
+        para que los puntos de control no copien la cinta entera.
+        """
+        if self.maquina is None:
+            return
+        if not self.var_historial.get():
+            self.maquina.clase_cinta = None
+            self.maquina.desactivar_historial()
+            self.scale_historial.config(from_=0, to=0)
+        else:
+            self.maquina.clase_cinta = CintaPaginada
+            if self.maquina.historial is None:
+                self.maquina.activar_historial()
+            
+    def _retroceder_paso(self):
+        """Deshace el último paso ejecutado."""
+        if self.maquina is None or self.maquina.historial is None:
+            self._agregar_mensaje("Active 'Historial' y cargue una cadena para retroceder", "warning")
+            return
+        if self.maquina.pasos_ejecutados <= self.maquina.historial.inicio:
+            self._agregar_mensaje("No hay pasos anteriores en el historial", "info")
+            return
+        self._buscar_paso(self.maquina.pasos_ejecutados - 1)
+        
+    def _buscar_paso(self, valor):
+        """Lleva la máquina al paso indicado por el deslizador del historial."""
+        if self.maquina is None or self.maquina.historial is None:
+            return
+        paso = int(float(valor))
+        if paso == self.maquina.pasos_ejecutados:
+            return
+            
+        if self.ejecutando:
+            self._detener()
+        self.maquina.ir_a_paso(paso)
+        self._actualizar_visualizacion()
+        
+        if self.maquina.cadena_aceptada is None:
+            self.label_resultado.config(text="En proceso", bg='#95A5A6')
+        elif self.maquina.cadena_aceptada:
+            self.label_resultado.config(text="✓ ACEPTADA", bg=self.COLOR_EXITO)
+        else:
+            self.label_resultado.config(text="✗ RECHAZADA", bg=self.COLOR_ERROR)
+            
+    def _cambiar_perfilado(self):
+        """Activa o desactiva el perfilado según la casilla."""
+        self._aplicar_perfilado()
+        if self.var_perfilar.get():
+            self._agregar_mensaje(
+                "Perfilado activado: la ejecución se hace paso a paso", "info"
+            )
+        else:
+            self._agregar_mensaje("Perfilado desactivado", "info")
+            
+    def _aplicar_perfilado(self):
+        """Activa o desactiva el perfilador de la máquina actual."""
+        if self.maquina is None:
+            return
+        if self.var_perfilar.get():
+            self.maquina.activar_perfilado()
+        else:
+            self.maquina.desactivar_perfilado()
+            
+    def _mostrar_perfil(self):
+        """Abre la ventana con el mapa de calor de las transiciones."""
+        if self.maquina is None or self.maquina.perfilador is None:
+            self._agregar_mensaje(
+                "Active 'Perfilar' y cargue una cadena para ver el perfil", "warning"
+            )
+            return
+            
+        if self._ventana_perfil is None:
+            self._ventana_perfil = tk.Toplevel(self.root)
+            self._ventana_perfil.title("Perfil de la ejecución")
+            self._ventana_perfil.configure(bg=self.COLOR_FONDO)
+            self._ventana_perfil.protocol("WM_DELETE_WINDOW", self._cerrar_perfil)
+            self._maquina_perfil = None
+        else:
+            self._ventana_perfil.lift()
+            
+        self._actualizar_perfil()
+        
+    def _cerrar_perfil(self):
+        """Cierra la ventana del perfil."""
+        self._ventana_perfil.destroy()
+        self._ventana_perfil = None
+        self._maquina_perfil = None
+        self._celdas_perfil = {}
+        
+    def _construir_perfil(self):
+        """Crea la tabla de transiciones de la máquina actual en la ventana del perfil."""
+        ventana = self._ventana_perfil
+        for hijo in ventana.winfo_children():
+            hijo.destroy()
+            
+        maquina = self.maquina
+        estados = sorted(maquina.estados, key=lambda e: (e != maquina.estado_inicial, e))
+        simbolos = sorted(maquina.alfabeto_cinta | {maquina.simbolo_blanco})
+        
+        tabla = tk.Frame(ventana, bg=self.COLOR_BLANCO, padx=10, pady=10)
+        tabla.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+        
+        tk.Label(tabla, text="Estado \\ Símbolo", font=('Arial', 9, 'bold'),
+                 bg=self.COLOR_BLANCO, fg=self.COLOR_PRIMARIO).grid(row=0, column=0, padx=2, pady=2)
+        for columna, simbolo in enumerate(simbolos, start=1):
+            tk.Label(tabla, text=simbolo, font=('Courier', 11, 'bold'),
+                     bg=self.COLOR_BLANCO, fg=self.COLOR_PRIMARIO).grid(row=0, column=columna, padx=2, pady=2)
+                     
+        self._celdas_perfil = {}
+        for fila, estado in enumerate(estados, start=1):
+            tk.Label(tabla, text=estado, font=('Courier', 11, 'bold'),
+                     bg=self.COLOR_BLANCO, fg=self.COLOR_PRIMARIO).grid(row=fila, column=0, padx=2, pady=2)
+            for columna, simbolo in enumerate(simbolos, start=1):
+                definida = (estado, simbolo) in maquina.transiciones
+                celda = tk.Label(tabla, text="0" if definida else "—", width=8,
+                                 font=('Courier', 10), relief='solid', borderwidth=1,
+                                 bg=self.COLOR_BLANCO if definida else '#BDC3C7')
+                celda.grid(row=fila, column=columna, padx=1, pady=1)
+                if definida:
+                    self._celdas_perfil[(estado, simbolo)] = celda
+                    
+        self._label_resumen_perfil = tk.Label(ventana, text="", justify=tk.LEFT,
+                                              font=('Consolas', 9), anchor=tk.W,
+                                              bg=self.COLOR_FONDO, fg=self.COLOR_PRIMARIO)
+        self._label_resumen_perfil.pack(fill=tk.X, padx=10)
+        
+        tk.Button(ventana, text="🔄 Reiniciar contadores", command=self._reiniciar_perfil,
+                  font=('Arial', 9, 'bold'), bg='#E67E22',
+                  fg=self.COLOR_BLANCO, relief='flat',
+                  padx=15, pady=5, cursor='hand2').pack(pady=10)
+                  
+        self._maquina_perfil = maquina
+        
+    def _actualizar_perfil(self):
+        """Colorea la tabla del perfil según la frecuencia de cada transición."""
+        maquina = self.maquina
+        perfilador = maquina.perfilador if maquina is not None else None
+        if perfilador is None:
+            return
+        if self._maquina_perfil is not maquina:
+            self._construir_perfil()
+            
+        # El máximo se calcula una vez por refresco, no una por celda
+        maximo = perfilador.maximo_transicion
+        for clave, celda in self._celdas_perfil.items():
+            celda.config(text=str(perfilador.transiciones[clave]),
+                         bg=self._color_calor(perfilador.intensidad(clave, maximo)))
+                         
+        movimientos = perfilador.movimientos
+        lineas = [
+            f"Pasos: {perfilador.total_pasos}   "
+            f"Movimientos: ← {movimientos['L']}  → {movimientos['R']}  · {movimientos['S']}   "
+            f"Celdas visitadas: {len(perfilador.visitas_celda)}"
+        ]
+        for estado, pasos in perfilador.pasos_por_estado.most_common():
+            milisegundos = perfilador.tiempo_por_estado[estado] * 1000
+            lineas.append(f"  {estado}: {pasos} pasos, {milisegundos:.2f} ms")
+        self._label_resumen_perfil.config(text="\n".join(lineas))
+        
+    def _reiniciar_perfil(self):
+        """Pone a cero los contadores del perfil."""
+        if self.maquina is not None and self.maquina.perfilador is not None:
+            self.maquina.perfilador.reiniciar()
+            self._actualizar_perfil()
+            
+    def _color_calor(self, intensidad):
+        """Color entre blanco (0) y rojo (1) para el mapa de calor."""
+        rojo = (0xE7, 0x4C, 0x3C)
+        r, g, b = (round(255 + (componente - 255) * intensidad) for componente in rojo)
+        return f"#{r:02X}{g:02X}{b:02X}"
+        
 def main():
     """Función principal."""
     root = tk.Tk()
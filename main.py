@@ -8,9 +8,21 @@ Fecha: Noviembre 2025
 Curso: Teoría de la Computación
 """
 
+import argparse
+import json
+import os
+import subprocess
 import sys
-import tkinter as tk
-from tkinter import messagebox
+import time
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+# Módulos del núcleo que usa la línea de comandos; no deben cargar tkinter
+MODULOS_NUCLEO = ('cinta', 'programa_compilado', 'analisis_estatico',
+                  'maquina_turing', 'expresiones_regulares')
+
+# Presupuestos de arranque en milisegundos
+PRESUPUESTO_IMPORTACION_MS = 60
+PRESUPUESTO_ARRANQUE_MS = 250
 
 def verificar_dependencias():
     """
@@ -30,9 +42,235 @@ def verificar_dependencias():
         print("  - macOS: brew install python-tk")
         return False
 
-def main():
+def resolver_maquina(especificacion: str) -> Dict:
+    """
+    Obtiene la configuración de una máquina a partir de su especificación.
+    
+    Args:
+        especificacion: Número de una expresión del catálogo (empezando en
+            1), nombre de una expresión del catálogo o cualquier otra
+            expresión regular, que se compila
+            
+    Returns:
+        Diccionario con la definición de la máquina
+        
+    Raises:
+        ValueError: Si el número no corresponde a ninguna expresión del
+            catálogo o la expresión regular no es válida
+    """
+    from expresiones_regulares import ExpresionesRegulares
+    if especificacion.isdigit():
+        return ExpresionesRegulares.obtener_expresion(int(especificacion))
+    for config in ExpresionesRegulares.obtener_todas():
+        if config['nombre'] == especificacion:
+            return config
+    return ExpresionesRegulares.obtener_desde_regex(especificacion)
+    
+def leer_cadenas(entrada: TextIO) -> Iterable[str]:
+    """Lee las cadenas de entrada, una por línea, sin el salto de línea."""
+    for linea in entrada:
+        yield linea.rstrip('\r\n')
+        
+def ejecutar_lote_cli(config: Dict, cadenas: Iterable[str], salida: TextIO,
+                      max_pasos: Optional[int] = None, detectar_ciclos: bool = False):
+    """
+    Ejecuta la máquina sobre cada cadena y escribe una línea JSON por resultado.
+    
+    Las cadenas se procesan y escriben de una en una, de modo que la
+    memoria usada no depende del número de cadenas.
+    
+    Args:
+        config: Diccionario con la definición de la máquina
+        cadenas: Cadenas de entrada
+        salida: Flujo donde se escriben los resultados
+        max_pasos: Máximo número de pasos por cadena; por defecto, la cota
+            demostrada por el análisis estático si la hay, o 1000
+        detectar_ciclos: Si es True, el veredicto puede ser 'ciclo'
+    """
+    from maquina_turing import MaquinaTuring, Veredicto
+    maquina = MaquinaTuring.desde_configuracion(config)
+    programa = maquina.compilar()
+    directo = programa.compacto and not detectar_ciclos
+    
+    for numero, cadena in enumerate(cadenas, 1):
+        limite = programa.limite_pasos(len(cadena), max_pasos)
+        if directo:
+            aceptada, pasos, estado = programa.decidir(cadena, limite)
+            veredicto = (Veredicto.ACEPTADA if aceptada else Veredicto.RECHAZADA).value
+        else:
+            maquina.cargar_cadena(cadena)
+            maquina.ejecutar_completo(limite, detectar_ciclos)
+            pasos, estado = maquina.pasos_ejecutados, maquina.estado_actual
+            veredicto = maquina.veredicto.value
+            
+        salida.write(json.dumps({'linea': numero, 'cadena': cadena, 'veredicto': veredicto,
+                                 'pasos': pasos, 'estado': estado}, ensure_ascii=False))
+        salida.write('\n')
+        
+def comando_run(argumentos: argparse.Namespace) -> int:
+    """
+    Ejecuta el subcomando run sin interfaz gráfica.
+    
+    Returns:
+        Código de salida del proceso
+    """
+    try:
+        config = resolver_maquina(argumentos.machine)
+    except ValueError as e:
+        print(f"Error en la máquina: {e}", file=sys.stderr)
+        return 2
+        
+    if argumentos.input and argumentos.input != '-':
+        try:
+            entrada = open(argumentos.input, encoding='utf-8')
+        except OSError as e:
+            print(f"Error al abrir la entrada: {e}", file=sys.stderr)
+            return 2
+    else:
+        entrada = sys.stdin
+        
+    try:
+        ejecutar_lote_cli(config, leer_cadenas(entrada), sys.stdout,
+                          argumentos.max_pasos, argumentos.detectar_ciclos)
+    except BrokenPipeError:
+        # El proceso que lee la salida terminó antes (por ejemplo, head):
+        # redirigir la salida para que el cierre final no vuelva a fallar
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+    return 0
+    
+def medir_importacion(modulos: Iterable[str]) -> Tuple[float, List[Tuple[str, int, int]], bool]:
+    """
+    Mide en un intérprete nuevo lo que cuesta importar los módulos dados.
+    
+    Args:
+        modulos: Nombres de los módulos a importar
+        
+    Returns:
+        Tupla (tiempo total en ms, desglose, True si se cargó tkinter); el
+        desglose es una lista de tuplas (módulo, microsegundos propios,
+        microsegundos acumulados) según -X importtime
+    """
+    codigo = ("import sys, time\n"
+              "sys.stderr.write('--inicio--\\n')\n"
+              "t = time.perf_counter()\n"
+              f"import {', '.join(modulos)}\n"
+              "print((time.perf_counter() - t) * 1000)\n"
+              "print('tkinter' in sys.modules)\n")
+    resultado = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo],
+                               cwd=os.path.dirname(os.path.abspath(__file__)),
+                               capture_output=True, text=True, check=True)
+    total, carga_tk = resultado.stdout.split()
+    
+    desglose = []
+    lineas = resultado.stderr.splitlines()
+    for linea in lineas[lineas.index('--inicio--') + 1:]:
+        if linea.startswith('import time:') and '|' in linea:
+            propio, acumulado, nombre = linea[len('import time:'):].split('|')
+            if propio.strip().isdigit():
+                desglose.append((nombre.strip(), int(propio), int(acumulado)))
+    return float(total), desglose, carga_tk == 'True'
+    
+def medir_arranque(repeticiones: int = 5) -> float:
+    """
+    Mide el arranque completo de la línea de comandos sin cadenas de entrada.
+    
+    Args:
+        repeticiones: Número de ejecuciones; se toma la más rápida
+        
+    Returns:
+        Tiempo en milisegundos
+    """
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, os.path.abspath(__file__), 'run', '--machine', '1'],
+                       stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, check=True)
+        mejor = min(mejor, (time.perf_counter() - inicio) * 1000)
+    return mejor
+    
+def comando_arranque(argumentos: argparse.Namespace) -> int:
+    """
+    Muestra el desglose del tiempo de arranque y lo compara con el presupuesto.
+    
+    Returns:
+        0 si se cumple el presupuesto, 1 en caso contrario
+    """
+    total, desglose, carga_tk = medir_importacion(MODULOS_NUCLEO)
+    arranque = medir_arranque()
+    
+    print("Importaciones más lentas (ms propios / acumulados):")
+    for nombre, propio, acumulado in sorted(desglose, key=lambda d: -d[1])[:argumentos.top]:
+        print(f"  {propio / 1000:7.2f} {acumulado / 1000:7.2f}  {nombre}")
+    print(f"Importación del núcleo: {total:.1f} ms (presupuesto {argumentos.presupuesto_importacion} ms)")
+    print(f"Arranque de 'run': {arranque:.1f} ms (presupuesto {argumentos.presupuesto_arranque} ms)")
+    
+    correcto = True
+    if carga_tk:
+        print("✗ El núcleo importa tkinter")
+        correcto = False
+    if total > argumentos.presupuesto_importacion:
+        print("✗ La importación del núcleo supera el presupuesto")
+        correcto = False
+    if arranque > argumentos.presupuesto_arranque:
+        print("✗ El arranque supera el presupuesto")
+        correcto = False
+    if correcto:
+        print("✓ Arranque dentro del presupuesto")
+    return 0 if correcto else 1
+    
+def crear_parser() -> argparse.ArgumentParser:
+    """Crea el analizador de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Simulador de Máquina de Turing")
+    subcomandos = parser.add_subparsers(dest='comando')
+    
+    subcomandos.add_parser('gui', help="Inicia la interfaz gráfica (por defecto)")
+    
+    run = subcomandos.add_parser(
+        'run', help="Ejecuta una máquina sobre cadenas leídas línea a línea y "
+                    "escribe los resultados en JSONL, sin interfaz gráfica")
+    run.add_argument('--machine', '-m', required=True,
+                     help="Número o nombre de una expresión del catálogo, o una "
+                          "expresión regular cualquiera")
+    run.add_argument('--input', '-i',
+                     help="Archivo con una cadena por línea (por defecto, la entrada estándar)")
+    run.add_argument('--max-pasos', type=int, dest='max_pasos',
+                     help="Máximo número de pasos por cadena (por defecto, la cota "
+                          "demostrada si la hay, o 1000)")
+    run.add_argument('--detectar-ciclos', action='store_true', dest='detectar_ciclos',
+                     help="Detener las ejecuciones que no terminan con el veredicto 'ciclo'")
+    
+    arranque = subcomandos.add_parser(
+        'arranque', help="Mide el tiempo de arranque y falla si supera el presupuesto")
+    arranque.add_argument('--presupuesto-importacion', type=float,
+                          default=PRESUPUESTO_IMPORTACION_MS, dest='presupuesto_importacion',
+                          help="Máximo tiempo de importación del núcleo en ms")
+    arranque.add_argument('--presupuesto-arranque', type=float,
+                          default=PRESUPUESTO_ARRANQUE_MS, dest='presupuesto_arranque',
+                          help="Máximo tiempo de arranque de 'run' en ms")
+    arranque.add_argument('--top', type=int, default=10,
+                          help="Número de importaciones más lentas que se muestran")
+    return parser
+    
+def main(argv: Optional[List[str]] = None):
+    """
+    Función principal: sin argumentos inicia la interfaz gráfica.
+    
+    Args:
+        argv: Argumentos de la línea de comandos (por defecto, sys.argv)
+    """
+    argumentos = crear_parser().parse_args(argv)
+    if argumentos.comando == 'run':
+        sys.exit(comando_run(argumentos))
+    if argumentos.comando == 'arranque':
+        sys.exit(comando_arranque(argumentos))
+    iniciar_interfaz()
+    
+def iniciar_interfaz():
     """
-    Función principal que inicia el simulador.
+    Inicia el simulador con la interfaz gráfica.
     """
     print("=" * 60)
     print("  SIMULADOR DE MÁQUINA DE TURING")
@@ -47,6 +285,7 @@ def main():
     
     try:
         # Importar la interfaz gráfica
+        import tkinter as tk
         from interfaz_grafica import InterfazSimulador
         
         # Crear ventana principal
@@ -0,0 +1,267 @@
+"""
+Simulador de Máquina de Turing
+Archivo: maquina_multicinta.py
+Descripción: Máquina de Turing determinista con varias cintas
+"""
+
+from typing import Dict, List, Optional, Set
+
+from cinta import CintaCompacta
+from maquina_turing import DESPLAZAMIENTOS, Veredicto, _copiar_cinta
+
+class MaquinaMulticinta:
+    """
+    Implementa una Máquina de Turing determinista de k cintas.
+    
+    Cada cinta tiene su propio cabezal. Las transiciones se indexan por el
+    estado y la tupla de símbolos leídos, y dan el nuevo estado, la tupla de
+    símbolos a escribir y la tupla de movimientos:
+    
+        (estado, (s1, ..., sk)) -> (nuevo_estado, (e1, ..., ek), (d1, ..., dk))
+        
+    La entrada se carga en la primera cinta; las demás empiezan en blanco.
+    """
+    
+    def __init__(self, estados: Set[str], alfabeto_entrada: Set[str],
+                 alfabeto_cinta: Set[str], transiciones: Dict,
+                 estado_inicial: str, simbolo_blanco: str,
+                 estados_aceptacion: Set[str], num_cintas: int,
+                 clase_cinta: Optional[type] = None):
+        """
+        Inicializa la máquina.
+        
+        Args:
+            estados: Conjunto de estados
+            alfabeto_entrada: Alfabeto de entrada
+            alfabeto_cinta: Alfabeto de las cintas
+            transiciones: Función de transición sobre tuplas de símbolos
+            estado_inicial: Estado inicial
+            simbolo_blanco: Símbolo blanco
+            estados_aceptacion: Estados de aceptación
+            num_cintas: Número de cintas
+            clase_cinta: Implementación de las cintas; por defecto CintaCompacta
+            
+        Raises:
+            ValueError: Si alguna transición no tiene un símbolo, una
+                escritura y un movimiento por cinta
+        """
+        if num_cintas < 1:
+            raise ValueError("La máquina necesita al menos una cinta")
+            
+        self.estados = estados
+        self.alfabeto_entrada = alfabeto_entrada
+        self.alfabeto_cinta = alfabeto_cinta
+        self.transiciones = transiciones
+        self.estado_inicial = estado_inicial
+        self.simbolo_blanco = simbolo_blanco
+        self.estados_aceptacion = estados_aceptacion
+        self.num_cintas = num_cintas
+        self.clase_cinta = clase_cinta
+        
+        # Transiciones con los movimientos ya traducidos a desplazamientos
+        self._tabla = {}
+        for (estado, leidos), (nuevo_estado, escritos, direcciones) in transiciones.items():
+            if not len(leidos) == len(escritos) == len(direcciones) == num_cintas:
+                raise ValueError(
+                    f"La transición desde ({estado}, {leidos}) no tiene {num_cintas} cintas"
+                )
+            desplazamientos = tuple(DESPLAZAMIENTOS[d] for d in direcciones)
+            self._tabla[(estado, tuple(leidos))] = (nuevo_estado, tuple(escritos),
+                                                    desplazamientos)
+                                                    
+        # Estado de ejecución
+        self.estado_actual = None
+        self.cintas = []
+        self.posiciones_cabezal = []
+        self.pasos_ejecutados = 0
+        self.cadena_aceptada = None
+        
+    @classmethod
+    def desde_configuracion(cls, config: Dict,
+                            clase_cinta: Optional[type] = None) -> 'MaquinaMulticinta':
+        """
+        Crea una máquina a partir de un diccionario de configuración con la
+        clave 'num_cintas', como los de
+        ExpresionesRegulares.obtener_todas_multicinta.
+        
+        Args:
+            config: Diccionario con la definición de la máquina
+            clase_cinta: Implementación de las cintas
+            
+        Returns:
+            Máquina multicinta configurada
+        """
+        return cls(
+            estados=config['estados'],
+            alfabeto_entrada=config['alfabeto_entrada'],
+            alfabeto_cinta=config['alfabeto_cinta'],
+            transiciones=config['transiciones'],
+            estado_inicial=config['estado_inicial'],
+            simbolo_blanco=config['simbolo_blanco'],
+            estados_aceptacion=config['estados_aceptacion'],
+            num_cintas=config['num_cintas'],
+            clase_cinta=clase_cinta
+        )
+        
+    def cargar_cadena(self, cadena: str):
+        """
+        Carga una cadena en la primera cinta, deja las demás en blanco y
+        reinicia la máquina.
+        
+        Args:
+            cadena: Cadena de entrada
+        """
+        clase_cinta = self.clase_cinta or CintaCompacta
+        blanco = self.simbolo_blanco
+        self.cintas = [clase_cinta(cadena if cadena else blanco, blanco)]
+        self.cintas.extend(clase_cinta(blanco, blanco) for _ in range(self.num_cintas - 1))
+        self.posiciones_cabezal = [0] * self.num_cintas
+        self.estado_actual = self.estado_inicial
+        self.pasos_ejecutados = 0
+        self.cadena_aceptada = None
+        
+    def paso(self) -> bool:
+        """
+        Ejecuta un paso de la máquina.
+        
+        Returns:
+            True si puede continuar, False si terminó
+        """
+        if self.cadena_aceptada is not None:
+            return False
+            
+        cintas = self.cintas
+        posiciones = self.posiciones_cabezal
+        
+        # Leer el símbolo bajo cada cabezal
+        leidos = tuple([cinta.leer(posicion) for cinta, posicion in zip(cintas, posiciones)])
+        
+        transicion = self._tabla.get((self.estado_actual, leidos))
+        if transicion is None:
+            # No hay transición, rechazar
+            self.cadena_aceptada = False
+            return False
+            
+        # Escribir y mover cada cabezal
+        nuevo_estado, escritos, desplazamientos = transicion
+        for i, cinta in enumerate(cintas):
+            cinta.escribir(posiciones[i], escritos[i])
+            posiciones[i] += desplazamientos[i]
+            
+        self.estado_actual = nuevo_estado
+        self.pasos_ejecutados += 1
+        
+        if nuevo_estado in self.estados_aceptacion:
+            self.cadena_aceptada = True
+            return False
+            
+        return True
+        
+    def ejecutar_lote(self, num_pasos: int) -> bool:
+        """
+        Ejecuta como máximo num_pasos pasos sin dar la cadena por rechazada
+        si se agotan.
+        
+        Args:
+            num_pasos: Número máximo de pasos a ejecutar
+            
+        Returns:
+            True si puede continuar, False si terminó
+        """
+        limite = self.pasos_ejecutados + num_pasos
+        while self.pasos_ejecutados < limite:
+            if not self.paso():
+                break
+        return self.cadena_aceptada is None
+        
+    def ejecutar_completo(self, max_pasos: int = 1000) -> bool:
+        """
+        Ejecuta la máquina hasta que termine o alcance el máximo de pasos.
+        
+        Args:
+            max_pasos: Máximo número de pasos permitidos
+            
+        Returns:
+            True si la cadena fue aceptada, False en caso contrario
+        """
+        self.ejecutar_lote(max_pasos - self.pasos_ejecutados)
+        if self.cadena_aceptada is None:
+            self.cadena_aceptada = False
+        return self.cadena_aceptada
+        
+    def capturar(self, copiar: bool = True) -> dict:
+        """
+        Captura la configuración actual de la máquina (ver
+        MaquinaTuring.capturar).
+        
+        Args:
+            copiar: Si es False, la captura se queda con las propias cintas
+                de la máquina, que no se deben seguir usando
+                
+        Returns:
+            Captura que se puede pasar a restaurar
+        """
+        return {
+            'estado': self.estado_actual,
+            'posiciones_cabezal': list(self.posiciones_cabezal),
+            'pasos': self.pasos_ejecutados,
+            'aceptada': self.cadena_aceptada,
+            'cintas': [_copiar_cinta(cinta) for cinta in self.cintas] if copiar
+                      else self.cintas
+        }
+        
+    def restaurar(self, captura: dict, copiar: bool = True):
+        """
+        Vuelve a una configuración capturada con capturar.
+        
+        Args:
+            captura: Captura de esta máquina
+            copiar: Si es False, la máquina se queda con las cintas de la
+                captura sin copiarlas, y la captura no se debe volver a usar
+        """
+        self.estado_actual = captura['estado']
+        self.posiciones_cabezal = list(captura['posiciones_cabezal'])
+        self.pasos_ejecutados = captura['pasos']
+        self.cadena_aceptada = captura['aceptada']
+        if copiar:
+            self.cintas = [_copiar_cinta(cinta) for cinta in captura['cintas']]
+        else:
+            self.cintas = captura['cintas']
+            
+    @property
+    def veredicto(self) -> Optional[Veredicto]:
+        """Veredicto de la ejecución, o None si aún no ha terminado."""
+        if self.cadena_aceptada is None:
+            return None
+        return Veredicto.ACEPTADA if self.cadena_aceptada else Veredicto.RECHAZADA
+        
+    def obtener_instantanea(self, radio: int = 10) -> dict:
+        """
+        Obtiene el estado actual con la parte visible de cada cinta.
+        
+        Args:
+            radio: Número de celdas visibles a cada lado de cada cabezal
+            
+        Returns:
+            Diccionario con el estado actual; 'cintas' contiene la ventana de
+            cada cinta centrada en su cabezal
+        """
+        return {
+            'estado': self.estado_actual,
+            'posiciones_cabezal': list(self.posiciones_cabezal),
+            'simbolos_actuales': [cinta.leer(posicion) for cinta, posicion
+                                  in zip(self.cintas, self.posiciones_cabezal)],
+            'pasos': self.pasos_ejecutados,
+            'aceptada': self.cadena_aceptada,
+            'cintas': [cinta.obtener_ventana(posicion, radio) for cinta, posicion
+                       in zip(self.cintas, self.posiciones_cabezal)]
+        }
+        
+    def contenido_cintas(self) -> List[str]:
+        """
+        Obtiene el contenido escrito de cada cinta.
+        
+        Returns:
+            Lista con el contenido de cada cinta entre sus límites
+        """
+        return [str(cinta) for cinta in self.cintas]
@@ -0,0 +1,301 @@
+"""
+Simulador de Máquina de Turing
+Archivo: maquina_no_determinista.py
+Descripción: Máquina de Turing no determinista decidida por búsqueda en anchura
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from maquina_turing import DESPLAZAMIENTOS
+
+# Número máximo de configuraciones guardadas a la vez (visitadas y frontera)
+MAX_CONFIGURACIONES = 1000000
+
+# Tamaño de frontera a partir del cual se reparte entre procesos
+UMBRAL_REPARTO = 4096
+
+# Una configuración es la tupla (estado, posición del cabezal, origen, celdas):
+# celdas son los códigos de la cinta desde la posición origen, sin blancos
+# (código 0) en los extremos, de modo que dos configuraciones iguales tienen
+# siempre la misma representación y se pueden deduplicar por hash
+Configuracion = Tuple[int, int, int, bytes]
+
+# Tabla de transiciones y estados de aceptación del proceso trabajador
+_tabla = None
+_aceptacion = None
+
+def _inicializar_trabajador(tabla: Dict, aceptacion: FrozenSet[int]):
+    """
+    Recibe la tabla de transiciones una sola vez por proceso trabajador.
+    
+    Args:
+        tabla: Transiciones con estados y símbolos codificados
+        aceptacion: Códigos de los estados de aceptación
+    """
+    global _tabla, _aceptacion
+    _tabla = tabla
+    _aceptacion = aceptacion
+
+def _expandir_trozo(trozo: List[Configuracion]) -> Tuple[bool, Set[Configuracion]]:
+    """Expande un trozo de la frontera en un proceso trabajador."""
+    return _expandir(_tabla, _aceptacion, trozo)
+
+def _expandir(tabla: Dict, aceptacion: FrozenSet[int],
+              frontera: List[Configuracion]) -> Tuple[bool, Set[Configuracion]]:
+    """
+    Calcula las configuraciones que siguen a las de la frontera.
+    
+    Args:
+        tabla: Transiciones con estados y símbolos codificados
+        aceptacion: Códigos de los estados de aceptación
+        frontera: Configuraciones a expandir
+        
+    Returns:
+        Tupla (alguna sucesora es de aceptación, sucesoras sin repetir)
+    """
+    sucesoras = set()
+    for q, posicion, origen, celdas in frontera:
+        i = posicion - origen
+        leido = celdas[i] if 0 <= i < len(celdas) else 0
+        for nuevo, escrito, desplazamiento in tabla.get((q, leido), ()):
+            if nuevo in aceptacion:
+                return True, sucesoras
+            if escrito == leido:
+                sucesoras.add((nuevo, posicion + desplazamiento, origen, celdas))
+            else:
+                sucesoras.add((nuevo, posicion + desplazamiento)
+                              + _escribir(origen, celdas, posicion, escrito))
+    return False, sucesoras
+
+def _escribir(origen: int, celdas: bytes, posicion: int, codigo: int) -> Tuple[int, bytes]:
+    """
+    Escribe un código en la cinta de una configuración.
+    
+    Returns:
+        Tupla (origen, celdas) de la cinta resultante, sin blancos en los extremos
+    """
+    if not celdas:
+        return posicion, bytes((codigo,))
+    i = posicion - origen
+    if i < 0:
+        return posicion, bytes((codigo,)) + bytes(-i - 1) + celdas
+    if i >= len(celdas):
+        return origen, celdas + bytes(i - len(celdas)) + bytes((codigo,))
+        
+    celdas = celdas[:i] + bytes((codigo,)) + celdas[i + 1:]
+    if codigo == 0:
+        # Borrar un extremo deja blancos que no forman parte de la configuración
+        recortadas = celdas.lstrip(b'\0')
+        origen += len(celdas) - len(recortadas)
+        celdas = recortadas.rstrip(b'\0')
+        if not celdas:
+            origen = 0
+    return origen, celdas
+
+class MaquinaNoDeterminista:
+    """
+    Implementa una Máquina de Turing no determinista.
+    
+    Cada par (estado, símbolo) puede tener varias transiciones:
+    
+        (estado, simbolo) -> {(nuevo_estado, simbolo_escrito, direccion), ...}
+        
+    Una cadena se acepta si alguna rama de la computación llega a un estado
+    de aceptación. Las ramas se exploran en anchura, un paso por nivel, y las
+    configuraciones ya vistas se descartan: dos ramas que llegan a la misma
+    configuración tienen el mismo futuro, por lo que basta con seguir una.
+    """
+    
+    def __init__(self, estados: Set[str], alfabeto_entrada: Set[str],
+                 alfabeto_cinta: Set[str], transiciones: Dict,
+                 estado_inicial: str, simbolo_blanco: str,
+                 estados_aceptacion: Set[str]):
+        """
+        Inicializa la máquina y codifica su función de transición.
+        
+        Args:
+            estados: Conjunto de estados
+            alfabeto_entrada: Alfabeto de entrada
+            alfabeto_cinta: Alfabeto de la cinta
+            transiciones: Función de transición; cada valor es un conjunto de
+                ternas o una sola terna
+            estado_inicial: Estado inicial
+            simbolo_blanco: Símbolo blanco
+            estados_aceptacion: Estados de aceptación
+            
+        Raises:
+            ValueError: Si la cinta usa más de 255 símbolos distintos
+        """
+        self.estados = estados
+        self.alfabeto_entrada = alfabeto_entrada
+        self.alfabeto_cinta = alfabeto_cinta
+        self.estado_inicial = estado_inicial
+        self.simbolo_blanco = simbolo_blanco
+        self.estados_aceptacion = estados_aceptacion
+        
+        # Admitir también transiciones deterministas (una sola terna)
+        self.transiciones = {
+            clave: {valor} if isinstance(valor, tuple) and isinstance(valor[0], str) else set(valor)
+            for clave, valor in transiciones.items()
+        }
+        
+        # Codificar estados (el inicial es 0) y símbolos (el blanco es 0)
+        self.nombres_estados = [estado_inicial]
+        self.codigo_estado = {estado_inicial: 0}
+        self.simbolos = [simbolo_blanco]
+        self.codigo_simbolo = {simbolo_blanco: 0}
+        for estado in sorted(estados):
+            self._internar_estado(estado)
+        for simbolo in sorted(alfabeto_cinta):
+            self._internar_simbolo(simbolo)
+            
+        tabla = {}
+        for (estado, simbolo), opciones in self.transiciones.items():
+            tabla[(self._internar_estado(estado), self._internar_simbolo(simbolo))] = tuple(
+                (self._internar_estado(nuevo), self._internar_simbolo(escrito),
+                 DESPLAZAMIENTOS[direccion])
+                for nuevo, escrito, direccion in sorted(opciones)
+            )
+        self._tabla = tabla
+        self._aceptacion = frozenset(self._internar_estado(estado)
+                                     for estado in estados_aceptacion)
+                                     
+        # Código de los símbolos de entrada que no aparecen en la máquina
+        self.desconocido = len(self.simbolos)
+        if self.desconocido > 255:
+            raise ValueError("La máquina no determinista admite como máximo 255 símbolos distintos")
+            
+    @classmethod
+    def desde_configuracion(cls, config: Dict) -> 'MaquinaNoDeterminista':
+        """
+        Crea una máquina a partir de un diccionario de configuración cuyas
+        transiciones son conjuntos de ternas.
+        
+        Args:
+            config: Diccionario con la definición de la máquina
+            
+        Returns:
+            Máquina no determinista configurada
+        """
+        return cls(
+            estados=config['estados'],
+            alfabeto_entrada=config['alfabeto_entrada'],
+            alfabeto_cinta=config['alfabeto_cinta'],
+            transiciones=config['transiciones'],
+            estado_inicial=config['estado_inicial'],
+            simbolo_blanco=config['simbolo_blanco'],
+            estados_aceptacion=config['estados_aceptacion']
+        )
+        
+    def _internar_estado(self, estado: str) -> int:
+        """Obtiene el código de un estado, asignándole uno nuevo si no lo tiene."""
+        codigo = self.codigo_estado.get(estado)
+        if codigo is None:
+            codigo = self.codigo_estado[estado] = len(self.nombres_estados)
+            self.nombres_estados.append(estado)
+        return codigo
+        
+    def _internar_simbolo(self, simbolo: str) -> int:
+        """Obtiene el código de un símbolo, asignándole uno nuevo si no lo tiene."""
+        codigo = self.codigo_simbolo.get(simbolo)
+        if codigo is None:
+            codigo = self.codigo_simbolo[simbolo] = len(self.simbolos)
+            self.simbolos.append(simbolo)
+        return codigo
+        
+    def configuracion_inicial(self, cadena: str) -> Configuracion:
+        """
+        Obtiene la configuración inicial para una cadena de entrada.
+        
+        Args:
+            cadena: Cadena de entrada
+            
+        Returns:
+            Configuración con el estado inicial y el cabezal en la posición 0
+        """
+        codigos = bytes(self.codigo_simbolo.get(simbolo, self.desconocido)
+                        for simbolo in cadena)
+        celdas = codigos.lstrip(b'\0')
+        origen = len(codigos) - len(celdas)
+        celdas = celdas.rstrip(b'\0')
+        return 0, 0, origen if celdas else 0, celdas
+        
+    def decidir(self, cadena: str, max_pasos: int = 1000,
+                max_configuraciones: int = MAX_CONFIGURACIONES,
+                procesos: int = 1) -> Tuple[Optional[bool], int, int]:
+        """
+        Decide una cadena explorando en anchura todas las ramas.
+        
+        Las configuraciones visitadas se guardan para no repetirlas. Si su
+        número supera max_configuraciones, se olvidan todas salvo las de la
+        frontera: la búsqueda sigue siendo correcta, aunque puede volver a
+        recorrer configuraciones antiguas. Si la frontera sola supera el
+        límite, la búsqueda se abandona.
+        
+        Args:
+            cadena: Cadena de entrada
+            max_pasos: Máximo número de pasos de cada rama
+            max_configuraciones: Máximo número de configuraciones en memoria
+            procesos: Número de procesos; con más de uno, las fronteras de al
+                menos UMBRAL_REPARTO configuraciones se expanden en paralelo
+                
+        Returns:
+            Tupla (aceptada, pasos, configuraciones exploradas). aceptada es
+            True si alguna rama acepta (pasos es entonces la longitud de la
+            más corta), False si todas terminan sin aceptar, y None si se
+            alcanzó max_pasos o el límite de memoria sin decidir
+        """
+        ejecutor = None
+        try:
+            if procesos > 1:
+                ejecutor = ProcessPoolExecutor(
+                    max_workers=procesos, initializer=_inicializar_trabajador,
+                    initargs=(self._tabla, self._aceptacion))
+                    
+            frontera = [self.configuracion_inicial(cadena)]
+            visitadas = set(frontera)
+            exploradas = 1
+            pasos = 0
+            while frontera:
+                if pasos >= max_pasos:
+                    return None, pasos, exploradas
+                aceptada, sucesoras = self._expandir_frontera(frontera, ejecutor, procesos)
+                pasos += 1
+                if aceptada:
+                    return True, pasos, exploradas
+                    
+                sucesoras -= visitadas
+                if len(sucesoras) > max_configuraciones:
+                    return None, pasos, exploradas
+                if len(visitadas) + len(sucesoras) > max_configuraciones:
+                    visitadas = set(sucesoras)
+                else:
+                    visitadas |= sucesoras
+                frontera = list(sucesoras)
+                exploradas += len(frontera)
+            return False, pasos, exploradas
+        finally:
+            if ejecutor is not None:
+                ejecutor.shutdown(cancel_futures=True)
+                
+    def _expandir_frontera(self, frontera: List[Configuracion],
+                           ejecutor: Optional[ProcessPoolExecutor],
+                           procesos: int) -> Tuple[bool, Set[Configuracion]]:
+        """
+        Expande la frontera, repartiéndola entre procesos si es grande.
+        
+        Returns:
+            Tupla (alguna sucesora es de aceptación, sucesoras sin repetir)
+        """
+        if ejecutor is None or len(frontera) < UMBRAL_REPARTO:
+            return _expandir(self._tabla, self._aceptacion, frontera)
+            
+        tam_trozo = -(-len(frontera) // (procesos * 4))
+        trozos = [frontera[i:i + tam_trozo] for i in range(0, len(frontera), tam_trozo)]
+        sucesoras = set()
+        for aceptada, parciales in ejecutor.map(_expandir_trozo, trozos):
+            if aceptada:
+                return True, sucesoras
+            sucesoras |= parciales
+        return False, sucesoras
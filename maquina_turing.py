@@ -6,6 +6,11 @@ Descripción: Clase principal que representa la Máquina de Turing
 
 from typing import Dict, Tuple, Set, Optional
 from enum import Enum
+from time import perf_counter
+import warnings
+from analisis_estatico import AnalisisEstatico
+from cinta import Cinta, CintaMapeada
+from programa_compilado import PASOS_POR_DEFECTO, ProgramaCompilado
 
 class Direccion(Enum):
     """Dirección de movimiento del cabezal."""
@@ -13,6 +18,19 @@ class Direccion(Enum):
     DERECHA = 'R'
     QUIETO = 'S'
 
+# Desplazamiento del cabezal según la dirección
+DESPLAZAMIENTOS = {
+    Direccion.IZQUIERDA.value: -1,
+    Direccion.DERECHA.value: 1,
+    Direccion.QUIETO.value: 0,
+}
+
+class Veredicto(Enum):
+    """Resultado de una ejecución terminada."""
+    ACEPTADA = 'aceptada'
+    RECHAZADA = 'rechazada'
+    CICLO = 'ciclo'
+
 class MaquinaTuring:
     """
     Implementa la lógica de una Máquina de Turing determinista.
@@ -21,7 +39,8 @@ class MaquinaTuring:
     def __init__(self, estados: Set[str], alfabeto_entrada: Set[str],
                  alfabeto_cinta: Set[str], transiciones: Dict,
                  estado_inicial: str, simbolo_blanco: str,
-                 estados_aceptacion: Set[str]):
+                 estados_aceptacion: Set[str], clase_cinta: Optional[type] = None,
+                 rechazo_anticipado: bool = False):
         """
         Inicializa la Máquina de Turing.
         
@@ -33,6 +52,11 @@ class MaquinaTuring:
             estado_inicial: Estado inicial
             simbolo_blanco: Símbolo blanco
             estados_aceptacion: Estados de aceptación
+            clase_cinta: Implementación de la cinta (Cinta o CintaCompacta);
+                por defecto Cinta
+            rechazo_anticipado: Si es True, la cadena se rechaza en cuanto la
+                ejecución va a entrar en un estado desde el que no se puede
+                aceptar, sin ejecutar el resto de pasos
         """
         self.estados = estados
         self.alfabeto_entrada = alfabeto_entrada
@@ -41,13 +65,90 @@ class MaquinaTuring:
         self.estado_inicial = estado_inicial
         self.simbolo_blanco = simbolo_blanco
         self.estados_aceptacion = estados_aceptacion
+        self.clase_cinta = clase_cinta
+        self.rechazo_anticipado = rechazo_anticipado
+        
+        # Propiedades deducidas de la función de transición
+        self.analisis = AnalisisEstatico(transiciones, estado_inicial,
+                                         simbolo_blanco, estados_aceptacion)
         
         # Estado de ejecución
         self.estado_actual = None
         self.posicion_cabezal = 0
         self.cinta = None
+        self._cadena = None
+        self._longitud_entrada = None
         self.pasos_ejecutados = 0
         self.cadena_aceptada = None
+        self.ciclo_detectado = False
+        
+        # Programa compilado (se genera la primera vez que se necesita)
+        self.programa = None
+        
+        # Última ventana entregada por obtener_instantanea
+        self._ultima_ventana = {}
+        
+        # Perfilador de la ejecución paso a paso (None si está desactivado)
+        self.perfilador = None
+        
+        # Historial para retroceder (None si está desactivado)
+        self.historial = None
+        
+    @classmethod
+    def desde_configuracion(cls, config: Dict, clase_cinta: Optional[type] = None,
+                            rechazo_anticipado: bool = False) -> 'MaquinaTuring':
+        """
+        Crea una máquina a partir de un diccionario de configuración como
+        los de ExpresionesRegulares.
+        
+        Args:
+            config: Diccionario con la definición de la máquina
+            clase_cinta: Implementación de la cinta
+            rechazo_anticipado: Rechazar al entrar en un estado sin salida
+            
+        Returns:
+            Máquina de Turing configurada
+            
+        Raises:
+            ValueError: Si la configuración describe una máquina de varias
+                cintas (ver MaquinaMulticinta)
+        """
+        if config.get('num_cintas', 1) != 1:
+            raise ValueError("La configuración es de una máquina de varias cintas; "
+                             "use MaquinaMulticinta")
+        return cls(
+            estados=config['estados'],
+            alfabeto_entrada=config['alfabeto_entrada'],
+            alfabeto_cinta=config['alfabeto_cinta'],
+            transiciones=config['transiciones'],
+            estado_inicial=config['estado_inicial'],
+            simbolo_blanco=config['simbolo_blanco'],
+            estados_aceptacion=config['estados_aceptacion'],
+            clase_cinta=clase_cinta,
+            rechazo_anticipado=rechazo_anticipado
+        )
+        
+    def compilar(self) -> ProgramaCompilado:
+        """
+        Compila la función de transición a tablas de enteros.
+        
+        Debe llamarse de nuevo si se modifican las transiciones después
+        de la primera ejecución. Con rechazo anticipado, las transiciones
+        hacia estados condenados no se compilan, de modo que el programa
+        rechaza antes de entrar en ellos.
+        
+        Returns:
+            Programa compilado de la máquina
+        """
+        transiciones = self.transiciones
+        if self.rechazo_anticipado:
+            transiciones = {clave: transicion for clave, transicion in transiciones.items()
+                            if transicion[0] not in self.analisis.condenados}
+        self.programa = ProgramaCompilado(
+            self.estados, self.alfabeto_cinta, transiciones,
+            self.estado_inicial, self.simbolo_blanco, self.estados_aceptacion
+        )
+        return self.programa
         
     def cargar_cadena(self, cadena: str):
         """
@@ -56,14 +157,59 @@ class MaquinaTuring:
         Args:
             cadena: Cadena de entrada
         """
-        from cinta import Cinta
-        self.cinta = Cinta(cadena if cadena else self.simbolo_blanco, 
-                          self.simbolo_blanco)
+        clase_cinta = self.clase_cinta or Cinta
+        cinta = clase_cinta(cadena if cadena else self.simbolo_blanco, self.simbolo_blanco)
+        self.cerrar()
+        self.cinta = cinta
+        self._cadena = cadena
+        self._longitud_entrada = len(cadena)
+        self._reiniciar_ejecucion()
+        
+    def cargar_archivo(self, ruta: str):
+        """
+        Carga el contenido de un archivo en la cinta y reinicia la máquina.
+        
+        El archivo no se lee entero: la cinta lo proyecta en memoria y solo
+        se cargan las páginas que recorre el cabezal (ver CintaMapeada), por
+        lo que admite entradas mayores que la memoria disponible. Cada byte
+        del archivo es una celda.
+        
+        Args:
+            ruta: Ruta del archivo con la cadena de entrada
+        """
+        cinta = CintaMapeada(ruta, self.simbolo_blanco)
+        self.cerrar()
+        self.cinta = cinta
+        self._cadena = None
+        self._longitud_entrada = self.cinta.longitud
+        self._reiniciar_ejecucion()
+        
+    def cerrar(self):
+        """
+        Libera los recursos de la cinta cargada (el archivo proyectado de
+        cargar_archivo). Se llama sola al cargar otra entrada.
+        """
+        cerrar = getattr(self.cinta, 'cerrar', None)
+        if cerrar is not None:
+            cerrar()
+            
+    def __enter__(self) -> 'MaquinaTuring':
+        return self
+        
+    def __exit__(self, *excepcion):
+        self.cerrar()
+        
+    def _reiniciar_ejecucion(self):
+        """Pone la máquina en su configuración inicial sobre la cinta cargada."""
         self.estado_actual = self.estado_inicial
         self.posicion_cabezal = 0
         self.pasos_ejecutados = 0
         self.cadena_aceptada = None
-        
+        self.ciclo_detectado = False
+        self._ultima_ventana = {}
+        if self.historial is not None:
+            self.historial.reiniciar()
+            
     def paso(self) -> bool:
         """
         Ejecuta un paso de la máquina.
@@ -74,6 +220,10 @@ class MaquinaTuring:
         if self.cadena_aceptada is not None:
             return False
             
+        perfilador = self.perfilador
+        if perfilador is not None:
+            inicio = perf_counter()
+            
         # Leer símbolo actual
         simbolo_actual = self.cinta.leer(self.posicion_cabezal)
         
@@ -88,6 +238,15 @@ class MaquinaTuring:
         # Aplicar transición
         nuevo_estado, nuevo_simbolo, direccion = self.transiciones[clave]
         
+        if self.rechazo_anticipado and nuevo_estado in self.analisis.condenados:
+            # Desde el nuevo estado ya no se puede aceptar
+            self.cadena_aceptada = False
+            return False
+        
+        if self.historial is not None:
+            self.historial.registrar(self.estado_actual, simbolo_actual,
+                                     self.posicion_cabezal, direccion)
+            
         # Escribir nuevo símbolo
         self.cinta.escribir(self.posicion_cabezal, nuevo_simbolo)
         
@@ -101,6 +260,10 @@ class MaquinaTuring:
         self.estado_actual = nuevo_estado
         self.pasos_ejecutados += 1
         
+        if perfilador is not None:
+            perfilador.registrar(clave, direccion, self.posicion_cabezal,
+                                 perf_counter() - inicio)
+            
         # Verificar si llegó a un estado de aceptación
         if self.estado_actual in self.estados_aceptacion:
             self.cadena_aceptada = True
@@ -108,25 +271,259 @@ class MaquinaTuring:
             
         return True
         
-    def ejecutar_completo(self, max_pasos: int = 1000) -> bool:
+    def ejecutar_completo(self, max_pasos: Optional[int] = None,
+                          detectar_ciclos: bool = False) -> bool:
         """
         Ejecuta la máquina hasta que termine o alcance el máximo de pasos.
         
         Args:
-            max_pasos: Máximo número de pasos permitidos
-            
+            max_pasos: Máximo número de pasos permitidos; por defecto, la
+                cota demostrada por el análisis estático si la hay, o 1000
+            detectar_ciclos: Si es True, la ejecución se detiene en cuanto se
+                demuestra que no termina y el veredicto pasa a ser CICLO
+                
         Returns:
             True si la cadena fue aceptada, False en caso contrario
         """
-        while self.pasos_ejecutados < max_pasos:
-            if not self.paso():
-                break
-                
+        if max_pasos is None:
+            max_pasos = self.cota_pasos() or PASOS_POR_DEFECTO
+            
+        if detectar_ciclos and self.cadena_aceptada is None:
+            from detector_ciclos import DetectorCiclos
+            if DetectorCiclos(self).ejecutar(max_pasos):
+                self.ciclo_detectado = True
+        else:
+            self.ejecutar_lote(max_pasos - self.pasos_ejecutados)
+            
         if self.cadena_aceptada is None:
             self.cadena_aceptada = False
             
         return self.cadena_aceptada
         
+    def ejecutar_lote(self, num_pasos: int) -> bool:
+        """
+        Ejecuta como máximo num_pasos pasos sin dar la cadena por rechazada
+        si se agotan, de modo que la ejecución pueda continuar después.
+        
+        Args:
+            num_pasos: Número máximo de pasos a ejecutar
+            
+        Returns:
+            True si puede continuar, False si terminó
+        """
+        if self.cadena_aceptada is not None:
+            return False
+            
+        limite = self.pasos_ejecutados + num_pasos
+        
+        # Con el perfilado o el historial activos todos los pasos pasan por paso()
+        if self.cinta is not None and self.perfilador is None and self.historial is None:
+            programa = self.programa or self.compilar()
+            if self.estado_actual in programa.codigo_estado:
+                if programa.es_afd and self._cadena is not None:
+                    self._ejecutar_afd(programa, limite)
+                elif programa.compacto:
+                    self._ejecutar_compilado(programa, limite)
+                
+        while self.pasos_ejecutados < limite:
+            if not self.paso():
+                break
+                
+        return self.cadena_aceptada is None
+        
+    def _ejecutar_compilado(self, programa: ProgramaCompilado, max_pasos: int):
+        """
+        Ejecuta la máquina con el bucle del programa compilado.
+        
+        Args:
+            programa: Programa compilado de la máquina
+            max_pasos: Máximo número de pasos permitidos
+        """
+        (self.estado_actual, self.posicion_cabezal,
+         self.pasos_ejecutados, aceptada) = programa.ejecutar(
+            self.cinta, self.estado_actual, self.posicion_cabezal,
+            self.pasos_ejecutados, max_pasos
+        )
+        if aceptada is not None:
+            self.cadena_aceptada = aceptada
+            
+    def _ejecutar_afd(self, programa: ProgramaCompilado, max_pasos: int):
+        """
+        Ejecuta la máquina como autómata finito sobre la cadena de entrada.
+        
+        La cinta no cambia de contenido; solo se amplían sus límites hasta
+        la última celda visitada, como haría la ejecución paso a paso.
+        
+        Args:
+            programa: Programa compilado de la máquina
+            max_pasos: Máximo número de pasos permitidos
+        """
+        pasos_previos = self.pasos_ejecutados
+        (self.estado_actual, self.posicion_cabezal,
+         self.pasos_ejecutados, aceptada, ultima) = programa.recorrer_afd(
+            self._cadena, self.estado_actual, self.posicion_cabezal,
+            self.pasos_ejecutados, max_pasos
+        )
+        if self.pasos_ejecutados > pasos_previos and ultima > self.cinta.posicion_fin:
+            self.cinta.escribir(ultima, self.simbolo_blanco)
+        if aceptada is not None:
+            self.cadena_aceptada = aceptada
+            
+    def capturar(self, copiar: bool = True) -> dict:
+        """
+        Captura la configuración actual de la máquina.
+        
+        La cinta se copia con su método instantanea si lo tiene (en
+        CintaPaginada cuesta O(1) y las páginas se comparten hasta que se
+        escriben); si no, se copia entera.
+        
+        Args:
+            copiar: Si es False, la captura se queda con la propia cinta de
+                la máquina, que no se debe seguir usando (por ejemplo, para
+                enviarla a otro proceso)
+                
+        Returns:
+            Captura que se puede pasar a restaurar tantas veces como se quiera
+        """
+        return {
+            'estado': self.estado_actual,
+            'posicion_cabezal': self.posicion_cabezal,
+            'pasos': self.pasos_ejecutados,
+            'aceptada': self.cadena_aceptada,
+            'ciclo': self.ciclo_detectado,
+            'cadena': self._cadena,
+            'longitud_entrada': self._longitud_entrada,
+            'cinta': _copiar_cinta(self.cinta) if copiar else self.cinta
+        }
+        
+    def restaurar(self, captura: dict, copiar: bool = True):
+        """
+        Vuelve a una configuración capturada con capturar.
+        
+        Args:
+            captura: Captura de esta máquina
+            copiar: Si es False, la máquina se queda con la cinta de la
+                captura sin copiarla (por ejemplo, una recibida de otro
+                proceso), y la captura no se debe volver a usar
+        """
+        self.estado_actual = captura['estado']
+        self.posicion_cabezal = captura['posicion_cabezal']
+        self.pasos_ejecutados = captura['pasos']
+        self.cadena_aceptada = captura['aceptada']
+        self.ciclo_detectado = captura['ciclo']
+        self._cadena = captura['cadena']
+        self._longitud_entrada = captura['longitud_entrada']
+        self.cinta = _copiar_cinta(captura['cinta']) if copiar else captura['cinta']
+        self._ultima_ventana = {}
+        
+    def activar_perfilado(self, perfilador=None) -> 'Perfilador':
+        """
+        Activa el perfilado de la ejecución.
+        
+        Mientras está activo, los pasos se ejecutan uno a uno en lugar de
+        con el programa compilado, de modo que todos quedan registrados.
+        
+        Args:
+            perfilador: Perfilador en el que acumular los datos; por
+                defecto, el actual o uno nuevo
+                
+        Returns:
+            Perfilador en uso
+        """
+        if perfilador is None:
+            perfilador = self.perfilador
+        if perfilador is None:
+            from perfilador import Perfilador
+            perfilador = Perfilador()
+        self.perfilador = perfilador
+        return perfilador
+        
+    def desactivar_perfilado(self) -> Optional['Perfilador']:
+        """
+        Desactiva el perfilado de la ejecución.
+        
+        Returns:
+            Perfilador que estaba en uso, con los datos recogidos
+        """
+        perfilador = self.perfilador
+        self.perfilador = None
+        return perfilador
+        
+    def activar_historial(self, intervalo: Optional[int] = None) -> 'HistorialEjecucion':
+        """
+        Empieza a registrar la ejecución para poder volver a pasos anteriores.
+        
+        Mientras está activo, los pasos se ejecutan uno a uno en lugar de
+        con el programa compilado. Con CintaPaginada los puntos de control
+        cuestan O(1); con las demás cintas, cada uno copia la cinta entera
+        y se avisa con un RuntimeWarning.
+        
+        Args:
+            intervalo: Pasos entre puntos de control (por defecto,
+                INTERVALO_PUNTOS)
+                
+        Returns:
+            Historial en uso
+        """
+        from historial import HistorialEjecucion, INTERVALO_PUNTOS
+        self.historial = HistorialEjecucion(self, intervalo or INTERVALO_PUNTOS)
+        return self.historial
+        
+    def desactivar_historial(self):
+        """Deja de registrar la ejecución y descarta el historial."""
+        self.historial = None
+        
+    def ir_a_paso(self, paso: int):
+        """
+        Lleva la máquina a un paso ya ejecutado, hacia atrás o hacia delante.
+        
+        Args:
+            paso: Paso de destino
+            
+        Raises:
+            ValueError: Si el historial no está activo o no llega a ese paso
+        """
+        if self.historial is None:
+            raise ValueError("El historial no está activo")
+        self.historial.ir_a(paso)
+        
+    def retroceder(self, pasos: int = 1):
+        """
+        Deshace los últimos pasos ejecutados.
+        
+        Args:
+            pasos: Número de pasos a deshacer
+            
+        Raises:
+            ValueError: Si el historial no está activo o no llega tan atrás
+        """
+        self.ir_a_paso(self.pasos_ejecutados - pasos)
+        
+    def cota_pasos(self) -> Optional[int]:
+        """
+        Cota demostrada del número de pasos para la cadena cargada.
+        
+        Returns:
+            Número máximo de pasos, o None si el análisis no la garantiza
+        """
+        if self._longitud_entrada is None:
+            return None
+        return self.analisis.cota_pasos(self._longitud_entrada)
+        
+    @property
+    def cadena_cargada(self) -> Optional[str]:
+        """Cadena cargada con cargar_cadena, o None si la entrada es un archivo."""
+        return self._cadena
+        
+    @property
+    def veredicto(self) -> Optional[Veredicto]:
+        """Veredicto de la ejecución, o None si aún no ha terminado."""
+        if self.ciclo_detectado:
+            return Veredicto.CICLO
+        if self.cadena_aceptada is None:
+            return None
+        return Veredicto.ACEPTADA if self.cadena_aceptada else Veredicto.RECHAZADA
+        
     def obtener_estado(self) -> dict:
         """
         Obtiene el estado actual completo de la máquina.
@@ -141,4 +538,61 @@ class MaquinaTuring:
             'pasos': self.pasos_ejecutados,
             'aceptada': self.cadena_aceptada,
             'cinta': self.cinta.obtener_contenido() if self.cinta else {}
-        }
\ No newline at end of file
+        }
+        
+    def obtener_instantanea(self, radio: int = 10, solo_cambios: bool = False) -> dict:
+        """
+        Obtiene el estado actual con solo la parte visible de la cinta.
+        
+        A diferencia de obtener_estado, solo se leen las celdas de una
+        ventana centrada en el cabezal, por lo que el coste no crece con
+        el tamaño de la cinta.
+        
+        Args:
+            radio: Número de celdas visibles a cada lado del cabezal
+            solo_cambios: Si es True, 'cinta' contiene solo las celdas que
+                cambiaron (o aparecieron) desde la instantánea anterior
+                
+        Returns:
+            Diccionario con el estado actual; 'ventana' indica el rango
+            [inicio, fin] de posiciones visibles
+        """
+        if self.cinta is None:
+            ventana = {}
+        else:
+            ventana = self.cinta.obtener_ventana(self.posicion_cabezal, radio)
+            
+        if solo_cambios:
+            anterior = self._ultima_ventana
+            cinta = {pos: simbolo for pos, simbolo in ventana.items()
+                     if anterior.get(pos) != simbolo}
+        else:
+            cinta = ventana
+        self._ultima_ventana = ventana
+        
+        return {
+            'estado': self.estado_actual,
+            'posicion_cabezal': self.posicion_cabezal,
+            'simbolo_actual': self.cinta.leer(self.posicion_cabezal) if self.cinta else '',
+            'pasos': self.pasos_ejecutados,
+            'aceptada': self.cadena_aceptada,
+            'ventana': (min(ventana), max(ventana)) if ventana else None,
+            'cinta': cinta
+        }
+
+def _copiar_cinta(cinta):
+    """
+    Copia independiente de una cinta, en O(1) si la cinta lo permite.
+    
+    Las cintas sin instantanea se copian enteras, lo que avisa con un
+    RuntimeWarning: con el historial activo se haría en cada punto de control.
+    """
+    if cinta is None:
+        return None
+    instantanea = getattr(cinta, 'instantanea', None)
+    if instantanea is not None:
+        return instantanea()
+    warnings.warn(f"{type(cinta).__name__} no admite instantáneas: la captura copia "
+                  f"la cinta entera (use CintaPaginada)", RuntimeWarning, stacklevel=3)
+    import copy
+    return copy.deepcopy(cinta)
@@ -0,0 +1,120 @@
+"""
+Simulador de Máquina de Turing
+Archivo: perfilador.py
+Descripción: Contadores de perfilado de una ejecución paso a paso
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+class Perfilador:
+    """
+    Acumula estadísticas de los pasos ejecutados por una máquina.
+    
+    Las estadísticas se acumulan entre cadenas: para perfilar una sola
+    ejecución hay que llamar a reiniciar antes de cargarla.
+    
+    Atributos:
+        transiciones: Veces que se ha aplicado cada transición (estado, símbolo)
+        pasos_por_estado: Pasos ejecutados desde cada estado
+        tiempo_por_estado: Segundos empleados en los pasos de cada estado
+        movimientos: Histograma de movimientos del cabezal ('L', 'R', 'S')
+        visitas_celda: Veces que el cabezal ha llegado a cada celda
+    """
+    
+    def __init__(self):
+        """Inicializa los contadores vacíos."""
+        self.reiniciar()
+        
+    def reiniciar(self):
+        """Pone a cero todos los contadores."""
+        self.transiciones = Counter()
+        self.pasos_por_estado = Counter()
+        self.tiempo_por_estado = Counter()
+        self.movimientos = Counter()
+        self.visitas_celda = Counter()
+        
+    def registrar(self, clave: Tuple[str, str], direccion: str, posicion: int,
+                  segundos: float):
+        """
+        Registra un paso.
+        
+        Args:
+            clave: Transición aplicada (estado, símbolo leído)
+            direccion: Movimiento del cabezal
+            posicion: Posición del cabezal tras el paso
+            segundos: Duración del paso
+        """
+        estado = clave[0]
+        self.transiciones[clave] += 1
+        self.pasos_por_estado[estado] += 1
+        self.tiempo_por_estado[estado] += segundos
+        self.movimientos[direccion] += 1
+        self.visitas_celda[posicion] += 1
+        
+    @property
+    def total_pasos(self) -> int:
+        """Número total de pasos registrados."""
+        return sum(self.pasos_por_estado.values())
+        
+    def mas_frecuentes(self, n: int = 10) -> List[Tuple[Tuple[str, str], int]]:
+        """
+        Obtiene las transiciones más aplicadas.
+        
+        Args:
+            n: Número de transiciones
+            
+        Returns:
+            Lista de pares ((estado, símbolo), veces) de mayor a menor
+        """
+        return self.transiciones.most_common(n)
+        
+    @property
+    def maximo_transicion(self) -> int:
+        """Veces que se ha aplicado la transición más frecuente."""
+        return max(self.transiciones.values(), default=0)
+        
+    def intensidad(self, clave: Tuple[str, str], maximo: Optional[int] = None) -> float:
+        """
+        Frecuencia de una transición relativa a la más aplicada.
+        
+        Args:
+            clave: Transición (estado, símbolo)
+            maximo: maximo_transicion ya calculado; al pedir la intensidad de
+                muchas transiciones seguidas conviene calcularlo una sola vez
+                
+        Returns:
+            Valor entre 0 y 1
+        """
+        if maximo is None:
+            maximo = self.maximo_transicion
+        if not maximo:
+            return 0.0
+        return self.transiciones[clave] / maximo
+        
+    def resumen(self) -> Dict:
+        """
+        Obtiene todas las estadísticas en tipos serializables a JSON.
+        
+        Returns:
+            Diccionario con el total de pasos, las transiciones ordenadas por
+            frecuencia, los pasos y segundos por estado, el histograma de
+            movimientos y el rango de celdas visitadas
+        """
+        return {
+            'pasos': self.total_pasos,
+            'transiciones': [
+                {'estado': estado, 'simbolo': simbolo, 'veces': veces}
+                for (estado, simbolo), veces in self.transiciones.most_common()
+            ],
+            'estados': {
+                estado: {'pasos': pasos, 'segundos': self.tiempo_por_estado[estado]}
+                for estado, pasos in self.pasos_por_estado.most_common()
+            },
+            'movimientos': dict(self.movimientos),
+            'celdas': {
+                'visitadas': len(self.visitas_celda),
+                'minima': min(self.visitas_celda, default=None),
+                'maxima': max(self.visitas_celda, default=None)
+            }
+        }
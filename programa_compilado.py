@@ -0,0 +1,645 @@
+"""
+Simulador de Máquina de Turing
+Archivo: programa_compilado.py
+Descripción: Compilación de la función de transición a tablas de enteros
+"""
+
+from array import array
+from types import MappingProxyType
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from analisis_estatico import AnalisisEstatico
+from cinta import CintaCompacta
+
+# Desplazamiento del cabezal según la dirección de la transición
+MOVIMIENTOS = {'L': -1, 'R': 1}
+
+# Máximo de pasos cuando no se indica uno y el análisis estático no
+# demuestra ninguna cota
+PASOS_POR_DEFECTO = 1000
+
+# Número de celdas que se leen de la cinta cada vez que el cabezal
+# sale de la zona cargada en el bucle compilado
+BLOQUE_CINTA = 64
+
+# Tamaño máximo de la zona cargada: al salir de una zona de este tamaño, se
+# vuelcan sus cambios y se carga otra alrededor del cabezal, de modo que la
+# memoria usada no crece con las celdas recorridas
+VENTANA_CINTA = 1 << 20
+
+def _longitud_racha(buf: bytearray, i: int, sentido: int, limite: int,
+                    corte: bytes) -> int:
+    """
+    Cuenta las celdas consecutivas que un macro paso puede saltar a partir de i.
+    
+    Los trozos de la zona se traducen con la tabla de corte, que da 0 para
+    los símbolos que se saltan y 1 para los demás, y se busca el primer 1.
+    Los trozos crecen al doble cada vez, de modo que el coste es
+    proporcional a la longitud de la racha.
+    
+    Args:
+        buf: Zona de la cinta como códigos
+        i: Índice de partida
+        sentido: 1 para avanzar a la derecha, -1 a la izquierda
+        limite: Número máximo de celdas a contar
+        corte: Tabla de corte del estado y el sentido del macro paso
+        
+    Returns:
+        Longitud de la racha, sin salir de buf ni superar el límite
+    """
+    n = 0
+    bloque = BLOQUE_CINTA
+    while n < limite:
+        if sentido > 0:
+            trozo = buf[i + n:min(i + n + bloque, len(buf))].translate(corte)
+            parada = trozo.find(1)
+        else:
+            trozo = buf[max(i - n - bloque + 1, 0):i - n + 1].translate(corte)
+            parada = trozo.rfind(1)
+            if parada >= 0:
+                parada = len(trozo) - 1 - parada
+        if parada >= 0:
+            n += parada
+            break
+        if not trozo:
+            break
+        n += len(trozo)
+        bloque *= 2
+    return min(n, limite)
+    
+class ProgramaCompilado:
+    """
+    Representación compacta de la función de transición.
+    
+    Los estados y los símbolos de la cinta se internan como enteros pequeños
+    y cada transición ocupa una celda de tres tablas planas indexadas por
+    estado * num_simbolos + simbolo: siguiente estado, símbolo escrito y
+    movimiento del cabezal.
+    
+    Un programa es inmutable una vez construido, de modo que puede
+    compartirse entre cualquier número de ejecuciones simultáneas.
+    """
+    
+    def __init__(self, estados: Set[str], alfabeto_cinta: Set[str],
+                 transiciones: Dict, estado_inicial: str, simbolo_blanco: str,
+                 estados_aceptacion: Set[str]):
+        """
+        Compila la definición de una Máquina de Turing.
+        
+        Args:
+            estados: Conjunto de estados
+            alfabeto_cinta: Alfabeto de la cinta
+            transiciones: Función de transición
+            estado_inicial: Estado inicial
+            simbolo_blanco: Símbolo blanco
+            estados_aceptacion: Estados de aceptación
+        """
+        self._definicion = (frozenset(estados), frozenset(alfabeto_cinta), dict(transiciones),
+                            estado_inicial, simbolo_blanco, frozenset(estados_aceptacion))
+        
+        # Internar estados (el inicial siempre recibe el código 0)
+        self.estados = []
+        self.codigo_estado = {}
+        self._internar_estado(estado_inicial)
+        for estado in sorted(estados):
+            self._internar_estado(estado)
+        for (estado, _), (nuevo_estado, _, _) in transiciones.items():
+            self._internar_estado(estado)
+            self._internar_estado(nuevo_estado)
+        for estado in sorted(estados_aceptacion):
+            self._internar_estado(estado)
+            
+        # Internar símbolos (el blanco siempre recibe el código 0)
+        self.simbolos = []
+        self.codigo_simbolo = {}
+        self._internar_simbolo(simbolo_blanco)
+        for simbolo in sorted(alfabeto_cinta):
+            self._internar_simbolo(simbolo)
+        for (_, simbolo), (_, nuevo_simbolo, _) in transiciones.items():
+            self._internar_simbolo(simbolo)
+            self._internar_simbolo(nuevo_simbolo)
+            
+        # Código reservado para símbolos de la cinta que no aparecen en el
+        # programa: no tiene transiciones, así que siempre rechaza
+        self.desconocido = len(self.simbolos)
+        self.num_simbolos = len(self.simbolos) + 1
+        self.compacto = self.num_simbolos <= 256
+        
+        num_estados = len(self.estados)
+        tam = num_estados * self.num_simbolos
+        self.siguiente = array('i', [-1]) * tam
+        self.escritura = array('B', [0]) * tam if self.compacto else array('H', [0]) * tam
+        self.movimiento = array('b', [0]) * tam
+        for (estado, simbolo), (nuevo_estado, nuevo_simbolo, direccion) in transiciones.items():
+            k = self.codigo_estado[estado] * self.num_simbolos + self.codigo_simbolo[simbolo]
+            self.siguiente[k] = self.codigo_estado[nuevo_estado]
+            self.escritura[k] = self.codigo_simbolo[nuevo_simbolo]
+            self.movimiento[k] = MOVIMIENTOS.get(direccion, 0)
+            
+        self.aceptacion = bytearray(num_estados)
+        for estado in estados_aceptacion:
+            self.aceptacion[self.codigo_estado[estado]] = 1
+            
+        # Bucles sobre sí mismo que no modifican la cinta: el cabezal recorre
+        # de una vez toda la racha de celdas cuyos símbolos tienen un bucle
+        # así en el mismo sentido, aunque los símbolos sean distintos
+        self.macro = bytearray(tam)
+        for k in range(tam):
+            q, simbolo = divmod(k, self.num_simbolos)
+            if (self.siguiente[k] == q and self.escritura[k] == simbolo
+                    and self.movimiento[k] != 0 and not self.aceptacion[q]):
+                self.macro[k] = 1
+                
+        # Tablas de corte de los macro pasos (ver _longitud_racha), una por
+        # estado y sentido: el byte de cada código es 0 si el estado lo
+        # salta en ese sentido y 1 si no
+        cortes = [None] * tam
+        for q in range(num_estados):
+            base = q * self.num_simbolos
+            for sentido in (-1, 1):
+                celdas = [k for k in range(base, base + self.num_simbolos)
+                          if self.macro[k] and self.movimiento[k] == sentido]
+                if celdas and self.compacto:
+                    corte = bytearray([1]) * 256
+                    for k in celdas:
+                        corte[k - base] = 0
+                    corte = bytes(corte)
+                    for k in celdas:
+                        cortes[k] = corte
+        self.cortes = tuple(cortes)
+        
+        self.analisis = AnalisisEstatico(transiciones, estado_inicial,
+                                         simbolo_blanco, estados_aceptacion)
+        self.es_afd = self._compilar_afd()
+        self._preparar_bucle()
+        self._congelar()
+        
+    def _preparar_bucle(self):
+        """
+        Prepara las tablas que usa el bucle de ejecutar.
+        
+        En el bucle los estados se representan ya multiplicados por
+        num_simbolos, de modo que la celda de la tabla es q + símbolo. Las
+        celdas que no son un paso normal se marcan con un valor negativo
+        para no añadir ninguna comprobación a los pasos normales: -1 si no
+        hay transición, -2 si hay macro paso y -3 si la transición entra en
+        un estado de aceptación.
+        """
+        m = self.num_simbolos
+        siguiente = []
+        for s, macro in zip(self.siguiente, self.macro):
+            if s < 0:
+                siguiente.append(-1)
+            elif macro:
+                siguiente.append(-2)
+            elif self.aceptacion[s]:
+                siguiente.append(-3)
+            else:
+                siguiente.append(s * m)
+        self._siguiente_bucle = tuple(siguiente)
+        self._escritura_bucle = tuple(self.escritura)
+        self._movimiento_bucle = tuple(self.movimiento)
+        
+    def _congelar(self):
+        """Sustituye las tablas por versiones de solo lectura y bloquea el objeto."""
+        self.estados = tuple(self.estados)
+        self.simbolos = tuple(self.simbolos)
+        self.codigo_estado = MappingProxyType(self.codigo_estado)
+        self.codigo_simbolo = MappingProxyType(self.codigo_simbolo)
+        self.siguiente = memoryview(self.siguiente).toreadonly()
+        self.escritura = memoryview(self.escritura).toreadonly()
+        self.movimiento = memoryview(self.movimiento).toreadonly()
+        self.aceptacion = bytes(self.aceptacion)
+        self.macro = bytes(self.macro)
+        if self.es_afd:
+            self.filas_afd = tuple(tuple(fila) for fila in self.filas_afd)
+            self.traduccion_afd = MappingProxyType(self.traduccion_afd)
+        self._congelado = True
+        
+    def __setattr__(self, nombre: str, valor):
+        if getattr(self, '_congelado', False):
+            raise AttributeError("Un programa compilado no puede modificarse")
+        object.__setattr__(self, nombre, valor)
+        
+    def __delattr__(self, nombre: str):
+        raise AttributeError("Un programa compilado no puede modificarse")
+        
+    def __reduce__(self):
+        # Las vistas de memoria no se pueden serializar: se vuelve a compilar
+        return ProgramaCompilado, self._definicion
+        
+    def _compilar_afd(self) -> bool:
+        """
+        Comprueba si el programa es en realidad un autómata finito
+        determinista y, si lo es, prepara sus tablas.
+        
+        Lo es cuando ninguna transición modifica la cinta y todas mueven a
+        la derecha, salvo las que entran en un estado de aceptación (y por
+        tanto terminan). Además, todos los símbolos
+        deben ser de un carácter y caber en un byte para poder traducir la
+        entrada con str.translate.
+        
+        Returns:
+            True si el programa puede ejecutarse como autómata
+        """
+        num_estados = len(self.estados)
+        m = self.num_simbolos
+        if not self.compacto or any(len(simbolo) != 1 for simbolo in self.simbolos):
+            return False
+            
+        # filas_afd[q][c] es el siguiente estado, o num_estados si la
+        # transición termina la ejecución (no existe o lleva a aceptación)
+        self.filas_afd = [[num_estados] * m for _ in range(num_estados)]
+        for k, nuevo in enumerate(self.siguiente):
+            if nuevo < 0:
+                continue
+            q, simbolo = divmod(k, m)
+            if self.escritura[k] != simbolo:
+                return False
+            if self.movimiento[k] == 1 and not self.aceptacion[nuevo]:
+                self.filas_afd[q][simbolo] = nuevo
+            elif not self.aceptacion[nuevo]:
+                return False
+                
+        self.traduccion_afd = {ord(simbolo): codigo
+                               for codigo, simbolo in enumerate(self.simbolos)}
+        self.simbolos_afd = frozenset(self.simbolos)
+        return True
+        
+    def _internar_estado(self, estado: str):
+        """Asigna un código entero a un estado si aún no lo tiene."""
+        if estado not in self.codigo_estado:
+            self.codigo_estado[estado] = len(self.estados)
+            self.estados.append(estado)
+            
+    def _internar_simbolo(self, simbolo: str):
+        """Asigna un código entero a un símbolo si aún no lo tiene."""
+        if simbolo not in self.codigo_simbolo:
+            self.codigo_simbolo[simbolo] = len(self.simbolos)
+            self.simbolos.append(simbolo)
+            
+    def _codificar(self, simbolos: Iterable[str]) -> bytearray:
+        """Traduce una secuencia de símbolos a sus códigos."""
+        codigos = self.codigo_simbolo
+        desconocido = self.desconocido
+        return bytearray([codigos.get(s, desconocido) for s in simbolos])
+        
+    def _traduccion(self, cinta) -> Optional[bytes]:
+        """
+        Tabla de bytes.translate que pasa los códigos de la cinta a los del
+        programa.
+        
+        Solo las cintas con leer_codigos (CintaCompacta, CintaPaginada y
+        CintaMapeada) la admiten; los códigos que la cinta aún no usa se traducen como
+        símbolos desconocidos.
+        
+        Returns:
+            Tabla de 256 bytes, o None si la cinta no guarda códigos
+        """
+        if not hasattr(cinta, 'leer_codigos'):
+            return None
+        codigos = self.codigo_simbolo
+        desconocido = self.desconocido
+        tabla = bytearray([desconocido]) * 256
+        for codigo, simbolo in enumerate(cinta.simbolos):
+            tabla[codigo] = codigos.get(simbolo, desconocido)
+        return bytes(tabla)
+        
+    def _leer_bloque(self, cinta, traduccion: Optional[bytes], inicio: int,
+                     fin: int) -> bytearray:
+        """
+        Lee las celdas [inicio, fin) de la cinta como códigos.
+        
+        Las celdas fuera de los límites escritos son blancas y no se
+        consultan a la cinta. Con una tabla de traducción (ver _traduccion)
+        los códigos de la cinta se traducen de una vez con bytes.translate;
+        si no, se codifica símbolo a símbolo.
+        """
+        desde = max(inicio, cinta.posicion_inicio)
+        hasta = min(fin, cinta.posicion_fin + 1)
+        if desde >= hasta:
+            return bytearray(fin - inicio)
+        if traduccion is not None:
+            codigos = cinta.leer_codigos(desde, hasta).translate(traduccion)
+        else:
+            codigos = self._codificar(cinta.leer_rango(desde, hasta))
+        return bytearray(desde - inicio) + codigos + bytearray(fin - hasta)
+                
+    def ejecutar(self, cinta, estado: str, posicion: int, pasos: int,
+                 max_pasos: int) -> Tuple[str, int, int, Optional[bool]]:
+        """
+        Ejecuta el programa sobre la cinta hasta que termine o se agoten los pasos.
+        
+        Produce exactamente el mismo resultado que llamar a
+        MaquinaTuring.paso() repetidamente: el bucle trabaja sobre una zona
+        de la cinta cargada como códigos y vuelca las celdas visitadas a la
+        cinta al salir de una zona llena y al terminar.
+        
+        Args:
+            cinta: Cinta sobre la que se ejecuta
+            estado: Estado de partida
+            posicion: Posición de partida del cabezal
+            pasos: Pasos ya ejecutados
+            max_pasos: Máximo número de pasos permitidos
+            
+        Returns:
+            Tupla (estado, posición, pasos, aceptada) donde aceptada es None
+            si la máquina no terminó dentro del límite de pasos
+        """
+        # Tablas del bucle (ver _preparar_bucle)
+        m = self.num_simbolos
+        siguiente = self._siguiente_bucle
+        escritura = self._escritura_bucle
+        movimiento = self._movimiento_bucle
+        cortes = self.cortes
+        
+        # Zona de la cinta cargada como códigos: buf[i] es la celda origen + i.
+        # La cinta solo cambia al volcar la zona, y entonces se recalcula la
+        # tabla de traducción por si la cinta ha añadido símbolos
+        traduccion = self._traduccion(cinta)
+        origen = posicion - BLOQUE_CINTA
+        buf = self._leer_bloque(cinta, traduccion, origen, posicion + BLOQUE_CINTA)
+        original = bytes(buf)
+        tam = len(buf)
+        
+        q = self.codigo_estado[estado] * m
+        i = posicion - origen
+        resultado = None
+        
+        # Celdas de la zona en las que ha empezado algún paso: [bajo, alto].
+        # El cabezal avanza de celda en celda, así que forman un intervalo y
+        # basta con comprobar si sale de él, lo que incluye salir de la zona
+        bajo = i
+        alto = i - 1
+        ampliada = -1  # paso en el que se amplió el intervalo por última vez
+        
+        while pasos < max_pasos:
+            for pasos in range(pasos, max_pasos):
+                if i > alto or i < bajo:
+                    if i < 0 or i >= tam:
+                        break
+                    if i > alto:
+                        alto = i
+                    else:
+                        bajo = i
+                    ampliada = pasos
+                k = q + buf[i]
+                q_siguiente = siguiente[k]
+                if q_siguiente < 0:
+                    break
+                buf[i] = escritura[k]
+                i += movimiento[k]
+                q = q_siguiente
+            else:
+                pasos = max_pasos
+                break
+                
+            if i < 0 or i >= tam:
+                if tam >= VENTANA_CINTA:
+                    # Zona llena: volcarla y cargar otra que deje el cabezal a
+                    # un cuarto de la zona del lado por el que salió
+                    if alto >= bajo:
+                        self._volcar(cinta, buf, original, origen, bajo, alto)
+                        traduccion = self._traduccion(cinta)
+                    posicion = origen + i
+                    origen = posicion - (tam // 4 if i >= tam else tam - tam // 4)
+                    buf = self._leer_bloque(cinta, traduccion, origen, origen + tam)
+                    original = bytes(buf)
+                    i = posicion - origen
+                    bajo = i
+                    alto = i - 1
+                else:
+                    # Duplicar la zona cargada hacia el lado por el que salió
+                    extra = max(tam, BLOQUE_CINTA)
+                    if i < 0:
+                        bloque = self._leer_bloque(cinta, traduccion, origen - extra, origen)
+                        buf[0:0] = bloque
+                        original = bytes(bloque) + original
+                        origen -= extra
+                        i += extra
+                        bajo += extra
+                        alto += extra
+                    else:
+                        bloque = self._leer_bloque(cinta, traduccion, origen + tam,
+                                                   origen + tam + extra)
+                        buf += bloque
+                        original += bytes(bloque)
+                    tam += extra
+                continue
+                
+            if q_siguiente == -1:
+                # Sin transición: el paso no llega a empezar en esta celda
+                if ampliada == pasos:
+                    if i == alto:
+                        alto -= 1
+                    else:
+                        bajo += 1
+                resultado = False
+                break
+                
+            if q_siguiente == -3:
+                buf[i] = escritura[k]
+                i += movimiento[k]
+                q = self.siguiente[k] * m
+                pasos += 1
+                resultado = True
+                break
+                
+            # Macro paso: recorrer la racha dentro de la zona cargada. Las
+            # rachas cortas se recorren aquí; las largas, por trozos
+            corte = cortes[k]
+            sentido = movimiento[k]
+            limite = max_pasos - pasos
+            j = i + sentido
+            n = 1
+            while n < limite and 0 <= j < tam and not corte[buf[j]]:
+                n += 1
+                j += sentido
+                if n == 16:
+                    if n < limite and 0 <= j < tam and not corte[buf[j]]:
+                        n += _longitud_racha(buf, j, sentido, limite - n, corte)
+                        j = i + n * sentido
+                    break
+                    
+            extremo = j - sentido
+            if extremo > alto:
+                alto = extremo
+            elif extremo < bajo:
+                bajo = extremo
+            i = j
+            pasos += n
+            
+        if alto >= bajo:
+            self._volcar(cinta, buf, original, origen, bajo, alto)
+            
+        return self.estados[q // m], origen + i, pasos, resultado
+        
+    def recorrer_afd(self, cadena: str, estado: str, posicion: int, pasos: int,
+                     max_pasos: int) -> Tuple[str, int, int, Optional[bool], int]:
+        """
+        Ejecuta un programa con forma de autómata directamente sobre la
+        cadena de entrada, sin cinta.
+        
+        Como el programa nunca escribe ni retrocede, la cinta siempre
+        coincide con la entrada seguida de blancos: basta con traducir la
+        entrada a códigos y recorrer la tabla de estados.
+        
+        Args:
+            cadena: Cadena de entrada completa
+            estado: Estado de partida
+            posicion: Posición de partida del cabezal
+            pasos: Pasos ya ejecutados
+            max_pasos: Máximo número de pasos permitidos
+            
+        Returns:
+            Tupla (estado, posición, pasos, aceptada, última posición
+            escrita) con la misma semántica que ejecutar; la última
+            posición escrita solo tiene sentido si se ejecutó algún paso
+        """
+        filas = self.filas_afd
+        fin = len(self.estados)
+        q = self.codigo_estado[estado]
+        inicio = posicion
+        
+        # Parte de la entrada que puede recorrerse dentro del límite de pasos
+        texto = cadena[posicion:posicion + max(max_pasos - pasos, 0)]
+        desconocidos = set(texto) - self.simbolos_afd
+        if desconocidos:
+            texto = texto[:min(texto.find(simbolo) for simbolo in desconocidos)]
+        datos = texto.translate(self.traduccion_afd).encode('latin-1')
+        
+        c = None
+        for c in datos:
+            nuevo = filas[q][c]
+            if nuevo == fin:
+                break
+            q = nuevo
+            posicion += 1
+        else:
+            c = None
+        pasos += posicion - inicio
+        
+        if c is None:
+            if pasos >= max_pasos:
+                return self.estados[q], posicion, pasos, None, posicion - 1
+            if posicion < len(cadena):
+                # Símbolo desconocido: no hay transición
+                return self.estados[q], posicion, pasos, False, posicion - 1
+                
+            # Fin de la entrada: el resto de la cinta es blanca
+            c, q, posicion, pasos = self._recorrer_blancos(q, posicion, pasos, max_pasos)
+            if c is None:
+                return self.estados[q], posicion, pasos, None, posicion - 1
+                
+        # Transición que termina: rechazo si no existe, aceptación si no
+        k = q * self.num_simbolos + c
+        nuevo = self.siguiente[k]
+        if nuevo < 0:
+            return self.estados[q], posicion, pasos, False, posicion - 1
+        return (self.estados[nuevo], posicion + self.movimiento[k], pasos + 1,
+                True, posicion)
+                
+    def _recorrer_blancos(self, q: int, posicion: int, pasos: int,
+                          max_pasos: int) -> Tuple[Optional[int], int, int, int]:
+        """
+        Recorre la parte en blanco de la cinta tras la entrada.
+        
+        Si la cadena de estados sobre blanco entra en un ciclo, se salta
+        directamente al estado que se tendría al agotar los pasos.
+        
+        Returns:
+            Tupla (código del símbolo que termina la ejecución o None si se
+            agotaron los pasos, estado, posición, pasos)
+        """
+        filas = self.filas_afd
+        fin = len(self.estados)
+        vistos = {}
+        secuencia = []
+        while pasos < max_pasos:
+            nuevo = filas[q][0]
+            if nuevo == fin:
+                return 0, q, posicion, pasos
+            if q in vistos:
+                # Ciclo: avanzar hasta agotar los pasos sin simularlos
+                inicio_ciclo = vistos[q]
+                periodo = len(secuencia) - inicio_ciclo
+                restantes = max_pasos - pasos
+                q = secuencia[inicio_ciclo + restantes % periodo]
+                return None, q, posicion + restantes, max_pasos
+            vistos[q] = len(secuencia)
+            secuencia.append(q)
+            q = nuevo
+            posicion += 1
+            pasos += 1
+        return None, q, posicion, pasos
+        
+    def limite_pasos(self, longitud: int, max_pasos: Optional[int] = None) -> int:
+        """
+        Resuelve el máximo de pasos de una ejecución.
+        
+        Args:
+            longitud: Longitud de la entrada (o una cota superior de ella)
+            max_pasos: Máximo indicado por quien llama, si lo hay
+            
+        Returns:
+            max_pasos si se indica; si no, la cota demostrada por el análisis
+            estático si la hay, o PASOS_POR_DEFECTO
+        """
+        if max_pasos is not None:
+            return max_pasos
+        return self.analisis.cota_pasos(longitud) or PASOS_POR_DEFECTO
+        
+    def decidir(self, cadena: str,
+                max_pasos: Optional[int] = None) -> Tuple[Optional[bool], int, str]:
+        """
+        Decide una cadena desde el estado inicial sin crear una máquina.
+        Requiere un programa compacto.
+        
+        Args:
+            cadena: Cadena de entrada
+            max_pasos: Máximo número de pasos permitidos (ver limite_pasos)
+            
+        Returns:
+            Tupla (aceptada, pasos, estado final); aceptada es None si se
+            agotaron los pasos sin que la ejecución terminara
+        """
+        max_pasos = self.limite_pasos(len(cadena), max_pasos)
+        if self.es_afd:
+            estado, _, pasos, aceptada, _ = self.recorrer_afd(
+                cadena, self.estados[0], 0, 0, max_pasos)
+        else:
+            cinta = CintaCompacta(cadena or self.simbolos[0], self.simbolos[0])
+            estado, _, pasos, aceptada = self.ejecutar(cinta, self.estados[0], 0, 0, max_pasos)
+        return aceptada, pasos, estado
+        
+    def _volcar(self, cinta, buf: bytearray, original: bytes, origen: int,
+                desde: int, hasta: int):
+        """
+        Escribe en la cinta las celdas visitadas [desde, hasta] de la zona
+        cargada.
+        
+        Las cintas con escribir_codigos reciben todo el rango de una vez.
+        En las demás solo se escriben las celdas modificadas, comparando la
+        zona por trozos de modo que solo se recorren celda a celda los
+        trozos con algún cambio.
+        """
+        simbolos = self.simbolos
+        escribir_codigos = getattr(cinta, 'escribir_codigos', None)
+        if escribir_codigos is not None:
+            # Las celdas visitadas solo tienen símbolos del programa
+            escribir_codigos(origen + desde, bytes(buf[desde:hasta + 1]), simbolos)
+            return
+            
+        for inicio in range(desde, hasta + 1, BLOQUE_CINTA):
+            fin = min(inicio + BLOQUE_CINTA, hasta + 1)
+            if buf[inicio:fin] == original[inicio:fin]:
+                continue
+            for i in range(inicio, fin):
+                if buf[i] != original[i]:
+                    cinta.escribir(origen + i, simbolos[buf[i]])
+                    
+        # Las celdas visitadas amplían los límites de la cinta aunque no cambien
+        if origen + desde < cinta.posicion_inicio:
+            cinta.escribir(origen + desde, simbolos[buf[desde]])
+        if origen + hasta > cinta.posicion_fin:
+            cinta.escribir(origen + hasta, simbolos[buf[hasta]])
@@ -0,0 +1,131 @@
+"""
+Simulador de Máquina de Turing
+Archivo: simulacion_vectorizada.py
+Descripción: Simulación simultánea de muchas cadenas con NumPy
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo necesita este módulo
+    np = None
+
+from maquina_turing import MaquinaTuring
+
+# Celdas en blanco que se añaden a cada lado de la cinta al crearla
+MARGEN_INICIAL = 16
+
+def simular_vectorizado(config: Dict, cadenas: Sequence[str],
+                        max_pasos: Optional[int] = None) -> List[Tuple[Optional[bool], int, str]]:
+    """
+    Ejecuta la misma máquina sobre muchas cadenas a la vez.
+    
+    Todas las cadenas avanzan un paso en cada iteración: las cintas forman
+    una matriz (cadenas × celdas), y el estado y el cabezal de cada una son
+    vectores. Cada paso se resuelve con indexación avanzada sobre las tablas
+    del programa compilado, y las filas que terminan dejan de simularse.
+    La cinta se amplía por el lado necesario cuando algún cabezal llega al
+    borde. Cada fila deja de simularse también al agotar su máximo de
+    pasos.
+    
+    Args:
+        config: Diccionario con la definición de la máquina
+        cadenas: Cadenas de entrada
+        max_pasos: Máximo número de pasos por cadena; por defecto, la cota
+            demostrada por el análisis estático para cada cadena si la hay,
+            o 1000
+            
+    Returns:
+        Lista de tuplas (aceptada, pasos, estado final) en el mismo orden
+        que las cadenas de entrada; aceptada es None si se agotaron los
+        pasos sin que la ejecución terminara
+        
+    Raises:
+        ImportError: Si NumPy no está instalado
+    """
+    if np is None:
+        raise ImportError("La simulación vectorizada necesita NumPy")
+        
+    programa = MaquinaTuring.desde_configuracion(config).compilar()
+    m = programa.num_simbolos
+    siguiente = np.frombuffer(programa.siguiente, dtype=np.int32)
+    escritura = np.asarray(programa.escritura, dtype=np.int32)
+    movimiento = np.frombuffer(programa.movimiento, dtype=np.int8).astype(np.int64)
+    aceptacion = np.frombuffer(bytes(programa.aceptacion), dtype=np.bool_)
+    
+    total = len(cadenas)
+    cinta, origen = _crear_cintas(programa, cadenas)
+    estado = np.zeros(total, dtype=np.int32)
+    cabezal = np.full(total, origen, dtype=np.int64)
+    pasos = np.zeros(total, dtype=np.int64)
+    aceptada = np.zeros(total, dtype=np.bool_)
+    terminada = np.zeros(total, dtype=np.bool_)
+    limites = np.array([programa.limite_pasos(len(cadena), max_pasos) for cadena in cadenas],
+                       dtype=np.int64)
+    filas = np.arange(total)
+    
+    paso = 0
+    while filas.size:
+        # Las filas que han agotado sus pasos se quedan sin veredicto
+        if limites[filas].min() <= paso:
+            filas = filas[limites[filas] > paso]
+            if not filas.size:
+                break
+        posiciones = cabezal[filas]
+        k = estado[filas] * m + cinta[filas, posiciones]
+        nuevo = siguiente[k]
+        
+        # Sin transición: la fila rechaza sin ejecutar el paso
+        con_transicion = nuevo >= 0
+        if not con_transicion.all():
+            terminada[filas[~con_transicion]] = True
+            filas, posiciones, k, nuevo = (filas[con_transicion], posiciones[con_transicion],
+                                           k[con_transicion], nuevo[con_transicion])
+                                           
+        paso += 1
+        cinta[filas, posiciones] = escritura[k]
+        posiciones = posiciones + movimiento[k]
+        cabezal[filas] = posiciones
+        estado[filas] = nuevo
+        pasos[filas] = paso
+        
+        # Las filas que entran en un estado de aceptación terminan
+        terminan = aceptacion[nuevo]
+        if terminan.any():
+            aceptada[filas[terminan]] = True
+            terminada[filas[terminan]] = True
+            sigue = ~terminan
+            filas, posiciones = filas[sigue], posiciones[sigue]
+            
+        # Ampliar la cinta si algún cabezal activo ha llegado a un borde
+        if posiciones.size:
+            ancho = cinta.shape[1]
+            izquierda = ancho if posiciones.min() < 0 else 0
+            derecha = ancho if posiciones.max() >= ancho else 0
+            if izquierda or derecha:
+                cinta = np.pad(cinta, ((0, 0), (izquierda, derecha)))
+                cabezal += izquierda
+                
+    estados = programa.estados
+    return [(bool(a) if t else None, int(p), estados[q])
+            for a, t, p, q in zip(aceptada.tolist(), terminada.tolist(),
+                                  pasos.tolist(), estado.tolist())]
+
+def _crear_cintas(programa, cadenas: Sequence[str]):
+    """
+    Construye la matriz de cintas con las cadenas traducidas a códigos.
+    
+    Returns:
+        Tupla (matriz de cintas, columna de la posición 0 de la entrada)
+    """
+    ancho = max((len(cadena) for cadena in cadenas), default=0)
+    tipo = np.uint8 if programa.compacto else np.uint16
+    cinta = np.zeros((len(cadenas), ancho + 2 * MARGEN_INICIAL), dtype=tipo)
+    codigos = programa.codigo_simbolo
+    desconocido = programa.desconocido
+    for i, cadena in enumerate(cadenas):
+        if cadena:
+            cinta[i, MARGEN_INICIAL:MARGEN_INICIAL + len(cadena)] = [
+                codigos.get(simbolo, desconocido) for simbolo in cadena]
+    return cinta, MARGEN_INICIAL